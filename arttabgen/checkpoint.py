@@ -0,0 +1,101 @@
+"""Holds the Checkpoint dataclass and functions to persist the progress of a dataset generation.
+
+A checkpoint records how many tables are completely exported and the state of the random generators
+before the next table is generated, so an interrupted generation can be continued identically.
+
+Types:
+    Checkpoint
+Functions:
+    capture_checkpoint()
+    restore_random_state()
+    save_checkpoint()
+    load_checkpoint()
+"""
+import json
+import os
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+
+CHECKPOINT_FILE_NAME: str = "checkpoint.json"
+"""The name of the checkpoint file in the dataset directory."""
+
+
+@dataclass
+class Checkpoint:
+    """The progress of a dataset generation."""
+
+    num_completed_tables: int
+    """The number of tables, which are exported completely, counting from the first one."""
+    seed: int
+    """The seed the generation was started with."""
+    random_state: List[Any]
+    """The state of Python's random generator, see :func:`random.getstate`."""
+    numpy_random_state: List[Any]
+    """The state of NumPy's global random generator, see :func:`numpy.random.get_state`."""
+
+
+def capture_checkpoint(num_completed_tables: int, seed: int) -> Checkpoint:
+    """Capture the current state of the random generators.
+
+    Args:
+        num_completed_tables: The number of tables generated before the current state.
+        seed: The seed the generation was started with.
+
+    Returns:
+        A checkpoint to continue the generation with the next table.
+
+    """
+    version, internal_state, gauss_next = random.getstate()
+    name, keys, pos, has_gauss, cached_gaussian = np.random.get_state()
+
+    return Checkpoint(
+        num_completed_tables,
+        seed,
+        [version, list(internal_state), gauss_next],
+        [name, keys.tolist(), pos, has_gauss, cached_gaussian],
+    )
+
+
+def restore_random_state(checkpoint: Checkpoint) -> None:
+    """Restore the state of the random generators from a checkpoint.
+
+    Args:
+        checkpoint: The checkpoint to continue the generation from.
+
+    """
+    version, internal_state, gauss_next = checkpoint.random_state
+    random.setstate((version, tuple(internal_state), gauss_next))
+
+    name, keys, pos, has_gauss, cached_gaussian = checkpoint.numpy_random_state
+    np.random.set_state((name, np.array(keys, dtype=np.uint32), pos, has_gauss, cached_gaussian))
+
+
+def save_checkpoint(checkpoint: Checkpoint, checkpoint_file: Path) -> None:
+    """Save a checkpoint, replacing the previous one atomically.
+
+    Args:
+        checkpoint: The checkpoint to save.
+        checkpoint_file: The file to save the checkpoint to.
+
+    """
+    temporary_file: Path = checkpoint_file.with_suffix(".tmp")
+    temporary_file.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+    # A crash while saving leaves the previous checkpoint intact
+    os.replace(temporary_file, checkpoint_file)
+
+
+def load_checkpoint(checkpoint_file: Path) -> Checkpoint:
+    """Load a checkpoint.
+
+    Args:
+        checkpoint_file: The file the checkpoint was saved to.
+
+    Returns:
+        The loaded checkpoint.
+
+    """
+    return Checkpoint(**json.loads(checkpoint_file.read_text(encoding="utf-8")))
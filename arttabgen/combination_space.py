@@ -0,0 +1,162 @@
+"""Holds classes to address the *transformer* combinations of the ``COMBINATORICAL`` strategy by index.
+
+Types:
+    CombinationSpace
+    LazyPermutation
+Functions:
+    build_combination_space()
+"""
+from functools import reduce
+from typing import Dict, Iterator, List, Sequence, Union
+
+from arttabgen import config_handler
+from arttabgen.helper import derive_seed, dict_merge
+from arttabgen.types_.transformer_application_strategy import (
+    TransformerApplicationStrategy,
+)
+from arttabgen.types_.transformer_value_combination import TransformerValueCombination
+
+_MASK_64: int = (1 << 64) - 1
+
+
+class CombinationSpace:  # noqa: D101
+    def __init__(
+            self,
+            style_transformers: List[List[Union[str, int, float]]],
+            structure_transformers: List[List[Dict[str, Union[str, bool]]]],
+    ) -> None:
+        """The cartesian product of the values of all transformer parameters, addressable by index.
+
+        Combination k is decoded from k as a mixed-radix number, whose digits are the indices of the
+        parameters' values. The last parameter varies fastest, like in :func:`itertools.product`.
+
+        Args:
+            style_transformers: The directives of every value of each *style parameter*.
+            structure_transformers: The directives of every value of each *structure parameter*.
+
+        """
+        self.parameter_values: List[Sequence] = [*style_transformers, *structure_transformers]
+        self.number_of_style_parameters: int = len(style_transformers)
+        self.size: int = reduce(lambda size, values: size * len(values), self.parameter_values, 1)
+
+    def __len__(self) -> int:
+        """The number of combinations, use size if it may exceed ``sys.maxsize``."""  # noqa: D401
+        return self.size
+
+    def __getitem__(self, index: int) -> TransformerValueCombination:
+        """Decode a combination from its index.
+
+        Args:
+            index: The index of the combination.
+
+        Returns:
+            The combination.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(f"Combination index {index} is out of range")
+
+        combination: List = []
+
+        for values in reversed(self.parameter_values):
+            index, value_index = divmod(index, len(values))
+            combination.append(values[value_index])
+
+        combination.reverse()
+
+        return TransformerValueCombination(
+            combination[:self.number_of_style_parameters],
+            # A new dictionary, so combinations don't share their structure parameters
+            reduce(dict_merge, combination[self.number_of_style_parameters:], {}),
+        )
+
+    def __iter__(self) -> Iterator[TransformerValueCombination]:
+        """Iterate the combinations in the order of their indices."""
+        return (self[index] for index in range(self.size))
+
+
+class LazyPermutation:  # noqa: D101
+    def __init__(self, size: int, seed: int, rounds: int = 4) -> None:
+        """A seeded random permutation of ``range(size)``, which computes each element on access.
+
+        The permutation is a Feistel network over the smallest even number of bits covering size,
+        which is a bijection. Values beyond size are mapped again until they are in range (cycle walking),
+        so the permutation needs constant memory regardless of size.
+
+        Args:
+            size: The number of elements.
+            seed: The seed determining the permutation.
+            rounds: The number of Feistel rounds.
+
+        """
+        self.size: int = size
+        self.half_bits: int = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.half_mask: int = (1 << self.half_bits) - 1
+        self.round_keys: List[int] = [derive_seed(seed, round_index) for round_index in range(rounds)]
+
+    def __len__(self) -> int:
+        """The number of elements."""  # noqa: D401
+        return self.size
+
+    def __getitem__(self, index: int) -> int:
+        """Compute an element of the permutation.
+
+        Args:
+            index: The position of the element.
+
+        Returns:
+            The element, an integer in ``range(size)``.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(f"Permutation index {index} is out of range")
+
+        element: int = self._encrypt(index)
+
+        # The network's domain is less than four times size, so this takes few iterations
+        while element >= self.size:
+            element = self._encrypt(element)
+
+        return element
+
+    def _encrypt(self, value: int) -> int:
+        """Map a value of the Feistel network's domain to another one."""
+        left, right = value >> self.half_bits, value & self.half_mask
+
+        for round_key in self.round_keys:
+            left, right = right, left ^ (_mix(right ^ round_key) & self.half_mask)
+
+        return (left << self.half_bits) | right
+
+
+def build_combination_space(config: Dict) -> CombinationSpace:
+    """Build the transformer combinations of the ``COMBINATORICAL`` strategy.
+
+    Args:
+        config: A deserialized config containing transformer configurations.
+
+    Returns:
+        The combinations of all transformer parameter values.
+
+    See also:
+        | :ref:`Transformers`
+        | :ref:`Transformer application strategies`
+
+    """
+    return CombinationSpace(
+        config_handler.build_style_transformers(config, TransformerApplicationStrategy.COMBINATORICAL),
+        config_handler.build_structure_transformers(config, TransformerApplicationStrategy.COMBINATORICAL),
+    )
+
+
+def _mix(value: int) -> int:
+    """Scramble the bits of a 64 bit value with the SplitMix64 finalizer."""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64  # noqa: WPS432
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64  # noqa: WPS432
+    return value ^ (value >> 31)
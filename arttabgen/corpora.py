@@ -0,0 +1,173 @@
+"""Holds functions to load the NLTK corpora on first use, optionally from a compiled copy in a cache directory.
+
+Loading the corpora takes seconds and hundreds of MB, so neither NLTK nor the corpora are loaded
+before a text needs them.
+
+Types:
+    WordBlob
+Functions:
+    words()
+    noun_synset_names()
+    wordnet()
+"""
+import mmap
+import os
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence, Union, overload
+
+import numpy as np
+
+cache_dir: Optional[Path] = None
+"""The directory to keep the compiled corpora and data derived from them in, None to load them from NLTK."""
+
+
+class WordBlob(Sequence[str]):  # noqa: D101
+    def __init__(self, path: Path) -> None:
+        """Words stored in a file as one line each, which is mapped into memory instead of being read.
+
+        Only the offsets of the lines are kept in memory, a word is decoded when it is accessed.
+
+        Args:
+            path: The file holding the words.
+
+        """
+        self.blob: Union[mmap.mmap, bytes] = b""
+
+        if path.stat().st_size:
+            with open(path, "rb") as blob_file:
+                self.blob = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        line_ends: np.ndarray = np.flatnonzero(np.frombuffer(self.blob, dtype=np.uint8) == ord("\n"))
+        self.starts: np.ndarray = np.concatenate(([0], line_ends[:-1] + 1)).astype(np.int64)
+        self.stops: np.ndarray = line_ends
+
+    def __len__(self) -> int:
+        """The number of words."""  # noqa: D401
+        return len(self.stops)
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...  # noqa: WPS428
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[str]:
+        ...  # noqa: WPS428
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, Sequence[str]]:
+        """Decode a word or a slice of the words.
+
+        Args:
+            index: The index of the word or the slice of the words.
+
+        Returns:
+            The word, or a list of the words.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        """
+        if isinstance(index, slice):
+            return [self[word_index] for word_index in range(*index.indices(len(self)))]
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Word index {index} is out of range")
+
+        index %= len(self)
+
+        return self.blob[int(self.starts[index]):int(self.stops[index])].decode("utf-8")
+
+    @staticmethod
+    def write(path: Path, lines: Iterable[str]) -> None:
+        """Write words, so they can be loaded as a word blob, replacing any existing file atomically.
+
+        Args:
+            path: The file to write.
+            lines: The words, none of them containing a line break.
+
+        """
+        path.parent.mkdir(exist_ok=True, parents=True)
+        temporary_path: Path = path.with_name(f"{path.name}.{uuid.uuid4().hex}")
+        temporary_path.write_bytes("".join(f"{line}\n" for line in lines).encode("utf-8"))
+        os.replace(temporary_path, path)
+
+
+@lru_cache(maxsize=None)
+def words() -> Sequence[str]:
+    """Load the unique lowercase English words of the NLTK words corpus.
+
+    Returns:
+        The sorted words.
+
+    """
+    if cache_dir is not None and Path(cache_dir, "words.txt").is_file():
+        return WordBlob(Path(cache_dir, "words.txt"))
+
+    _ensure_nltk_resource("corpora/words", "words")
+
+    import nltk  # noqa: WPS433
+
+    sorted_words = sorted({word.lower() for word in nltk.corpus.words.words()})
+
+    if cache_dir is not None:
+        WordBlob.write(Path(cache_dir, "words.txt"), sorted_words)
+
+    return sorted_words
+
+
+@lru_cache(maxsize=None)
+def noun_synset_names() -> Sequence[str]:
+    """Load the names of all WordNet noun synsets, e.g. ``"dog.n.01"``.
+
+    Returns:
+        The names in the order of ``wordnet.all_synsets("n")``.
+
+    """
+    wordnet_corpus: Any = wordnet()
+    blob_path: Optional[Path] = None
+
+    if cache_dir is not None:
+        blob_path = Path(cache_dir, f"noun_synsets_wordnet-{wordnet_corpus.get_version()}.txt")
+
+        if blob_path.is_file():
+            return WordBlob(blob_path)
+
+    names = [synset.name() for synset in wordnet_corpus.all_synsets("n")]
+
+    if blob_path is not None:
+        WordBlob.write(blob_path, names)
+
+    return names
+
+
+@lru_cache(maxsize=None)
+def wordnet() -> Any:
+    """Get the NLTK WordNet corpus reader, downloading the corpus if it is missing.
+
+    Returns:
+        The corpus reader.
+
+    """
+    _ensure_nltk_resource("corpora/wordnet", "wordnet")
+    _ensure_nltk_resource("corpora/omw-1.4", "omw-1.4")
+
+    import nltk  # noqa: WPS433
+
+    return nltk.corpus.wordnet
+
+
+def _ensure_nltk_resource(resource_name: str, package: str) -> None:
+    """Download an NLTK package if its resource is missing.
+
+    Args:
+        resource_name: The name of the resource to find, e.g. ``"corpora/words"``.
+        package: The package holding the resource.
+
+    """
+    import nltk  # noqa: WPS433
+
+    try:
+        nltk.data.find(resource_name)
+    except LookupError:
+        nltk.download(package, quiet=True)
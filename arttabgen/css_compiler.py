@@ -0,0 +1,82 @@
+"""Holds functionality to compile the directives of *style transformers* into a minimal stylesheet.
+
+Every *style transformer* emits a rule of its own, most of them for the same selectors. The compiler merges
+the declarations of rules with equal selectors and drops overridden declarations, without changing which
+value applies to an element.
+
+Constants:
+    CSS_RULE_PATTERN
+Functions:
+    parse_css_declarations()
+    compile_stylesheet()
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+CSS_RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+"""Matches a single CSS rule, capturing its selectors and its declarations."""
+
+
+def parse_css_declarations(style_parameters: Iterable[Union[str, int, float]]) -> Iterator[Tuple[str, str, str]]:
+    """Split *style transformer* directives into single declarations.
+
+    Args:
+        style_parameters: The *style transformer* directives to split.
+
+    Yields:
+        Tuples of the normalized selectors, the property and the value of every declaration.
+
+    """
+    for directive in style_parameters:
+        for selectors, declarations in CSS_RULE_PATTERN.findall(str(directive)):
+            normalized_selectors: str = ", ".join(
+                selector.strip() for selector in selectors.split(",")
+            )
+
+            for declaration in declarations.split(";"):
+                css_property, _, value = declaration.partition(":")  # noqa: WPS110
+
+                if value.strip():
+                    yield normalized_selectors, css_property.strip().lower(), value.strip()
+
+
+def compile_stylesheet(style_parameters: Iterable[Union[str, int, float]]) -> str:
+    """Compile *style transformer* directives into a stylesheet with as few rules as possible.
+
+    Stylesheets are cached by their directives, as combinations repeat across the tables of a dataset.
+
+    Args:
+        style_parameters: The *style transformer* directives to compile.
+
+    Returns:
+        The stylesheet, one rule per line.
+
+    """
+    return _compile_stylesheet(tuple(map(str, style_parameters)))
+
+
+@lru_cache(maxsize=4096)
+def _compile_stylesheet(style_parameters: Tuple[str, ...]) -> str:
+    """Compile *style transformer* directives, see :func:`compile_stylesheet`."""
+    rules: List[Tuple[str, Dict[str, str]]] = []
+
+    for selectors, css_property, value in parse_css_declarations(style_parameters):  # noqa: WPS110
+        # A declaration may only move before rules that don't declare its property, so the cascade is unchanged.
+        # It is merged into the last rule with its selectors, unless a later rule declares the property.
+        for rule_selectors, declarations in reversed(rules):
+            if rule_selectors == selectors:
+                declarations.pop(css_property, None)
+                declarations[css_property] = value
+                break
+
+            if css_property in declarations:
+                rules.append((selectors, {css_property: value}))
+                break
+        else:
+            rules.append((selectors, {css_property: value}))
+
+    return "\n".join(
+        f"{selectors} {{{' '.join(f'{name}: {value};' for name, value in declarations.items())}}}"
+        for selectors, declarations in rules
+    )
@@ -1,23 +1,34 @@
 """Holds the DatasetGenerator class, which offers a complete dataset generation routine."""
 import csv
-import itertools
 import json
-import operator
-from functools import reduce
+import threading
 from pathlib import Path
-from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from arttabgen import config_handler
-from arttabgen.helper import Table, dict_merge
+from arttabgen.checkpoint import (
+    CHECKPOINT_FILE_NAME,
+    Checkpoint,
+    capture_checkpoint,
+    restore_random_state,
+    save_checkpoint,
+)
+from arttabgen.combination_space import CombinationSpace, LazyPermutation, build_combination_space
+from arttabgen.helper import Table
 from arttabgen.progress_printer import ProgressPrinter
 from arttabgen.table_exporter import TableExporter
 from arttabgen.table_generator import TableGenerator
+from arttabgen.transformer_sampler import TransformerSampler
 from arttabgen.types_.transformer_application_strategy import (
     TransformerApplicationStrategy,
 )
 from arttabgen.types_.transformer_value_combination import TransformerValueCombination
 
 
+class GenerationAbortedError(Exception):
+    """Raised when the generation of a dataset is aborted by its abort event."""
+
+
 class DatasetGenerator:
     def __init__(
             self,
@@ -26,6 +37,15 @@ class DatasetGenerator:
             export_used_keywords_and_units: bool,
             number_of_tables: int,
             transformer_application_strategy: TransformerApplicationStrategy,
+            checkpoint_interval: int = 0,
+            resume_checkpoint: Optional[Checkpoint] = None,
+            table_range: Optional[Tuple[int, int]] = None,
+            replay_skipped_tables: bool = False,
+            per_table_seeds: bool = False,
+            shuffle_combinations: bool = False,
+            number_of_combinations: Optional[int] = None,
+            close_exporter: bool = True,
+            abort_event: Optional[threading.Event] = None,
     ) -> None:
         """Offers a complete dataset generation routine.
 
@@ -37,6 +57,24 @@ class DatasetGenerator:
             number_of_tables: The number of tables to generate per dataset.
                                 This can be overriden if transformer_application_strategy is COMBINATORICAL.
             transformer_application_strategy: An enum controlling how transformers are applied during table generators.
+            checkpoint_interval: The number of tables after which the progress is checkpointed, 0 disables checkpoints.
+            resume_checkpoint: A checkpoint of an interrupted generation of the dataset to continue from.
+            table_range: The (start, stop) 0-based indices of the dataset's tables to generate, if they are
+                         split between several generators. This overrides number_of_tables.
+            replay_skipped_tables: Whether to generate the tables before table_range without exporting them,
+                                   so the random generators reach the state a generation of all tables
+                                   would have at the start of the range.
+            per_table_seeds: Whether to generate every table from its own random stream derived from its index,
+                             see :meth:`TableGenerator.table_at`. No tables need to be replayed then.
+            shuffle_combinations: Whether to visit the ``COMBINATORICAL`` combinations in a random order
+                                  determined by the table generator's seed, instead of the lexicographic one.
+            number_of_combinations: The number of ``COMBINATORICAL`` combinations to generate tables for,
+                                    None for all of them. With shuffle_combinations, they are a uniform sample.
+            close_exporter: Whether to close the table exporter after the tables are exported. Otherwise only
+                            its current part is finished, so it can export further tables with its browsers,
+                            see :meth:`TableExporter.start_part`.
+            abort_event: An event, after which no further table is exported, e.g. because another worker took
+                         over the tables. The exporter is left to be discarded by the caller then.
 
         """
         self.table_generator: TableGenerator = table_generator
@@ -46,16 +84,39 @@ class DatasetGenerator:
         self.number_of_generated_tables: int = 0
         self.transformer_application_strategy = transformer_application_strategy
         self.config = config_handler.config_handler.config
-        self.transformers, number_of_tables = self.build_transformer_combinations()
+        self.combination_space: Optional[CombinationSpace] = None
+        self.combination_order: Sequence[int] = range(0)
+
+        if self.transformer_application_strategy == TransformerApplicationStrategy.COMBINATORICAL:
+            # Combinations are decoded from their index, so neither ranges nor a shuffled order walk the product
+            self.combination_space = build_combination_space(self.config)
+            self.combination_order = range(self.combination_space.size)
+
+            if shuffle_combinations:
+                self.combination_order = LazyPermutation(self.combination_space.size, self.table_generator.seed)
+
+            number_of_tables = min(number_of_combinations or self.combination_space.size, self.combination_space.size)
+        else:
+            self.transformers, number_of_tables = self.build_transformer_combinations()
 
         number_of_tables = (
                 number_of_tables or config_handler.config_handler.config["number_of_tables"]
         )
+        self.first_table_index: int = 0
+        self.stop_table_index: int = number_of_tables
+
+        if table_range:
+            self.first_table_index, self.stop_table_index = table_range
+            self.number_of_tables = self.stop_table_index - self.first_table_index
+            number_of_tables = self.number_of_tables
+            self.table_exporter.skip_tables(self.first_table_index)
+
+        if self.combination_space is not None:
+            self.transformers = self._iterate_combinations(self.first_table_index)
         # Per table, export the specified formats and generated and gt csv.
         # The remaining value (1) of the constant term (3) is an implementation detail of the export functionality.
-        progress_total = number_of_tables * (
-                len(self.table_exporter.output_formats) + 2
-        )
+        self.progress_per_table: int = len(self.table_exporter.output_formats) + 2
+        progress_total = number_of_tables * self.progress_per_table
 
         progress_printer = ProgressPrinter(
             progress_total,
@@ -67,6 +128,16 @@ class DatasetGenerator:
 
         self.table_exporter.progress_printer = progress_printer
 
+        self.checkpoint_interval: int = checkpoint_interval
+        self.checkpoint_file: Path = Path(self.table_exporter.dataset_path, CHECKPOINT_FILE_NAME)
+        # Checkpoints are only saved once all of their tables are exported
+        self.pending_checkpoints: List[Checkpoint] = []
+        self.resume_checkpoint: Optional[Checkpoint] = resume_checkpoint
+        self.replay_skipped_tables: bool = replay_skipped_tables
+        self.per_table_seeds: bool = per_table_seeds
+        self.close_exporter: bool = close_exporter
+        self.abort_event: Optional[threading.Event] = abort_event
+
     def build_transformer_combinations(
             self,
     ) -> Tuple[Iterator[TransformerValueCombination], Optional[int]]:
@@ -94,12 +165,28 @@ class DatasetGenerator:
         return VARIATION_BUILDERS[self.transformer_application_strategy](self.config)
 
     def generate_dataset(self) -> None:
-        """Generate and export a complete dataset."""
+        """Generate and export a complete dataset.
+
+        Raises:
+            GenerationAbortedError: If the abort event is set before all tables are exported.
+
+        """
 
         generate_tables_with_gt: Iterator[
             Tuple[Table, Table, int]
         ] = self.table_generator.generate_tables_with_gt()
 
+        # A checkpoint's random state already includes the skipped tables
+        if self.resume_checkpoint:
+            self._resume(self.resume_checkpoint)
+        elif self.replay_skipped_tables and not self.per_table_seeds:
+            self._replay_skipped_tables(generate_tables_with_gt)
+
+        if self.per_table_seeds:
+            generate_tables_with_gt = self.table_generator.generate_tables_from(
+                self.first_table_index + self.number_of_generated_tables
+            )
+
         for table, gt, mode in generate_tables_with_gt:
             # No more tables to generate!
 
@@ -110,6 +197,11 @@ class DatasetGenerator:
             ):
                 break
 
+            if self.abort_event is not None and self.abort_event.is_set():
+                raise GenerationAbortedError(
+                    f"Aborted after {self.number_of_generated_tables} of {self.number_of_tables} tables"
+                )
+
             try:
                 transformer_value_combination = next(self.transformers)
                 self.number_of_generated_tables += 1
@@ -123,6 +215,14 @@ class DatasetGenerator:
             except StopIteration:
                 break
 
+            if self.checkpoint_interval and self.number_of_generated_tables % self.checkpoint_interval == 0:
+                # The random state is the one the next table will be generated with
+                self.pending_checkpoints.append(
+                    capture_checkpoint(self.number_of_generated_tables, self.table_generator.seed)
+                )
+
+            self._save_completed_checkpoint()
+
         Path(self.table_exporter.dataset_path, "seed.txt").write_text(
             str(self.table_generator.seed),
             encoding="utf-8",
@@ -137,12 +237,80 @@ class DatasetGenerator:
                 json.dumps(self.table_generator.units),
             )
 
-        self.table_exporter.thread_pool.shutdown(wait=True)
+        try:
+            if self.close_exporter:
+                self.table_exporter.close()
+            else:
+                self.table_exporter.finish_part()
+        finally:
+            self._save_completed_checkpoint()
 
-        # Make sure errors in concurrent calls are communicated back to the main thread
+    def _resume(self, checkpoint: Checkpoint) -> None:
+        """Continue an interrupted generation after the tables completed before a checkpoint.
 
-        for future in self.table_exporter.futures:
-            future.result()
+        Args:
+            checkpoint: The checkpoint to continue from.
+
+        """
+        restore_random_state(checkpoint)
+
+        self.number_of_generated_tables = checkpoint.num_completed_tables
+        self.table_exporter.skip_tables(self.first_table_index + checkpoint.num_completed_tables)
+        self.table_exporter.progress_printer.current = (
+                checkpoint.num_completed_tables * self.progress_per_table
+        )
+
+        # Selective combinations are drawn from the restored random state, combinatorical ones need to be skipped
+        if self.combination_space is not None:
+            self.transformers = self._iterate_combinations(
+                self.first_table_index + checkpoint.num_completed_tables
+            )
+
+    def _replay_skipped_tables(
+            self, generate_tables_with_gt: Iterator[Tuple[Table, Table, int]]
+    ) -> None:
+        """Generate the tables before the table range without exporting them.
+
+        The random values are drawn in the same order as by :meth:`generate_dataset`.
+
+        Args:
+            generate_tables_with_gt: The generator of the tables to export afterwards.
+
+        """
+        for _ in range(self.first_table_index):
+            next(generate_tables_with_gt)
+
+            # Combinatorical combinations are not random, they are skipped by slicing
+            if self.transformer_application_strategy == TransformerApplicationStrategy.SELECTIVE:
+                next(self.transformers)
+
+    def _iterate_combinations(self, start: int) -> Iterator[TransformerValueCombination]:
+        """Iterate the ``COMBINATORICAL`` combinations of the tables from an index to the end of the table range.
+
+        Args:
+            start: The 0-based index of the first table.
+
+        Returns:
+            The combinations in the order of the tables.
+
+        """
+        return (
+            self.combination_space[self.combination_order[table_index]]
+            for table_index in range(start, self.stop_table_index)
+        )
+
+    def _save_completed_checkpoint(self) -> None:
+        """Save the latest pending checkpoint, whose tables are all exported."""
+        num_completed_tables: int = self.table_exporter.num_completed_tables - self.first_table_index
+        completed_checkpoints: List[Checkpoint] = [
+            checkpoint
+            for checkpoint in self.pending_checkpoints
+            if checkpoint.num_completed_tables <= num_completed_tables
+        ]
+
+        if completed_checkpoints:
+            save_checkpoint(completed_checkpoints[-1], self.checkpoint_file)
+            self.pending_checkpoints = self.pending_checkpoints[len(completed_checkpoints):]
 
 
 def _build_transformer_combinations_selective(
@@ -168,24 +336,11 @@ def _build_transformer_combinations_selective(
     """
 
     def _inner() -> Iterator[TransformerValueCombination]:
-        while True:
-            style_transformers: List[
-                Union[str, int, float]
-            ] = config_handler.build_style_transformers(
-                config,
-                TransformerApplicationStrategy.SELECTIVE,
-            )
-            structure_transformers: Dict[
-                str, Union[str, bool]
-            ] = config_handler.build_structure_transformers(
-                config,
-                TransformerApplicationStrategy.SELECTIVE,
-            )
+        # The config is compiled once, drawing a combination per table only picks values
+        transformer_sampler = TransformerSampler(config)
 
-            yield TransformerValueCombination(
-                style_transformers,
-                structure_transformers,
-            )
+        while True:
+            yield transformer_sampler.sample()
 
     return _inner(), None
 
@@ -210,32 +365,9 @@ def _build_transformer_combinations_combinatorical(
         | :mod:`arttabgen.types_.transformer_application_strategy`
         | :mod:`arttabgen.types_.transformer_value_combination`
     """
-    style_transformers: List[
-        List[Union[str, int, float]]
-    ] = config_handler.build_style_transformers(
-        config, TransformerApplicationStrategy.COMBINATORICAL
-    )
-    structure_transformers: List[
-        Dict[str, Union[str, bool]]
-    ] = config_handler.build_structure_transformers(
-        config,
-        TransformerApplicationStrategy.COMBINATORICAL,
-    )
-
-    style_transformers.extend(structure_transformers)
-    transformer_combinations = itertools.product(*style_transformers)
-    number_of_tables = reduce(operator.mul, map(len, style_transformers), 1)
-
-    return (
-        (
-            TransformerValueCombination(
-                combination[:-2],
-                reduce(dict_merge, combination[-2:]),
-            )
-            for combination in transformer_combinations
-        ),
-        number_of_tables,
-    )
+    combination_space: CombinationSpace = build_combination_space(config)
+
+    return iter(combination_space), combination_space.size
 
 
 VARIATION_BUILDERS: Dict[
@@ -25,8 +25,11 @@ Functions:
     convert_keys_to_int()
     validate_file_path()
     dict_merge()
+    derive_seed()
+    split_table_range()
 """
 
+import hashlib
 import random
 import string
 from pathlib import Path
@@ -43,12 +46,7 @@ from typing import (
     Union,
 )
 
-import nltk
-
-try:
-    nltk.data.find("corpus/words")
-except LookupError:
-    nltk.download("words", quiet=True)
+from arttabgen import corpora
 
 Keyword = List[str]
 """Represents a keyword (list of synonyms)."""
@@ -88,11 +86,8 @@ ALPHABET: List[str] = list(string.ascii_lowercase)
 
 """:meta hide-value:"""
 
-WORDS = sorted(
-    {w.lower() for w in nltk.corpus.words.words()},
-)
-
-"""A list of unique English words
+WORDS: Sequence[str]
+"""A sorted list of unique English words, which is loaded on first access, see :func:`arttabgen.corpora.words`.
 
 :meta hide-value:
 """
@@ -401,3 +396,62 @@ def dict_merge(a: Dict, b: Dict) -> Dict:  # noqa: VNE001
     """
     a.update(b)
     return a
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """Derive an independent seed from a base seed, e.g. for a worker or a table.
+
+    The derived seed is stable across Python versions and platforms, unlike ``hash``.
+
+    Args:
+        seed: The base seed.
+        index: The index of what the derived seed is for.
+
+    Returns:
+        A 64 bit seed.
+
+    """
+    digest: bytes = hashlib.sha256(f"{seed}:{index}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def split_table_range(number_of_tables: int, number_of_parts: int) -> List[Tuple[int, int]]:
+    """Split the tables of a dataset into contiguous ranges of nearly equal size.
+
+    Args:
+        number_of_tables: The number of tables to split.
+        number_of_parts: The number of ranges to split the tables into.
+
+    Returns:
+        A (start, stop) pair of 0-based table indices per range, stop being exclusive.
+
+    """
+    part_size, remainder = divmod(number_of_tables, number_of_parts)
+    table_ranges: List[Tuple[int, int]] = []
+    start: int = 0
+
+    for part in range(number_of_parts):
+        stop: int = start + part_size + (1 if part < remainder else 0)
+        table_ranges.append((start, stop))
+        start = stop
+
+    return table_ranges
+
+
+def __getattr__(name: str) -> Any:
+    """Load the lazily loaded module attributes, i.e. :data:`WORDS`.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The attribute's value.
+
+    Raises:
+        AttributeError: If the module has no such attribute.
+
+    """
+    if name == "WORDS":
+        return corpora.words()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,9 +4,10 @@ Functions:
         table_to_html()
 """
 
-import pandas as pd
-from pandas import DataFrame
+from itertools import zip_longest
+from typing import Any, List, Optional, Sequence
 
+from arttabgen.css_compiler import compile_stylesheet
 from arttabgen.helper import Table
 from arttabgen.types_.transformer_value_combination import TransformerValueCombination
 
@@ -32,16 +33,43 @@ HTML_SKELETON: str = """
 </html>
 """
 
+HTML_LINKED_SKELETON: str = """
+<!DOCTYPE html>
+<html>
+    <head>
+        <meta charset="UTF-8">
+        <title>ArtTabGen Table</title>
+        <link rel="stylesheet" href="{stylesheet_href}">
+    </head>
+    <body style="background: white">
+        <br>
+        <br>
+        <br>
+        {table}
+        <br>
+        <br>
+        <br>
+    </body>
+</html>
+"""
+"""Like :data:`HTML_SKELETON`, but linking to a stylesheet file instead of embedding the styles."""
+
+_CONTROL_CHARACTER_ESCAPES = str.maketrans({"\t": r"\t", "\r": r"\r", "\n": r"\n"})
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
 
 def table_to_html(
         table: Table,
         transformers: TransformerValueCombination,
+        stylesheet_href: Optional[str] = None,
 ) -> str:
     """Build an HTML representation of the passed table data.
 
     Args:
         table: The table data to use
         transformers: The *transformers* to apply.
+        stylesheet_href: The URL of a file holding the compiled styles of the *style transformers*
+                         to link to, None to embed the styles.
 
     Returns:
         The HTML representation of the passed table data.
@@ -49,7 +77,6 @@ def table_to_html(
     """
     style_transformers = transformers.style_parameters
     structure_transformers = transformers.structure_parameters
-    df_table: DataFrame = pd.DataFrame(table)
 
     table_orientation = "horizontal"
     has_header = False
@@ -60,10 +87,61 @@ def table_to_html(
     if "table-orientation" in structure_transformers:
         table_orientation = structure_transformers["table-orientation"]
 
+    rows: Sequence[Sequence[Any]] = table
+    number_of_columns: int = max(map(len, table), default=0)
+
     if table_orientation == "vertical":
-        df_table = df_table.transpose()
+        rows = list(zip_longest(*table))
+        number_of_columns = len(table)
+
+    if stylesheet_href is not None:
+        return HTML_LINKED_SKELETON.format(
+            table=_build_html_table(rows, number_of_columns, has_header),
+            stylesheet_href=stylesheet_href,
+        )
 
     return HTML_SKELETON.format(
-        table=df_table.to_html(header=has_header, index=False),
-        styles="\n".join(style_transformers),
+        table=_build_html_table(rows, number_of_columns, has_header),
+        styles=compile_stylesheet(style_transformers),
     )
+
+
+def _build_html_table(rows: Sequence[Sequence[Any]], number_of_columns: int, has_header: bool) -> str:
+    """Build the same markup as ``pandas.DataFrame(rows).to_html(header=has_header, index=False)``.
+
+    Args:
+        rows: The cells of the table by row.
+        number_of_columns: The number of columns of the table.
+        has_header: Whether to add a header with the column numbers.
+
+    Returns:
+        The HTML table.
+
+    """
+    lines: List[str] = ['<table border="1" class="dataframe">']
+
+    if has_header:
+        lines.append("  <thead>")
+        lines.append('    <tr style="text-align: right;">')
+        lines.extend(f"      <th>{column}</th>" for column in range(number_of_columns))
+        lines.append("    </tr>")
+        lines.append("  </thead>")
+
+    lines.append("  <tbody>")
+
+    for row in rows:
+        lines.append("    <tr>")
+        lines.extend(f"      <td>{_format_cell(cell)}</td>" for cell in row)
+        # Missing cells of ragged tables are shown as None, like pandas does for horizontal tables
+        lines.extend("      <td>None</td>" for _ in range(number_of_columns - len(row)))
+        lines.append("    </tr>")
+
+    lines.append("  </tbody>")
+    lines.append("</table>")
+
+    return "\n".join(lines)
+
+
+def _format_cell(cell: Any) -> str:
+    """Format a cell like pandas, which escapes control characters, strips whitespace and escapes HTML."""
+    return str(cell).translate(_CONTROL_CHARACTER_ESCAPES).strip().translate(_HTML_ESCAPES)
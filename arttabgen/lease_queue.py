@@ -0,0 +1,252 @@
+"""Holds the LeaseQueue class, which distributes ranges of a dataset's tables over a shared directory.
+
+Every range is a file, which moves from ``pending`` over ``leased`` to ``done``. Moving a file is an atomic
+rename, so exactly one worker claims a range, without any other coordination than a shared filesystem.
+
+LEASE_STATES: The states of a range.
+RELEASE_MARKER: Marks the file name of a range being released by a worker.
+"""
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+LEASE_STATES: Tuple[str, ...] = ("pending", "leased", "done")
+"""The states of a range, each one a directory of the lease directory."""
+
+RELEASE_MARKER: str = ".releasing-"
+"""Separates the name of a range's file from the releasing worker's id, while the range is taken aside."""
+
+
+class LeaseQueue:  # noqa: D101
+    def __init__(
+            self,
+            lease_dir: Path,
+            lease_timeout: float,
+            poll_interval: float = 5.0,
+    ) -> None:
+        """Offers claiming and completing ranges of a dataset's tables, shared between processes and machines.
+
+        A leased range, which is not renewed within lease_timeout seconds, is considered abandoned by a
+        crashed worker and becomes pending again.
+
+        Args:
+            lease_dir: The directory to keep the ranges in.
+            lease_timeout: The number of seconds after which a lease expires.
+            poll_interval: The number of seconds to wait before checking for claimable ranges again,
+                           while other workers hold the remaining leases.
+
+        """
+        self.lease_dir: Path = lease_dir
+        self.lease_timeout: float = lease_timeout
+        self.poll_interval: float = poll_interval
+
+    def initialize(self, number_of_tables: int, range_size: int) -> None:
+        """Split the tables into pending ranges, unless another worker already did.
+
+        Every range holds range_size tables, except for the last one.
+
+        Args:
+            number_of_tables: The number of tables of the dataset.
+            range_size: The number of tables per range.
+
+        Raises:
+            ValueError: If range_size is smaller than 1.
+
+        """
+        if range_size < 1:
+            raise ValueError(f"A range needs to contain at least one table, got {range_size}")
+
+        if self.lease_dir.exists():
+            return
+
+        # The ranges are prepared aside and published with a single rename, which only one worker wins
+        temporary_dir: Path = self.lease_dir.with_name(f"{self.lease_dir.name}.{uuid.uuid4().hex}")
+
+        for state in LEASE_STATES:
+            Path(temporary_dir, state).mkdir(parents=True)
+
+        for start in range(0, number_of_tables, range_size):
+            Path(
+                temporary_dir, "pending", _range_file_name(start, min(start + range_size, number_of_tables))
+            ).touch()
+
+        try:
+            os.rename(temporary_dir, self.lease_dir)
+        except OSError:
+            shutil.rmtree(temporary_dir)
+
+            if not self.lease_dir.exists():
+                raise
+
+    def claim(self) -> Optional[Tuple[int, int]]:
+        """Claim a pending range, waiting while all remaining ranges are leased by other workers.
+
+        Returns:
+            The (start, stop) 0-based indices of the claimed range's tables,
+            or None if all ranges are done.
+
+        """
+        while True:  # noqa: WPS457
+            self._release_expired_leases()
+
+            for range_file_name in self._list("pending"):
+                pending_file: Path = Path(self.lease_dir, "pending", range_file_name)
+
+                try:
+                    # The modification time is the lease's start, rename keeps it
+                    os.utime(pending_file)
+                    os.rename(pending_file, Path(self.lease_dir, "leased", range_file_name))
+                except FileNotFoundError:
+                    # Claimed by another worker in the meantime
+                    continue
+
+                return _parse_range_file_name(range_file_name)
+
+            if not self._list("leased"):
+                return None
+
+            time.sleep(self.poll_interval)
+
+    def renew(self, table_range: Tuple[int, int]) -> bool:
+        """Renew the lease of a claimed range, so it does not expire.
+
+        A lease taken aside by a worker releasing it is renewed and put back, so the release is abandoned.
+
+        Args:
+            table_range: The claimed range.
+
+        Returns:
+            Whether the range is still leased. If its lease expired, it was released to be generated
+            again by another worker.
+
+        """
+        range_file_name: str = _range_file_name(*table_range)
+        leased_file: Path = Path(self.lease_dir, "leased", range_file_name)
+
+        try:
+            os.utime(leased_file)
+        except FileNotFoundError:
+            pass
+        else:
+            return True
+
+        for file_name in self._list("leased"):
+            if not file_name.startswith(f"{range_file_name}{RELEASE_MARKER}"):
+                continue
+
+            releasing_file: Path = Path(self.lease_dir, "leased", file_name)
+
+            try:
+                os.utime(releasing_file)
+                os.rename(releasing_file, leased_file)
+            except FileNotFoundError:
+                # Released or put back by the releasing worker in the meantime
+                continue
+
+            return True
+
+        return leased_file.exists()
+
+    @contextmanager
+    def keep_alive(self, table_range: Tuple[int, int]) -> Iterator[threading.Event]:
+        """Renew the lease of a claimed range in the background while the context is active.
+
+        Args:
+            table_range: The claimed range.
+
+        Yields:
+            An event, which is set once the lease is found lost. The range is then generated again by another
+            worker, so the worker should stop exporting it.
+
+        """
+        stopped = threading.Event()
+        lease_lost = threading.Event()
+
+        def renew_periodically() -> None:
+            while not stopped.wait(self.lease_timeout / 3):
+                if not self.renew(table_range):
+                    lease_lost.set()
+                    return
+
+        renewer = threading.Thread(target=renew_periodically, daemon=True)
+        renewer.start()
+
+        try:
+            yield lease_lost
+        finally:
+            stopped.set()
+            renewer.join()
+
+    def complete(self, table_range: Tuple[int, int]) -> bool:
+        """Record a claimed range as done, unless its lease was lost.
+
+        Args:
+            table_range: The claimed range.
+
+        Returns:
+            Whether the range was still leased. If its lease expired, it was released to be generated
+            again by another worker, which completes it instead.
+
+        """
+        range_file_name: str = _range_file_name(*table_range)
+
+        try:
+            os.rename(
+                Path(self.lease_dir, "leased", range_file_name),
+                Path(self.lease_dir, "done", range_file_name),
+            )
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def _release_expired_leases(self) -> None:
+        """Make the ranges of expired leases pending again.
+
+        A range is taken aside under a name of its own before its lease is checked again, so a renewal
+        between the first check and the release keeps the lease. Ranges left aside by a crashed worker
+        are released, too.
+
+        """
+        expiry: float = time.time() - self.lease_timeout
+
+        for file_name in os.listdir(Path(self.lease_dir, "leased")):
+            leased_file: Path = Path(self.lease_dir, "leased", file_name)
+            range_file_name: str = file_name.split(RELEASE_MARKER)[0]
+            releasing_file: Path = Path(
+                self.lease_dir, "leased", f"{range_file_name}{RELEASE_MARKER}{uuid.uuid4().hex}"
+            )
+
+            try:
+                if leased_file.stat().st_mtime >= expiry:
+                    continue
+
+                os.rename(leased_file, releasing_file)
+
+                if releasing_file.stat().st_mtime < expiry:
+                    os.rename(releasing_file, Path(self.lease_dir, "pending", range_file_name))
+                else:
+                    os.rename(releasing_file, Path(self.lease_dir, "leased", range_file_name))
+            except FileNotFoundError:
+                # Completed or released by another worker in the meantime
+                continue
+
+    def _list(self, state: str) -> List[str]:
+        """List the ranges in a state, in the order of their tables."""
+        return sorted(os.listdir(Path(self.lease_dir, state)))
+
+
+def _range_file_name(start: int, stop: int) -> str:
+    """Name the file of a range, so the names sort in the order of the tables."""
+    return f"tables_{start:012d}-{stop:012d}"
+
+
+def _parse_range_file_name(range_file_name: str) -> Tuple[int, int]:
+    """Parse a range from the name of its file."""
+    start, stop = range_file_name[len("tables_"):].split("-")
+    return int(start), int(stop)
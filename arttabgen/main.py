@@ -5,8 +5,10 @@ import datetime
 import os
 import random
 import sys
+import threading
 import warnings
-from typing import Callable, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
 
 warnings.filterwarnings("ignore")
 
@@ -17,10 +19,23 @@ sys.path.append(os.path.abspath(os.path.join(".", "libs", "wkhtmltox", "bin")))
 import shutil
 from pathlib import Path
 
-from arttabgen import config_handler
-from arttabgen.dataset_generator import DatasetGenerator
-from arttabgen.helper import validate_file_path
-from arttabgen.table_exporter import TableExporter
+import numpy as np
+
+from arttabgen import config_handler, corpora
+from arttabgen.checkpoint import CHECKPOINT_FILE_NAME, Checkpoint, load_checkpoint
+from arttabgen.combination_space import build_combination_space
+from arttabgen.dataset_generator import DatasetGenerator, GenerationAbortedError
+from arttabgen.helper import derive_seed, split_table_range
+from arttabgen.lease_queue import LeaseQueue
+from arttabgen.output_writer import OUTPUT_MODES
+from arttabgen.table_data_writer import TABLE_DATA_FORMATS
+from arttabgen.table_exporter import (
+    HTML_STYLESHEET_MODES,
+    IMAGE_BACKENDS,
+    PDF_BACKENDS,
+    TableExporter,
+    browser_output_formats,
+)
 from arttabgen.table_generator import TableGenerator
 from arttabgen.types_.transformer_application_strategy import (
     TransformerApplicationStrategy,
@@ -73,7 +88,6 @@ parser.add_argument(
     "--wkhtmltopdf_path",
     default=shutil.which("wkhtmltopdf") or os.path.abspath(
         os.path.join(".", "libs", "wkhtmltox", "bin", "wkhtmltopdf.exe")),
-    type=validate_file_path,
     help="The path to the wkhtmltopdf.exe to use. Use this if the executable is not on the "
          "PATH or in the libs/ directory",
 )
@@ -82,7 +96,6 @@ parser.add_argument(
     "--geckodriver_path",
     default=shutil.which("geckodriver") or os.path.abspath(
         os.path.join(".", "libs", "firefoxdriver", "geckodriver.exe")),
-    type=validate_file_path,
     help="The path to the firefoxdriver executable (geckodriver.exe) to use. Use this if the executable is "
          "not on the PATH or in the libs/ directory",
 )
@@ -106,12 +119,275 @@ parser.add_argument(
     default=True,
     help="Run exports concurrently or sequentially",
 )
+parser.add_argument(
+    "--number_of_webdrivers",
+    type=int,
+    default=1,
+    help="Number of headless browsers rendering images in parallel during the export",
+)
+parser.add_argument(
+    "--image_backend",
+    default="browser",
+    choices=IMAGE_BACKENDS,
+    help="Render images in a headless browser or draw them directly with Pillow",
+)
+parser.add_argument(
+    "--pdf_batch_size",
+    type=int,
+    default=1,
+    help="Number of consecutive tables rendered into one multi-page PDF by a single wkhtmltopdf run, "
+    "requires the wkhtmltopdf PDF backend",
+)
+parser.add_argument(
+    "--pdf_backend",
+    default="wkhtmltopdf",
+    choices=PDF_BACKENDS,
+    help="Export PDFs with wkhtmltopdf or print them from the headless browser rendering the images",
+)
+parser.add_argument(
+    "--html_stylesheet_mode",
+    default="inline",
+    choices=HTML_STYLESHEET_MODES,
+    help="Embed the styles into every exported HTML file or link to a stylesheet file shared by equal styles",
+)
+parser.add_argument(
+    "--output_mode",
+    default="directory",
+    choices=OUTPUT_MODES,
+    help="Store every exported file separately or stream them into rolling tar shards",
+)
+parser.add_argument(
+    "--tables_per_shard",
+    type=int,
+    default=10000,
+    help="Maximum number of tables per tar shard",
+)
+parser.add_argument(
+    "--max_shard_bytes",
+    type=int,
+    help="Size in bytes after which a tar shard is closed, regardless of its number of tables",
+)
+parser.add_argument(
+    "--table_data_format",
+    default="csv",
+    choices=TABLE_DATA_FORMATS,
+    help="Export the generated and ground truth table data as a CSV per table or into one Parquet dataset",
+)
+parser.add_argument(
+    "--tables_per_row_group",
+    type=int,
+    default=1000,
+    help="Number of tables per row group of the Parquet dataset",
+)
+parser.add_argument(
+    "--max_pending_exports",
+    type=int,
+    default=100,
+    help="Number of tables whose concurrent exports may be pending before table generation waits",
+)
+parser.add_argument(
+    "--checkpoint_interval",
+    type=int,
+    default=0,
+    help="Number of tables after which the progress is checkpointed to allow resuming (0 disables checkpoints)",
+)
+parser.add_argument(
+    "--resume",
+    action=argparse.BooleanOptionalAction,
+    default=False,
+    help="Continue an interrupted generation of the dataset from its last checkpoint",
+)
+parser.add_argument(
+    "--workers",
+    type=int,
+    default=1,
+    help="Number of processes generating disjoint ranges of the tables in parallel",
+)
+parser.add_argument(
+    "--shard_index",
+    type=int,
+    default=0,
+    help="Index of the slice of the dataset's tables to generate, e.g. on one of several nodes; "
+    "without --per_table_seeds the tables before the slice are generated too, so shards don't scale",
+)
+parser.add_argument(
+    "--shard_count",
+    type=int,
+    default=1,
+    help="Number of slices the dataset's tables are split into, use --per_table_seeds for shards that scale",
+)
+parser.add_argument(
+    "--per_table_seeds",
+    action=argparse.BooleanOptionalAction,
+    default=False,
+    help="Generate every table from its own seed derived from the dataset's seed and the table's index",
+)
+parser.add_argument(
+    "--shuffle_combinations",
+    action=argparse.BooleanOptionalAction,
+    default=False,
+    help="Visit the combinations of the COMBINATORICAL strategy in a random order determined by the seed",
+)
+parser.add_argument(
+    "--number_of_combinations",
+    type=int,
+    default=None,
+    help="Number of combinations of the COMBINATORICAL strategy to generate tables for, "
+    "a uniform sample of them with --shuffle_combinations (default: all)",
+)
+parser.add_argument(
+    "--cache_dir",
+    help="Directory to keep compiled NLTK corpora and data derived from them in across generations, "
+    "e.g. the semantic neighbours of words (default: recompute it for every generation)",
+)
+parser.add_argument(
+    "--lease_range_size",
+    type=int,
+    default=0,
+    help="Number of tables per range claimed from the dataset's lease directory, "
+    "so workers on several nodes can drain one dataset (0 disables leases)",
+)
+parser.add_argument(
+    "--lease_timeout",
+    type=float,
+    default=600,
+    help="Number of seconds after which the lease of a range, whose worker stopped renewing it, expires",
+)
 
 
 def main() -> None:  # noqa: WPS210
     """The entry point for arttabgen."""  # noqa: D401
     args = parser.parse_args()
 
+    if (args.checkpoint_interval or args.resume) and (
+            args.output_mode != "directory"
+            or args.table_data_format != "csv"
+            or args.pdf_batch_size > 1
+    ):
+        parser.error(
+            "checkpoints require the directory output mode, csv table data and unbatched PDFs, "
+            "because other outputs are buffered"
+        )
+
+    if args.pdf_batch_size > 1 and args.pdf_backend == "browser":
+        parser.error("PDFs printed by the browser can't be batched, batches require the wkhtmltopdf PDF backend")
+
+    if args.html_stylesheet_mode == "shared" and args.output_mode != "directory":
+        parser.error("shared stylesheets require the directory output mode")
+
+    if args.workers < 1:
+        parser.error(f"at least one worker is needed, got {args.workers}")
+
+    if args.number_of_webdrivers < 1:
+        parser.error(f"at least one webdriver is needed, got {args.number_of_webdrivers}")
+
+    if args.workers > 1 and (args.checkpoint_interval or args.resume):
+        parser.error("checkpoints are not supported with several workers")
+
+    if not 0 <= args.shard_index < args.shard_count:
+        parser.error(f"the shard index needs to be in [0, {args.shard_count}), got {args.shard_index}")
+
+    if args.shard_count > 1 and (args.workers > 1 or args.checkpoint_interval or args.resume):
+        parser.error("shards can't be combined with several workers or checkpoints")
+
+    if args.lease_range_size < 0:
+        parser.error(f"the lease range size can't be negative, got {args.lease_range_size}")
+
+    if args.lease_range_size and (args.shard_count > 1 or args.checkpoint_interval or args.resume):
+        parser.error("leases can't be combined with shards or checkpoints")
+
+    if args.number_of_combinations is not None and args.number_of_combinations < 1:
+        parser.error(f"at least one combination is needed, got {args.number_of_combinations}")
+
+    # The executables are only needed by some output formats, exports without them work without installing them
+    if (
+            browser_output_formats(args.output_formats, args.image_backend, args.pdf_backend)
+            and not Path(args.geckodriver_path).is_file()
+    ):
+        parser.error(f"the browser export needs geckodriver, which was not found at {args.geckodriver_path}")
+
+    if "pdf" in args.output_formats and args.pdf_backend == "wkhtmltopdf" and not Path(args.wkhtmltopdf_path).is_file():
+        parser.error(f"the PDF export needs wkhtmltopdf, which was not found at {args.wkhtmltopdf_path}")
+
+    resume_checkpoint: Optional[Checkpoint] = None
+
+    if args.resume:
+        checkpoint_file = Path(args.output_dir, args.dataset_name, CHECKPOINT_FILE_NAME)
+
+        if not checkpoint_file.is_file():
+            parser.error(f"no checkpoint to resume from found at {checkpoint_file}")
+
+        resume_checkpoint = load_checkpoint(checkpoint_file)
+
+    _load_config(args)
+
+    try:
+        seed = args.seed or config_handler.config_handler.config["seed"]
+    except KeyError:
+        seed = random.randrange(sys.maxsize)
+
+    if resume_checkpoint:
+        seed = resume_checkpoint.seed
+
+    if args.lease_range_size:
+        lease_queue = LeaseQueue(Path(args.output_dir, args.dataset_name, "leases"), args.lease_timeout)
+        lease_queue.initialize(_count_tables(args), args.lease_range_size)
+
+        if args.workers == 1:
+            _drain_lease_queue(args, int(seed), lease_queue)
+            return
+
+        with ProcessPoolExecutor(args.workers) as worker_pool:
+            futures = [
+                worker_pool.submit(_drain_lease_queue_in_worker, args, int(seed), lease_queue)
+                for _ in range(args.workers)
+            ]
+
+            for future in futures:
+                future.result()
+        return
+
+    if args.shard_count > 1:
+        if not args.per_table_seeds:
+            print(  # noqa: WPS421
+                "Without --per_table_seeds, every shard generates the tables before its slice too",
+                file=sys.stderr,
+            )
+
+        _seed_random_generators(int(seed))
+        # The tables before the shard are replayed, so its tables equal those of an unsharded generation
+        _generate_dataset(
+            args,
+            int(seed),
+            table_range=split_table_range(_count_tables(args), args.shard_count)[args.shard_index],
+            part_index=args.shard_index,
+            replay_skipped_tables=True,
+        )
+        return
+
+    if args.workers == 1:
+        _seed_random_generators(int(seed))
+        _generate_dataset(args, int(seed), resume_checkpoint=resume_checkpoint)
+        return
+
+    # Every worker generates a contiguous range of the tables with its own seed
+    with ProcessPoolExecutor(args.workers) as worker_pool:
+        futures = [
+            worker_pool.submit(_generate_dataset_part, args, int(seed), worker_index, table_range)
+            for worker_index, table_range in enumerate(split_table_range(_count_tables(args), args.workers))
+        ]
+
+        for future in futures:
+            future.result()
+
+
+def _load_config(args: argparse.Namespace) -> None:
+    """Load and validate the config into the global config handler and point the corpora to the cache.
+
+    Args:
+        args: The parsed command line arguments.
+
+    """
     transformer_application_strategy = TransformerApplicationStrategy[
         args.transformer_application_strategy
     ]
@@ -121,18 +397,208 @@ def main() -> None:  # noqa: WPS210
     )
     config_handler.config_handler.validate_config()
 
+    if args.cache_dir:
+        corpora.cache_dir = Path(args.cache_dir)
+
+
+def _count_tables(args: argparse.Namespace) -> int:
+    """Count the tables of the dataset described by the loaded config.
+
+    Args:
+        args: The parsed command line arguments.
+
+    Returns:
+        The number of transformer combinations for the ``COMBINATORICAL`` strategy,
+        at most the requested number of combinations, the configured number of tables otherwise.
+
+    """
+    config = config_handler.config_handler.config
+
+    if config_handler.config_handler.transformer_application_strategy != TransformerApplicationStrategy.COMBINATORICAL:
+        return config["number_of_tables"]
+
+    number_of_combinations: int = build_combination_space(config).size
+
+    return min(args.number_of_combinations or number_of_combinations, number_of_combinations)
+
+
+def _seed_random_generators(seed: int) -> None:
+    """Seed the global random generators of Python and NumPy.
+
+    Args:
+        seed: The seed to use.
+
+    """
+    random.seed(seed)
+    # NumPy only accepts 32 bit seeds
+    np.random.seed(seed % 2 ** 32)
+
+
+def _generate_dataset_part(
+        args: argparse.Namespace,
+        seed: int,
+        worker_index: int,
+        table_range: Tuple[int, int],
+) -> None:
+    """Generate a range of the dataset's tables in a worker process.
+
+    Args:
+        args: The parsed command line arguments.
+        seed: The seed of the dataset.
+        worker_index: The index of the worker.
+        table_range: The (start, stop) 0-based indices of the tables to generate.
+
+    """
+    _load_config(args)
+    _seed_random_generators(derive_seed(seed, worker_index))
+    _generate_dataset(args, seed, table_range=table_range, part_index=worker_index)
+
+
+def _drain_lease_queue_in_worker(args: argparse.Namespace, seed: int, lease_queue: LeaseQueue) -> None:
+    """Generate the ranges of the dataset's tables claimed from a lease queue in a worker process.
+
+    Args:
+        args: The parsed command line arguments.
+        seed: The seed of the dataset.
+        lease_queue: The lease queue to claim the ranges from.
+
+    """
+    _load_config(args)
+    _drain_lease_queue(args, seed, lease_queue)
+
+
+def _drain_lease_queue(args: argparse.Namespace, seed: int, lease_queue: LeaseQueue) -> None:
+    """Generate ranges of the dataset's tables claimed from a lease queue, until all of them are done.
+
+    Every range is generated with a seed derived from its index, so its tables are the same,
+    whichever worker claims it, e.g. after the lease of a crashed worker expired.
+
+    Args:
+        args: The parsed command line arguments.
+        seed: The seed of the dataset.
+        lease_queue: The lease queue to claim the ranges from.
+
+    """
+    # The exporter and its browsers are started once and reused for all ranges the worker claims
+    table_generator: TableGenerator = _build_table_generator(args, seed)
+    table_exporter: Optional[TableExporter] = None
+
     try:
-        seed = args.seed or config_handler.config_handler.config["seed"]
-    except KeyError:
-        seed = random.randrange(sys.maxsize)
+        while True:  # noqa: WPS457
+            table_range: Optional[Tuple[int, int]] = lease_queue.claim()
+
+            if table_range is None:
+                return
 
-    random.seed(int(seed))
+            range_index: int = table_range[0] // args.lease_range_size
 
-    image_manipulators: List[
-        Callable[[str], None]
-    ] = config_handler.config_handler.build_image_manipulators()
+            with lease_queue.keep_alive(table_range) as lease_lost:
+                _seed_random_generators(derive_seed(seed, range_index))
 
-    table_exporter = TableExporter(
+                if table_exporter is None:
+                    table_exporter = _build_table_exporter(args, seed, range_index)
+                else:
+                    # The values of the image manipulations are drawn per range, as by a new exporter
+                    table_exporter.start_part(range_index, _build_image_manipulators(args, seed))
+
+                try:
+                    _generate_dataset(
+                        args,
+                        seed,
+                        table_range=table_range,
+                        part_index=range_index,
+                        table_exporter=table_exporter,
+                        table_generator=table_generator,
+                        abort_event=lease_lost,
+                    )
+                except GenerationAbortedError:
+                    # The worker the range was released to writes the same tar shards and Parquet file
+                    table_exporter.discard()
+                    table_exporter = None
+                    _print_lost_lease(table_range)
+                    continue
+
+            if not lease_queue.complete(table_range):
+                # The range's files are complete, the worker it was released to replaces them with the same ones
+                _print_lost_lease(table_range)
+    finally:
+        if table_exporter is not None:
+            table_exporter.close()
+
+
+def _print_lost_lease(table_range: Tuple[int, int]) -> None:
+    """Tell that the lease of a range expired, so it is generated again by another worker.
+
+    Args:
+        table_range: The (start, stop) 0-based indices of the range's tables.
+
+    """
+    print(  # noqa: WPS421
+        f"The lease of the tables {table_range[0]} to {table_range[1] - 1} expired, another worker generates them",
+        file=sys.stderr,
+    )
+
+
+def _generate_dataset(
+        args: argparse.Namespace,
+        seed: int,
+        resume_checkpoint: Optional[Checkpoint] = None,
+        table_range: Optional[Tuple[int, int]] = None,
+        part_index: int = 0,
+        replay_skipped_tables: bool = False,
+        table_exporter: Optional[TableExporter] = None,
+        table_generator: Optional[TableGenerator] = None,
+        abort_event: Optional[threading.Event] = None,
+) -> None:
+    """Generate and export the tables of the dataset, or a range of them.
+
+    Args:
+        args: The parsed command line arguments.
+        seed: The seed of the dataset.
+        resume_checkpoint: A checkpoint of an interrupted generation of the dataset to continue from.
+        table_range: The (start, stop) 0-based indices of the tables to generate, None for all.
+        part_index: The index of the exporter's files if several exporters contribute to the dataset.
+        replay_skipped_tables: Whether to generate the tables before table_range without exporting them.
+        table_exporter: An exporter to reuse, which is left open for further tables, None to create and close one.
+        table_generator: A generator to reuse, None to create one.
+        abort_event: An event, after which no further table is exported, see :class:`DatasetGenerator`.
+
+    """
+    dataset_generator = DatasetGenerator(
+        table_generator or _build_table_generator(args, seed),
+        table_exporter or _build_table_exporter(args, seed, part_index),
+        args.export_used_keywords_and_units,
+        config_handler.config_handler.config["number_of_tables"],
+        config_handler.config_handler.transformer_application_strategy,
+        args.checkpoint_interval,
+        resume_checkpoint,
+        table_range,
+        replay_skipped_tables,
+        args.per_table_seeds,
+        args.shuffle_combinations,
+        args.number_of_combinations,
+        close_exporter=table_exporter is None,
+        abort_event=abort_event,
+    )
+
+    dataset_generator.generate_dataset()
+
+
+def _build_table_exporter(args: argparse.Namespace, seed: int, part_index: int) -> TableExporter:
+    """Create the table exporter configured by the command line arguments and the loaded config.
+
+    Args:
+        args: The parsed command line arguments.
+        seed: The seed of the dataset.
+        part_index: The index of the exporter's files if several exporters contribute to the dataset.
+
+    Returns:
+        The table exporter.
+
+    """
+    image_manipulators: Dict[str, Callable[..., Any]] = _build_image_manipulators(args, seed)
+
+    return TableExporter(
         args.output_formats,
         args.output_dir,
         args.dataset_name,
@@ -143,8 +609,54 @@ def main() -> None:  # noqa: WPS210
         args.use_concurrent_export,
         config_handler.config_handler.config["image_manipulation_probability"],
         image_manipulators,
+        args.number_of_webdrivers,
+        args.image_backend,
+        args.pdf_batch_size,
+        args.pdf_backend,
+        args.output_mode,
+        args.tables_per_shard,
+        args.max_shard_bytes,
+        args.table_data_format,
+        args.tables_per_row_group,
+        args.max_pending_exports,
+        part_index,
+        seed,
+        args.html_stylesheet_mode,
     )
 
+
+def _build_image_manipulators(args: argparse.Namespace, seed: int) -> Dict[str, Callable[..., Any]]:
+    """Draw the values of the configured image manipulations of an exporter.
+
+    With per-table seeds, the values are drawn from the dataset's seed,
+    so they are the same for every worker, shard and lease range.
+
+    Args:
+        args: The parsed command line arguments.
+        seed: The seed of the dataset.
+
+    Returns:
+        The image manipulators by name.
+
+    """
+    if args.per_table_seeds:
+        # Every table reseeds the random generators, so drawing from them here doesn't change any table
+        _seed_random_generators(seed)
+
+    return config_handler.config_handler.build_image_manipulators()
+
+
+def _build_table_generator(args: argparse.Namespace, seed: int) -> TableGenerator:
+    """Create the table generator configured by the loaded config and load its keywords and units.
+
+    Args:
+        args: The parsed command line arguments.
+        seed: The seed of the dataset.
+
+    Returns:
+        The table generator.
+
+    """
     table_generator = TableGenerator(
         config_handler.config_handler.config["keyword_chance"],
         seed,
@@ -161,15 +673,7 @@ def main() -> None:  # noqa: WPS210
     table_generator.load_units(args.unit_path)
     table_generator.build_gt_word_list()
 
-    dataset_generator = DatasetGenerator(
-        table_generator,
-        table_exporter,
-        args.export_used_keywords_and_units,
-        config_handler.config_handler.config["number_of_tables"],
-        config_handler.config_handler.transformer_application_strategy,
-    )
-
-    dataset_generator.generate_dataset()
+    return table_generator
 
 
 if __name__ == "__main__":
@@ -0,0 +1,211 @@
+"""Holds the output writers, which store the serialized artefacts of exported tables.
+
+OUTPUT_MODES: The available output modes.
+"""
+import os
+import tarfile
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from io import BytesIO
+from pathlib import Path
+from typing import Collection, Dict, Optional, Tuple
+
+SUBDIRS_PER_OUTPUT_FORMAT: Dict[str, str] = {
+    "csv": "tables_csv",
+    "pdf": "tables_pdfs",
+    "html": "tables_html",
+    "png": "tables_png",
+    "jpg": "tables_jpg",
+    "gt_csv": "gt_csv",
+}
+"""The directories of the directory output mode, relative to the dataset directory."""
+
+EXTENSIONS_PER_OUTPUT_FORMAT: Dict[str, str] = {
+    "csv": "csv",
+    "pdf": "pdf",
+    "html": "html",
+    "png": "png",
+    "jpg": "jpg",
+    "gt_csv": "gt.csv",
+}
+"""The file extensions of the artefacts of a table in a tar shard."""
+
+OUTPUT_MODES: Tuple[str, ...] = ("directory", "tar")
+"""``"directory"`` stores a file per artefact, ``"tar"`` streams the artefacts into tar shards."""
+
+
+class OutputWriter(ABC):
+    """Stores the serialized artefacts of exported tables.
+
+    The methods of an output writer may be called concurrently.
+    """
+
+    @abstractmethod
+    def write(self, table_num: int, output_format: str, data: bytes) -> None:
+        """Store an artefact of a table.
+
+        Args:
+            table_num: The number of generated tables the table is.
+            output_format: The output format of the artefact, including ``gt_csv``.
+            data: The serialized artefact.
+
+        """
+
+    def close(self) -> None:
+        """Store any pending artefacts and release the resources held by the output writer."""
+
+    def discard(self) -> None:
+        """Release the resources held by the output writer without storing any pending artefacts."""
+
+
+class DirectoryWriter(OutputWriter):  # noqa: D101
+    def __init__(self, dataset_path: Path) -> None:
+        """Stores every artefact as a separate file in a directory per output format.
+
+        Args:
+            dataset_path: The directory to export the dataset to.
+
+        """
+        self.subdirs_per_output_format: Dict[str, Path] = {
+            output_format: Path(dataset_path, subdir)
+            for output_format, subdir in SUBDIRS_PER_OUTPUT_FORMAT.items()
+        }
+
+        for subdir in self.subdirs_per_output_format.values():
+            subdir.mkdir(exist_ok=True, parents=True)
+
+    def write(self, table_num: int, output_format: str, data: bytes) -> None:  # noqa: D102
+        extension: str = "csv" if output_format == "gt_csv" else output_format
+        self.write_file(output_format, f"tables_{table_num}.{extension}", data)
+
+    def write_file(self, output_format: str, file_name: str, data: bytes) -> None:
+        """Store a file in the directory of an output format.
+
+        Args:
+            output_format: The output format the file belongs to.
+            file_name: The name of the file.
+            data: The file's content.
+
+        """
+        Path(self.subdirs_per_output_format[output_format], file_name).write_bytes(data)
+
+
+class TarShardWriter(OutputWriter):  # noqa: D101
+    def __init__(
+            self,
+            dataset_path: Path,
+            output_formats: Collection[str],
+            tables_per_shard: int,
+            max_shard_bytes: Optional[int] = None,
+            part_index: int = 0,
+    ) -> None:
+        """Streams the artefacts of the tables into rolling tar shards in the WebDataset layout.
+
+        The artefacts of a table are buffered until all of them are exported
+        and then written consecutively, named ``tables_<n>.<extension>``.
+        A shard is closed once it holds tables_per_shard tables or max_shard_bytes bytes.
+        The shards are named ``shard-<part_index>-<n>.tar``, so several writers can contribute to one dataset.
+        A shard is written to a hidden file of the writer's own and only renamed to its name once it is closed.
+
+        Args:
+            dataset_path: The directory to export the dataset to.
+            output_formats: The output formats exported for every table, including ``csv`` and ``gt_csv``.
+            tables_per_shard: The maximum number of tables per shard.
+            max_shard_bytes: The size in bytes after which a shard is closed, or None for no limit.
+            part_index: The index of the writer's shards in the dataset.
+
+        Raises:
+            ValueError: If tables_per_shard is smaller than 1.
+
+        """
+        if tables_per_shard < 1:
+            raise ValueError(f"A shard needs to hold at least one table, got {tables_per_shard}")
+
+        self.shard_dir: Path = Path(dataset_path, "shards")
+        self.shard_dir.mkdir(exist_ok=True, parents=True)
+
+        self.output_formats: Tuple[str, ...] = tuple(output_formats)
+        self.tables_per_shard: int = tables_per_shard
+        self.max_shard_bytes: Optional[int] = max_shard_bytes
+        self.part_index: int = part_index
+
+        self.num_shards: int = 0
+        self.tables_in_shard: int = 0
+        self.shard: Optional[tarfile.TarFile] = None
+        self.shard_file: Optional[Path] = None
+        self.temporary_shard_file: Optional[Path] = None
+        self.pending_tables: Dict[int, Dict[str, bytes]] = {}
+        self.lock = threading.Lock()
+
+    def write(self, table_num: int, output_format: str, data: bytes) -> None:  # noqa: D102
+        with self.lock:
+            artefacts: Dict[str, bytes] = self.pending_tables.setdefault(table_num, {})
+            artefacts[output_format] = data
+
+            if len(artefacts) == len(self.output_formats):
+                self._write_table(table_num, self.pending_tables.pop(table_num))
+
+    def close(self) -> None:
+        """Write the tables missing artefacts, e.g. because of a failed export, and close the last shard."""
+        with self.lock:
+            for table_num in sorted(self.pending_tables):
+                self._write_table(table_num, self.pending_tables.pop(table_num))
+
+            if self.shard:
+                self._close_shard()
+
+    def discard(self) -> None:
+        """Delete the current shard and drop the tables missing artefacts, the closed shards are kept."""
+        with self.lock:
+            self.pending_tables.clear()
+
+            if self.shard:
+                self.shard.close()
+                self.shard = None
+                self.temporary_shard_file.unlink()
+
+    def _write_table(self, table_num: int, artefacts: Dict[str, bytes]) -> None:
+        """Write the artefacts of a table to the current shard, rolling over to a new shard if it is full.
+
+        Args:
+            table_num: The number of generated tables the table is.
+            artefacts: The serialized artefacts by output format.
+
+        """
+        if self.shard is None:
+            self.shard_file = Path(self.shard_dir, f"shard-{self.part_index:05d}-{self.num_shards:06d}.tar")
+            self.temporary_shard_file = _temporary_file(self.shard_file)
+            self.shard = tarfile.open(self.temporary_shard_file, mode="w")
+            self.num_shards += 1
+            self.tables_in_shard = 0
+
+        # Keep the artefacts of a table in a fixed order, regardless of their export order
+        for output_format in sorted(artefacts, key=self._format_position):
+            member: tarfile.TarInfo = tarfile.TarInfo(
+                f"tables_{table_num}.{EXTENSIONS_PER_OUTPUT_FORMAT[output_format]}"
+            )
+            member.size = len(artefacts[output_format])
+            self.shard.addfile(member, BytesIO(artefacts[output_format]))
+
+        self.tables_in_shard += 1
+
+        if self.tables_in_shard >= self.tables_per_shard or (
+                self.max_shard_bytes is not None and self.shard.offset >= self.max_shard_bytes
+        ):
+            self._close_shard()
+
+    def _close_shard(self) -> None:
+        """Close the current shard and rename it to its name."""
+        self.shard.close()
+        self.shard = None
+        os.replace(self.temporary_shard_file, self.shard_file)
+
+    def _format_position(self, output_format: str) -> int:
+        """Position of an output format in the order of a table's artefacts."""
+        return self.output_formats.index(output_format)
+
+
+def _temporary_file(file: Path) -> Path:
+    """Name a hidden file of its own to write a file to before it is renamed to its name."""
+    return Path(file.parent, f".{file.name}.{uuid.uuid4().hex}")
@@ -50,16 +50,17 @@ class ProgressPrinter:  # noqa: D101
             end="\r",
         )
 
-    def run_as_progressor(self, progressor: Callable[[Any], None], *args: Any) -> None:
+    def run_as_progressor(self, progressor: Callable[[Any], None], *args: Any, steps: int = 1) -> None:
         """Run a function and use its completion to track the current progress.
 
         Args:
             progressor: A function to run and use for tracking progress.
             args: Arguments to pass to the progressor function.
+            steps: The number of progress steps the progressor's completion accounts for.
 
         """
         progressor(*args)
-        self.current += 1
+        self.current += steps
         self.print_progress()
 
 
@@ -0,0 +1,191 @@
+"""Holds the SemanticNeighbourIndex class, which finds the WordNet nouns within a band of path similarity.
+
+Types:
+    SemanticNeighbourIndex
+"""
+import json
+import random
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class SemanticNeighbourIndex:  # noqa: D101
+    def __init__(
+            self,
+            synset_names: Sequence[str],
+            load_synset: Callable[[str], Any],
+            min_similarity: float,
+            max_similarity: float,
+            cache_file: Optional[Path] = None,
+    ) -> None:
+        """An index of the synsets whose path similarity to a synset is strictly between two bounds.
+
+        The neighbours of a synset are found once, with a single walk of the noun hierarchy,
+        and then kept in memory and optionally appended to a cache file as a line per synset, which later generations
+        and other processes reuse. Synsets are referred to by name, so only the ones walked or drawn need to be loaded.
+
+        Args:
+            synset_names: The names of all noun synsets, e.g. of ``wordnet.all_synsets("n")``.
+            load_synset: A function loading a synset by name, e.g. ``wordnet.synset``.
+            min_similarity: The exclusive lower bound of the path similarity of a neighbour.
+            max_similarity: The exclusive upper bound of the path similarity of a neighbour.
+            cache_file: The file to persist the neighbours of the synsets to, None to only keep them in memory.
+                        It needs to be specific to the WordNet version and the bounds.
+
+        """
+        self.synset_names: Sequence[str] = synset_names
+        self.load_synset: Callable[[str], Any] = load_synset
+        self.min_similarity: float = min_similarity
+        self.max_similarity: float = max_similarity
+        self.cache_file: Optional[Path] = cache_file
+        self.cache_file_position: int = 0
+        self.synset_positions: Dict[str, int] = {name: position for position, name in enumerate(synset_names)}
+        self.neighbours: Dict[str, array] = {}
+
+        if self.cache_file is not None:
+            self.cache_file.parent.mkdir(exist_ok=True, parents=True)
+            self._read_cache_file()
+
+    def random_neighbour(self, synset: Any) -> Optional[Any]:
+        """Draw a neighbour of a synset.
+
+        Every neighbour is equally likely, like picking the first neighbour of the shuffled synsets.
+
+        Args:
+            synset: The synset to draw a neighbour of.
+
+        Returns:
+            A random neighbour, None if the synset has no neighbours.
+
+        """
+        neighbours: array = self._neighbours(synset)
+
+        if not neighbours:
+            return None
+
+        return self.load_synset(self.synset_names[random.choice(neighbours)])
+
+    def _neighbours(self, synset: Any) -> array:
+        """Get the positions of a synset's neighbours in :attr:`synset_names`, from memory, the cache or a new search.
+
+        Args:
+            synset: The synset to get the neighbours of.
+
+        Returns:
+            The ascending positions of the neighbours.
+
+        """
+        name: str = synset.name()
+
+        if name in self.neighbours:
+            return self.neighbours[name]
+
+        if self.cache_file is not None:
+            # Other processes may have searched the synset since the file was last read
+            self._read_cache_file()
+
+            if name in self.neighbours:
+                return self.neighbours[name]
+
+        self.neighbours[name] = array(
+            "l",
+            sorted(
+                self.synset_positions[neighbour.name()]
+                for neighbour, distance in _path_distances(synset).items()
+                if self.min_similarity < 1 / (distance + 1) < self.max_similarity
+                and neighbour.name() in self.synset_positions
+            ),
+        )
+
+        if self.cache_file is not None:
+            # Several processes may append to the file, a line garbled by concurrent writes is skipped when read
+            with open(self.cache_file, "ab", buffering=0) as cache_file:
+                cache_file.write(f"{json.dumps([name, self.neighbours[name].tolist()])}\n".encode("utf-8"))
+
+        return self.neighbours[name]
+
+    def _read_cache_file(self) -> None:
+        """Read the neighbours appended to :attr:`cache_file` since it was last read.
+
+        A line still being written is left for the next read. A malformed line, e.g. cut off by a crashed process
+        or interleaved with another process's line on a filesystem without atomic appends, is skipped,
+        so its synset is searched again.
+
+        """
+        if not self.cache_file.is_file():
+            return
+
+        with open(self.cache_file, "rb") as cache_file:
+            cache_file.seek(self.cache_file_position)
+            content: bytes = cache_file.read()
+
+        complete_length: int = content.rfind(b"\n") + 1
+        self.cache_file_position += complete_length
+
+        for line in content[:complete_length].splitlines():
+            try:
+                name, positions = json.loads(line)
+                neighbours: array = array("l", positions)
+            except (TypeError, ValueError, OverflowError):
+                continue
+
+            # The positions are written in ascending order and within the synsets, a line violating that is garbled
+            if isinstance(name, str) and all(
+                    0 <= position < next_position
+                    for position, next_position in zip(neighbours, [*neighbours[1:], len(self.synset_names)])
+            ):
+                self.neighbours.setdefault(name, neighbours)
+
+
+def _path_distances(synset: Any) -> Dict[Any, int]:
+    """Compute the shortest path distances of a noun synset to all synsets, like ``Synset.shortest_path_distance``.
+
+    A path leads up from the synset to a common hypernym and down to the other synset, so every synset's distance
+    is its shortest distance below any hypernym plus that hypernym's distance above the synset.
+
+    Args:
+        synset: The noun synset to compute the distances of.
+
+    Returns:
+        The distance of every synset connected to the synset by a common hypernym.
+
+    """
+    hypernym_distances: Dict[Any, int] = {}
+    pending_synsets: List[Any] = [synset]
+    distance: int = 0
+
+    while pending_synsets:
+        next_synsets: List[Any] = []
+
+        for pending_synset in pending_synsets:
+            if pending_synset not in hypernym_distances:
+                hypernym_distances[pending_synset] = distance
+                next_synsets.extend(pending_synset.hypernyms())
+                next_synsets.extend(pending_synset.instance_hypernyms())
+
+        pending_synsets = next_synsets
+        distance += 1
+
+    # Walk down from all hypernyms at once, the synsets reached first by increasing distance are the closest
+    synsets_by_distance: Dict[int, List[Any]] = {}
+
+    for hypernym, hypernym_distance in hypernym_distances.items():
+        synsets_by_distance.setdefault(hypernym_distance, []).append(hypernym)
+
+    distances: Dict[Any, int] = {}
+    distance = 0
+
+    while distance <= max(synsets_by_distance, default=-1):
+        for pending_synset in synsets_by_distance.pop(distance, []):
+            if pending_synset not in distances:
+                distances[pending_synset] = distance
+                synsets_by_distance.setdefault(distance + 1, []).extend(
+                    hyponym
+                    for hyponym in pending_synset.hyponyms() + pending_synset.instance_hyponyms()
+                    if hyponym not in distances
+                )
+
+        distance += 1
+
+    return distances
@@ -0,0 +1,139 @@
+"""Holds the ParquetTableDataWriter class, which collects the raw data of exported tables in a Parquet dataset.
+
+TABLE_DATA_FORMATS: The available formats for the raw table data.
+TABLE_DATA_SCHEMA_FIELDS: The columns of the Parquet dataset.
+"""
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from arttabgen.helper import Table
+
+TABLE_DATA_FORMATS: Tuple[str, ...] = ("csv", "parquet")
+"""``"csv"`` exports a CSV per table, ``"parquet"`` collects all tables in a Parquet dataset."""
+
+TABLE_DATA_SCHEMA_FIELDS: Tuple[str, ...] = (
+    "table_id",
+    "mode",
+    "num_columns",
+    "cells",
+    "gt_cells",
+)
+"""The columns of the Parquet dataset, a row per table."""
+
+
+class ParquetTableDataWriter:  # noqa: D101
+    def __init__(
+            self,
+            output_dir: Path,
+            tables_per_row_group: int,
+            part_index: int = 0,
+    ) -> None:
+        """Collects the generated and ground truth data of tables and writes them as row groups to a Parquet file.
+
+        The file is named ``part-<part_index>.parquet``, so several writers can contribute to one dataset.
+        It is written to a hidden file of the writer's own and only renamed to its name once it is closed.
+
+        Args:
+            output_dir: The directory of the Parquet dataset.
+            tables_per_row_group: The number of tables written at once as a row group.
+            part_index: The index of the file in the dataset.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ValueError: If tables_per_row_group is smaller than 1.
+
+        """
+        # pyarrow is optional and slow to import, so it is only imported by a writer for the parquet format
+        try:
+            import pyarrow as pa  # noqa: WPS433
+        except ImportError as error:  # pragma: no cover
+            raise ImportError("The parquet table data format requires pyarrow to be installed") from error
+
+        if tables_per_row_group < 1:
+            raise ValueError(f"A row group needs to hold at least one table, got {tables_per_row_group}")
+
+        output_dir.mkdir(exist_ok=True, parents=True)
+
+        self.parquet_file: Path = Path(output_dir, f"part-{part_index:05d}.parquet")
+        self.temporary_parquet_file: Path = Path(output_dir, f".{self.parquet_file.name}.{uuid.uuid4().hex}")
+        self.tables_per_row_group: int = tables_per_row_group
+        self.schema = pa.schema(
+            [
+                ("table_id", pa.int64()),
+                ("mode", pa.int32()),
+                ("num_columns", pa.int32()),
+                ("cells", pa.list_(pa.list_(pa.string()))),
+                ("gt_cells", pa.list_(pa.list_(pa.string()))),
+            ]
+        )
+        self.writer = None
+        self.pending_columns: Dict[str, List[Any]] = self._empty_columns()
+        self.lock = threading.Lock()
+
+    def add(
+            self,
+            table_num: int,
+            mode: int,
+            table_data: Table,
+            ground_truth_table_data: Table,
+    ) -> None:
+        """Add the data of a table, writing a row group once enough tables are collected.
+
+        Args:
+            table_num: The number of generated tables the table is.
+            mode: The table generation mode used to generate the table.
+            table_data: The data of the table as exported.
+            ground_truth_table_data: The table's ground truth.
+
+        """
+        with self.lock:
+            self.pending_columns["table_id"].append(table_num)
+            self.pending_columns["mode"].append(mode)
+            self.pending_columns["num_columns"].append(len(table_data[0]) if table_data else 0)
+            self.pending_columns["cells"].append(table_data)
+            self.pending_columns["gt_cells"].append(ground_truth_table_data)
+
+            if len(self.pending_columns["table_id"]) >= self.tables_per_row_group:
+                self._write_row_group()
+
+    def close(self) -> None:
+        """Write the remaining tables and close the Parquet file."""
+        with self.lock:
+            if self.pending_columns["table_id"]:
+                self._write_row_group()
+
+            if self.writer is not None:
+                self.writer.close()
+                self.writer = None
+                os.replace(self.temporary_parquet_file, self.parquet_file)
+
+    def discard(self) -> None:
+        """Drop the remaining tables and delete the Parquet file written so far."""
+        with self.lock:
+            self.pending_columns = self._empty_columns()
+
+            if self.writer is not None:
+                self.writer.close()
+                self.writer = None
+                self.temporary_parquet_file.unlink()
+
+    def _write_row_group(self) -> None:
+        """Write the collected tables as a row group."""
+        import pyarrow as pa  # noqa: WPS433
+        import pyarrow.parquet as pq  # noqa: WPS433
+
+        if self.writer is None:
+            self.writer = pq.ParquetWriter(self.temporary_parquet_file, self.schema)
+
+        self.writer.write_table(
+            pa.Table.from_pydict(self.pending_columns, schema=self.schema),
+            row_group_size=self.tables_per_row_group,
+        )
+        self.pending_columns = self._empty_columns()
+
+    def _empty_columns(self) -> Dict[str, List[Any]]:
+        """Create empty lists to collect the values of each column in."""
+        return {field: [] for field in TABLE_DATA_SCHEMA_FIELDS}
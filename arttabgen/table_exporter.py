@@ -1,23 +1,69 @@
 """Holds the TableExporter class, which offers functionality related to exporting generated tables."""
+import base64
+import hashlib
 import random
+import tempfile
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from io import BytesIO
+from itertools import zip_longest
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional, Set, Tuple, Union
 
-import pandas as pd
-import pdfkit
-from PIL import Image
-from pdfkit.configuration import Configuration
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
-from selenium.webdriver.firefox.webdriver import WebDriver
+import numpy as np
 
 from arttabgen import html_handling
-from arttabgen.helper import Table
+from arttabgen.css_compiler import compile_stylesheet
+from arttabgen.helper import Table, derive_seed
+from arttabgen.output_writer import (
+    SUBDIRS_PER_OUTPUT_FORMAT,
+    DirectoryWriter,
+    OutputWriter,
+    TarShardWriter,
+)
 from arttabgen.progress_printer import ProgressPrinter
+from arttabgen.table_data_writer import ParquetTableDataWriter
 from arttabgen.transformers import image_manipulator
 from arttabgen.types_.transformer_value_combination import TransformerValueCombination
+from arttabgen.webdriver_pool import WebDriverPool
+
+# The export backends take long to import and are only needed by some output formats, so they are imported on use
+if TYPE_CHECKING:
+    from PIL import Image
+    from pdfkit.configuration import Configuration
+    from selenium.webdriver.firefox.options import Options
+    from selenium.webdriver.firefox.webdriver import WebDriver
+
+IMAGE_FORMATS: Tuple[str, ...] = ("jpg", "png")
+"""The output formats exported from a single render of a table."""
+
+IMAGE_BACKENDS: Tuple[str, ...] = ("browser", "pillow")
+"""The available backends for rendering tables to images.
+
+``"browser"`` renders the table's HTML in headless Firefox, ``"pillow"`` draws the table with
+:func:`arttabgen.table_renderer.render_table` without a browser.
+"""
+
+PDF_BACKENDS: Tuple[str, ...] = ("wkhtmltopdf", "browser")
+"""The available backends for exporting tables to PDF.
+
+``"wkhtmltopdf"`` runs wkhtmltopdf through pdfkit, ``"browser"`` prints the table from the headless
+Firefox that also renders its images.
+"""
+
+HTML_STYLESHEET_MODES: Tuple[str, ...] = ("inline", "shared")
+"""The available ways to store the styles of exported HTML files.
+
+``"inline"`` embeds the styles into every HTML file, ``"shared"`` writes every distinct stylesheet once into
+the ``styles`` directory of the HTML files, named after its hash, and links to it.
+"""
+
+STYLESHEET_DIR: str = "styles"
+"""The directory of the shared stylesheets, relative to the directory of the HTML files."""
+
+PRINT_PAGE_COMMAND: str = "printPage"
+"""The name of the WebDriver command printing the current page to PDF."""
 
 
 class TableExporter:  # noqa: D101
@@ -33,6 +79,19 @@ class TableExporter:  # noqa: D101
             use_concurrent_export: bool,
             image_manipulation_probability: float,
             image_manipulators: List[Callable[[str], None]],
+            number_of_webdrivers: int = 1,
+            image_backend: str = "browser",
+            pdf_batch_size: int = 1,
+            pdf_backend: str = "wkhtmltopdf",
+            output_mode: str = "directory",
+            tables_per_shard: int = 10000,
+            max_shard_bytes: Optional[int] = None,
+            table_data_format: str = "csv",
+            tables_per_row_group: int = 1000,
+            max_pending_exports: int = 100,
+            part_index: int = 0,
+            seed: int = 0,
+            html_stylesheet_mode: str = "inline",
     ) -> None:
         """Offers functionality to exporting tables.
 
@@ -47,14 +106,40 @@ class TableExporter:  # noqa: D101
             use_concurrent_export: A flag enabling/disabling concurrent_exports.
             image_manipulation_probability: The probability of an exported image getting manipulated.
             image_manipulators: A list of image manipulators available for application.
+            number_of_webdrivers: The number of headless browsers to render images with in parallel.
+            image_backend: The backend to render images with, one of :data:`IMAGE_BACKENDS`.
+            pdf_batch_size: The number of consecutive tables to render into one multi-page PDF
+                            with a single wkhtmltopdf run. 1 exports a PDF per table.
+            pdf_backend: The backend to export PDFs with, one of :data:`PDF_BACKENDS`.
+            output_mode: How to store the exported files, one of
+                         :data:`arttabgen.output_writer.OUTPUT_MODES`.
+            tables_per_shard: The maximum number of tables per tar shard of the ``tar`` output mode.
+            max_shard_bytes: The size in bytes after which a tar shard of the ``tar`` output mode is closed.
+            table_data_format: The format to export the generated and ground truth table data in, one of
+                               :data:`arttabgen.table_data_writer.TABLE_DATA_FORMATS`.
+            tables_per_row_group: The number of tables per row group of the ``parquet`` table data format.
+            max_pending_exports: The number of tables whose concurrent exports may be pending
+                                 before exporting another table blocks.
+            part_index: The index of the exporter's tar shards and Parquet file
+                        if several exporters contribute to one dataset.
+            seed: The seed of the dataset, from which the random generator of every table's image
+                  manipulation is derived, so it does not depend on the order of concurrent exports.
+            html_stylesheet_mode: How to store the styles of exported HTML files, one of
+                                  :data:`HTML_STYLESHEET_MODES`.
+
+        Raises:
+            ValueError: If pdf_batch_size is smaller than 1, or above 1 in the ``tar`` output mode
+                        or with the ``browser`` PDF backend,
+                        if max_pending_exports is smaller than 1,
+                        or if shared stylesheets are requested in the ``tar`` output mode.
 
         """
         self.use_concurrent_export = use_concurrent_export
         self.output_formats = output_formats
 
-        self.num_exported_tables: int = 0
         self.jpg_quality: int = jpg_quality
         self.image_manipulation_probability: float = image_manipulation_probability
+        self.seed: int = seed
 
         self.image_manipulators = image_manipulators
         self.image_manipulators_by_mode: Dict[
@@ -72,40 +157,128 @@ class TableExporter:  # noqa: D101
             dataset_name,
         )
 
-        self.subdirs_per_output_format: Dict[str, Path] = {
-            "csv": Path(self.dataset_path, "tables_csv"),
-            "pdf": Path(self.dataset_path, "tables_pdfs"),
-            "html": Path(self.dataset_path, "tables_html"),
-            "png": Path(self.dataset_path, "tables_png"),
-            "jpg": Path(self.dataset_path, "tables_jpg"),
-            "gt_csv": Path(self.dataset_path, "gt_csv"),
+        self.pdf_backend: str = pdf_backend
+
+        # Image formats are not listed here, they are exported together by _export_images,
+        # as is a PDF printed by the browser
+        self.exporters_per_output_format: Dict[str, Callable[[str, int], None]] = {
+            "html": self._export_html,
         }
 
-        if self.use_concurrent_export:
-            self.exporters_per_output_format: Dict[
-                str,
-                Callable[[str, int, int], Future[None]],
-            ] = self._export_concurrent()
-        else:
-            self.exporters_per_output_format: Dict[
-                str,
-                Callable[[str, int, int], Future[None]],
-            ] = self._export_sequential()
+        if self.pdf_backend == "wkhtmltopdf":
+            self.exporters_per_output_format["pdf"] = self._export_pdf
 
         self.wkhtmltopdf_path: Path = wkhtmltopdf_path
+
+        if pdf_batch_size < 1:
+            raise ValueError(f"The PDF batch size needs to be at least 1, got {pdf_batch_size}")
+
+        if pdf_batch_size > 1 and output_mode == "tar":
+            raise ValueError("Batched PDFs contain several tables and can't be stored in tar shards")
+
+        if pdf_batch_size > 1 and pdf_backend == "browser":
+            raise ValueError("PDFs printed by the browser can't be batched, only the wkhtmltopdf backend batches them")
+
+        self.pdf_batch_size: int = pdf_batch_size
+        # Tables waiting for their PDF batch to fill up, by batch number and table number
+        self.pending_pdf_batches: Dict[int, Dict[int, str]] = {}
+        self.pdf_batch_lock = threading.Lock()
         self.gecko_driver_path: Path = gecko_driver_path
 
-        firefox_options: Options = Options()
-        # no firefox instance is opened
-        firefox_options.add_argument("--headless")
-        self.driver: WebDriver = self._init_webdriver(firefox_options)
+        self.image_backend: str = image_backend
+        self.number_of_webdrivers: int = number_of_webdrivers
+        # The browsers are only started by the first table rendered in them, see _checkout_webdriver
+        self.webdriver_pool: Optional[WebDriverPool] = None
+        # The browsers are started only once, a failure to start them is raised again for every later table
+        self.webdriver_pool_error: Optional[Exception] = None
+        self.webdriver_pool_lock = threading.Lock()
 
-        self._create_needed_directories()
-        self.futures = []
-        self.thread_pool = ThreadPoolExecutor()
-        self.webdriver_lock = threading.Lock()
+        self.table_data_format: str = table_data_format
+        self.tables_per_row_group: int = tables_per_row_group
+
+        if html_stylesheet_mode == "shared" and output_mode == "tar":
+            raise ValueError("Shared stylesheets belong to several tables and can't be stored in tar shards")
+
+        self.html_stylesheet_mode: str = html_stylesheet_mode
+        # The links to the stylesheets written so far, by stylesheet
+        self.stylesheet_hrefs: Dict[str, str] = {}
+        self.stylesheet_lock = threading.Lock()
+
+        self.output_mode: str = output_mode
+        self.tables_per_shard: int = tables_per_shard
+        self.max_shard_bytes: Optional[int] = max_shard_bytes
+
+        if max_pending_exports < 1:
+            raise ValueError(f"At least one export needs to be allowed to be pending, got {max_pending_exports}")
+
+        # Futures are not kept, so finished exports release their tables right away
+        self.export_lock = threading.Lock()
+        self.pending_tables = threading.BoundedSemaphore(max_pending_exports)
+        self._open_part(part_index)
         self.progress_printer: ProgressPrinter = progress_printer
 
+    def start_part(self, part_index: int, image_manipulators: Dict[str, Callable[..., Any]]) -> None:
+        """Finish the exports of the current part of the dataset and export the following tables to a new part.
+
+        The browsers keep running, so a worker exporting several ranges of the dataset only starts them once.
+
+        Args:
+            part_index: The index of the new part's tar shards and Parquet file.
+            image_manipulators: The image manipulators of the new part, with the same names as the current ones.
+
+        Raises:
+            Exception: The first error raised by a concurrent export of the current part.
+
+        """
+        self.finish_part()
+        self.image_manipulators = image_manipulators
+        self._open_part(part_index)
+
+    def _open_part(self, part_index: int) -> None:
+        """Create the writers and the thread pool of a part of the dataset and reset the table numbering.
+
+        Args:
+            part_index: The index of the part's tar shards and Parquet file.
+
+        """
+        self.num_exported_tables: int = 0
+        # Tables are completed out of order by concurrent exports, so the ones beyond the first gap are kept apart
+        self.num_completed_tables: int = 0
+        self.completed_tables: Set[int] = set()
+        self.export_errors: List[BaseException] = []
+        self.table_data_writer: Optional[ParquetTableDataWriter] = None
+
+        if self.table_data_format == "parquet":
+            self.table_data_writer = ParquetTableDataWriter(
+                Path(self.dataset_path, "table_data"),
+                self.tables_per_row_group,
+                part_index,
+            )
+
+        self.output_writer: OutputWriter
+
+        if self.output_mode == "tar":
+            self.output_writer = TarShardWriter(
+                self.dataset_path,
+                (["csv", "gt_csv"] if self.table_data_writer is None else []) + [
+                    output_format
+                    for output_format in dict.fromkeys(self.output_formats)
+                    if output_format in SUBDIRS_PER_OUTPUT_FORMAT
+                ],
+                self.tables_per_shard,
+                self.max_shard_bytes,
+                part_index,
+            )
+        else:
+            self.output_writer = DirectoryWriter(self.dataset_path)
+
+            if self.html_stylesheet_mode == "shared":
+                Path(self.dataset_path, SUBDIRS_PER_OUTPUT_FORMAT["html"], STYLESHEET_DIR).mkdir(
+                    exist_ok=True, parents=True
+                )
+
+        self.thread_pool = ThreadPoolExecutor()
+
     def export_table(
             self,
             ground_truth_table_data: Table,
@@ -115,6 +288,8 @@ class TableExporter:  # noqa: D101
     ) -> None:
         """Export a table.
 
+        With concurrent exports, this blocks while the exports of too many earlier tables are pending.
+
         Args:
             ground_truth_table_data: The generated table's ground truth.
             generated_table_data: The generated table's data.
@@ -124,92 +299,252 @@ class TableExporter:  # noqa: D101
                   This is needed to apply the correct image manipulators.
 
         """
-        self.num_exported_tables += 1
+        if self.use_concurrent_export:
+            self.pending_tables.acquire()
 
-        generated_table_html = html_handling.table_to_html(
-            generated_table_data, transformer_value_combination
-        )
+        self.num_exported_tables += 1
         # This copy seems to be necessary to avoid race conditions when exporter
         # functions read this var after it was changed by other threads,
         # leading to files being skipped
         table_num = self.num_exported_tables
-        do_transpose = False
-        structure_transformers = transformer_value_combination.structure_parameters
-        if "table-orientation" in structure_transformers:
-            table_orientation = structure_transformers["table-orientation"]
-            if table_orientation == "vertical":
-                do_transpose = True
+        futures: List[Optional[Future]] = []
 
-        if self.use_concurrent_export:
-            self.futures.append(
-                self.thread_pool.submit(
-                    self.progress_printer.run_as_progressor,
-                    self._export_csv,
-                    generated_table_data,
-                    table_num,
-                    "tables",
-                    do_transpose
-                )
+        try:
+            generated_table_html = html_handling.table_to_html(
+                generated_table_data, transformer_value_combination
             )
-            self.futures.append(
-                self.thread_pool.submit(
-                    self.progress_printer.run_as_progressor,
-                    self._export_csv,
-                    ground_truth_table_data,
+            do_transpose = False
+            structure_transformers = transformer_value_combination.structure_parameters
+            if "table-orientation" in structure_transformers:
+                table_orientation = structure_transformers["table-orientation"]
+                if table_orientation == "vertical":
+                    do_transpose = True
+
+            if self.table_data_writer:
+                # Collecting the data is cheap, the writer only does work once per row group
+                self.progress_printer.run_as_progressor(
+                    self.table_data_writer.add,
                     table_num,
-                    "gt",
-                    False
+                    mode,
+                    _transpose(generated_table_data) if do_transpose else generated_table_data,
+                    ground_truth_table_data,
+                    steps=2,
                 )
-            )
-        else:
-            self.progress_printer.run_as_progressor(
-                self._export_csv,
+            else:
+                futures.append(
+                    self._run_export(
+                        self._export_csv,
+                        generated_table_data,
+                        table_num,
+                        "tables",
+                        do_transpose,
+                    )
+                )
+                futures.append(
+                    self._run_export(
+                        self._export_csv,
+                        ground_truth_table_data,
+                        table_num,
+                        "gt",
+                        False,
+                    )
+                )
+            self._export_table_by_output_formats(
+                generated_table_html,
                 generated_table_data,
+                transformer_value_combination,
                 table_num,
-                "tables",
-                do_transpose
-            )
-            self.progress_printer.run_as_progressor(
-                self._export_csv,
-                ground_truth_table_data,
-                table_num,
-                "gt",
-                False
+                mode,
+                futures,
             )
-        self._export_table_by_output_formats(generated_table_html, table_num, mode)
+        except BaseException:
+            # The exports submitted before the failure still run, their errors are reported by close()
+            if self.use_concurrent_export:
+                self._track_table_exports(
+                    table_num, [future for future in futures if future is not None], table_failed=True
+                )
+
+            raise
+
+        if self.use_concurrent_export:
+            self._track_table_exports(table_num, [future for future in futures if future is not None])
+        else:
+            with self.export_lock:
+                self._complete_table(table_num)
+
+    def _track_table_exports(self, table_num: int, futures: List[Future], table_failed: bool = False) -> None:
+        """Complete a table and release its slot of pending exports once all of its exports are done.
+
+        Errors of the exports are recorded to be raised by :meth:`close`, a table with a failed export
+        is not completed.
+
+        Args:
+            table_num: The number of generated tables the table is.
+            futures: The futures of the table's concurrent exports.
+            table_failed: Whether the table already failed before all of its exports were submitted.
+
+        """
+        if not futures:
+            if not table_failed:
+                with self.export_lock:
+                    self._complete_table(table_num)
+
+            self.pending_tables.release()
+            return
+
+        num_pending: List[int] = [len(futures)]
+        export_failed: List[bool] = [table_failed]
+
+        def export_done(future: Future) -> None:
+            with self.export_lock:
+                if not future.cancelled() and future.exception() is not None:
+                    self.export_errors.append(future.exception())
+                    export_failed[0] = True
+
+                num_pending[0] -= 1
+                table_done: bool = num_pending[0] == 0
+
+                if table_done and not export_failed[0]:
+                    self._complete_table(table_num)
+
+            if table_done:
+                self.pending_tables.release()
+
+        # Callbacks of futures, which are already done, are called right away
+        for future in futures:
+            future.add_done_callback(export_done)
+
+    def skip_tables(self, num_tables: int) -> None:
+        """Continue the numbering of tables after tables, which were exported by an earlier run.
+
+        Args:
+            num_tables: The number of tables exported by the earlier run.
+
+        """
+        self.num_exported_tables = num_tables
+        self.num_completed_tables = num_tables
+
+    def _complete_table(self, table_num: int) -> None:
+        """Record a table as completely exported, the export lock needs to be held.
+
+        Args:
+            table_num: The number of generated tables the table is.
+
+        """
+        self.completed_tables.add(table_num)
+
+        while self.num_completed_tables + 1 in self.completed_tables:
+            self.num_completed_tables += 1
+            self.completed_tables.remove(self.num_completed_tables)
 
     def _export_table_by_output_formats(
             self,
             generated_table_html: str,
+            generated_table_data: Table,
+            transformer_value_combination: TransformerValueCombination,
             table_num: int,
             mode: int,
+            futures: List[Optional[Future]],
     ) -> None:
         """Export a table (internal helper function).
 
+        All requested image formats share a single render of the table, which also
+        yields the PDF if it is printed by the browser.
+
         Args:
             generated_table_html: The generated table's html representation.
+            generated_table_data: The generated table's data.
+            transformer_value_combination: The *transformers* applied to the generated table.
             table_num: The number of generated tables this one is.
             mode: The table generation mode used to generate the table.
                   This is needed to apply the correct image manipulators.
+            futures: The list to add the futures of the concurrent exports to, None for each sequential export.
+                     The exports submitted before a failure are added, too.
 
         """
+        rendered_formats: List[str] = [
+            output_format
+            for output_format in self.output_formats
+            if output_format in IMAGE_FORMATS
+            or (output_format == "pdf" and self.pdf_backend == "browser")
+        ]
+
+        if rendered_formats:
+            futures.append(
+                self._run_export(
+                    self._export_images,
+                    generated_table_html,
+                    generated_table_data,
+                    transformer_value_combination,
+                    table_num,
+                    rendered_formats,
+                    mode,
+                    progress_steps=len(rendered_formats),
+                )
+            )
+
+        # The renderers need the styles embedded, only the HTML files may link to a shared stylesheet
+        html_file_content: str = generated_table_html
+
+        if self.html_stylesheet_mode == "shared" and "html" in self.output_formats:
+            html_file_content = html_handling.table_to_html(
+                generated_table_data,
+                transformer_value_combination,
+                self._write_shared_stylesheet(compile_stylesheet(transformer_value_combination.style_parameters)),
+            )
 
         for output_format in self.output_formats:
-            if output_format:
-                if self.use_concurrent_export:
-                    self.futures.append(
-                        self.exporters_per_output_format[output_format](
-                            generated_table_html,
-                            table_num,
-                            mode,
-                        )
-                    )
-                else:
-                    self.exporters_per_output_format[output_format](
-                        generated_table_html,
+            if output_format in self.exporters_per_output_format:
+                futures.append(
+                    self._run_export(
+                        self.exporters_per_output_format[output_format],
+                        html_file_content if output_format == "html" else generated_table_html,
                         table_num,
-                        mode,
                     )
+                )
+
+    def _write_shared_stylesheet(self, stylesheet: str) -> str:
+        """Write a stylesheet to a file named after its hash, unless it was written before.
+
+        Args:
+            stylesheet: The compiled stylesheet.
+
+        Returns:
+            The link to the stylesheet, relative to the directory of the HTML files.
+
+        """
+        with self.stylesheet_lock:
+            if stylesheet not in self.stylesheet_hrefs:
+                file_name: str = f"{hashlib.sha256(stylesheet.encode('utf-8')).hexdigest()[:16]}.css"
+                self.output_writer.write_file("html", f"{STYLESHEET_DIR}/{file_name}", stylesheet.encode("utf-8"))
+                self.stylesheet_hrefs[stylesheet] = f"{STYLESHEET_DIR}/{file_name}"
+
+            return self.stylesheet_hrefs[stylesheet]
+
+    def _run_export(
+            self, exporter: Callable[..., None], *args: Any, progress_steps: int = 1
+    ) -> Optional[Future]:
+        """Run an export function concurrently or sequentially and track its progress.
+
+        Args:
+            exporter: The export function to run.
+            args: Arguments to pass to the export function.
+            progress_steps: The number of progress steps the export accounts for.
+
+        Returns:
+            The future of a concurrent export, None for a sequential one.
+
+        """
+        if self.use_concurrent_export:
+            return self.thread_pool.submit(
+                self.progress_printer.run_as_progressor,
+                exporter,
+                *args,
+                steps=progress_steps,
+            )
+
+        self.progress_printer.run_as_progressor(exporter, *args, steps=progress_steps)
+        return None
 
     def _export_csv(self, table_data: Table, table_num: int, data_type: str, do_transpose: bool) -> None:
         """Export a table to CSV.
@@ -220,141 +555,311 @@ class TableExporter:  # noqa: D101
             data_type: The type (ground truth or not) the provided table is of.
 
         """
-        export_dir = self.subdirs_per_output_format[
-            "csv" if data_type == "tables" else "gt_csv"
-        ]
+        import pandas as pd  # noqa: WPS433
 
         df = pd.DataFrame(table_data)
 
         if do_transpose:
             df = df.transpose()
 
-        df.to_csv(
-            Path(export_dir, f"tables_{table_num}.csv"),
+        csv: str = df.to_csv(
             sep=";",
             index=False,
             header=False
         )
 
-    def _export_pdf(self, generated_table_html: str, table_num: int) -> None:
-        """Export a table to PDF.
-
-        Args:
-            generated_table_html: The generated table's html representation.
-            table_num: The number of generated tables this one is.
-            mode: The table generation mode used to generate the table.
-                  This is needed to apply the correct image manipulators.
-
-        """
-        table_name: str = f"tables_{table_num}"
-        pdf_file: Path = Path(
-            self.subdirs_per_output_format["pdf"],
-            f"{table_name}.pdf",
+        self.output_writer.write(
+            table_num,
+            "csv" if data_type == "tables" else "gt_csv",
+            csv.encode("utf-8"),
         )
 
-        config: Configuration = pdfkit.configuration(
+    @cached_property
+    def pdfkit_configuration(self) -> "Configuration":
+        """The pdfkit configuration using the local wkhtmltopdf, created once on first use."""
+        import pdfkit  # noqa: WPS433
+
+        return pdfkit.configuration(
             wkhtmltopdf=self.wkhtmltopdf_path,
         )  # use local installed version
 
+    @property
+    def pdfkit_options(self) -> Dict[str, Optional[str]]:
+        """The wkhtmltopdf options used for the PDF export."""
         # to set options, they need to appear in a dict, see https://pypi.org/project/pdfkit/
         # and https://wkhtmltopdf.org/usage/wkhtmltopdf.txt
-        options: Dict[str, Optional[str]] = {
+        return {
             "enable-local-file-access": None,
             "quiet": "",
         }
 
-        pdfkit.from_string(
+    def _export_pdf(self, generated_table_html: str, table_num: int) -> None:
+        """Export a table to PDF.
+
+        With a PDF batch size above 1 the table is queued until its batch is complete,
+        see :meth:`_export_pdf_batch`.
+
+        Args:
+            generated_table_html: The generated table's html representation.
+            table_num: The number of generated tables this one is.
+
+        """
+        if self.pdf_batch_size > 1:
+            batch_num: int = (table_num - 1) // self.pdf_batch_size
+
+            with self.pdf_batch_lock:
+                batch = self.pending_pdf_batches.setdefault(batch_num, {})
+                batch[table_num] = generated_table_html
+
+                if len(batch) < self.pdf_batch_size:
+                    return
+
+                del self.pending_pdf_batches[batch_num]
+
+            self._export_pdf_batch(batch)
+            return
+
+        import pdfkit  # noqa: WPS433
+
+        # pdfkit returns the PDF instead of writing it if no output path is given
+        pdf_data: bytes = pdfkit.from_string(
             generated_table_html,
-            str(pdf_file.absolute()),
-            configuration=config,
-            options=options,
+            False,
+            configuration=self.pdfkit_configuration,
+            options=self.pdfkit_options,
         )
 
-    def _export_image(
+        self.output_writer.write(table_num, "pdf", pdf_data)
+
+    def _export_pdf_batch(self, generated_tables_html: Dict[int, str]) -> None:
+        """Export several tables to one PDF with a single wkhtmltopdf run.
+
+        Every table starts on a new page, in the order of the table numbers.
+        The PDF is named after the first and last table number of the batch.
+
+        Args:
+            generated_tables_html: The generated tables' html representations by table number.
+
+        """
+        import pdfkit  # noqa: WPS433
+
+        table_nums: List[int] = sorted(generated_tables_html)
+
+        # wkhtmltopdf renders each input file as a separate page, but only accepts a single string
+        with tempfile.TemporaryDirectory() as html_dir:
+            html_files: List[str] = []
+
+            for table_num in table_nums:
+                html_file: Path = Path(html_dir, f"tables_{table_num}.html")
+                html_file.write_text(generated_tables_html[table_num], encoding="utf-8")
+                html_files.append(str(html_file))
+
+            pdf_data: bytes = pdfkit.from_file(
+                html_files,
+                False,
+                configuration=self.pdfkit_configuration,
+                options=self.pdfkit_options,
+            )
+
+        # Batching is only available in the directory output mode
+        self.output_writer.write_file(
+            "pdf",
+            f"tables_{table_nums[0]}-{table_nums[-1]}.pdf",
+            pdf_data,
+        )
+
+    def _export_images(
             self,
             generated_table_html: str,
+            generated_table_data: Table,
+            transformer_value_combination: TransformerValueCombination,
             table_num: int,
-            file_format: str,
+            file_formats: List[str],
             mode: int,
     ) -> None:
-        """Export a table as a image.
+        """Render a table once and export it as an image in every requested format.
+
+        The same image manipulation is applied to every format. If a PDF is requested, it is printed
+        from the browser page the image is captured from.
 
         Args:
             generated_table_html: The generated tables html representation.
+            generated_table_data: The generated table's data.
+            transformer_value_combination: The *transformers* applied to the generated table.
             table_num: The number of generated table this one is.
-            file_format: the output format of the image (png or jpeg)
+            file_formats: The output formats of the image (png and/or jpg), optionally including pdf.
             mode: The table generation mode used to generate the table.
                   This is needed to apply the correct image manipulators.
 
         """
 
-        table_name: str = f"tables_{table_num}"
-        image_file: Path = Path(
-            self.subdirs_per_output_format[file_format],
-            f"{table_name}.{file_format}",
-        )
+        image_formats: List[str] = [
+            file_format for file_format in file_formats if file_format in IMAGE_FORMATS
+        ]
+        image: Optional["Image.Image"] = None
 
-        with self.webdriver_lock:
-            # Hacky workaround because data URIs are bugged
-            self.driver.get("data:text/html,")
-            root_element = self.driver.find_element_by_tag_name("html")
-            generated_table_html = generated_table_html.replace("\n", "\\n")
-            generated_table_html = generated_table_html.replace("'", "\\'")
-            self.driver.execute_script(
-                f"arguments[0].innerHTML = '{generated_table_html}';", root_element
+        if "pdf" in file_formats:
+            image, pdf_data = self._capture_image_and_pdf(
+                generated_table_html,
+                capture_image=bool(image_formats) and self.image_backend == "browser",
             )
+            self.output_writer.write(table_num, "pdf", pdf_data)
+
+        if not image_formats:
+            return
+
+        if self.image_backend == "pillow":
+            from arttabgen import table_renderer  # noqa: WPS433
 
-            # https://stackoverflow.com/questions/41721734/take-screenshot-of-full-page-with-selenium-python-with-chromedriver/52572919#52572919
-            original_size = self.driver.get_window_size()
-            required_width = self.driver.execute_script('return document.body.parentNode.scrollWidth')
-            required_height = self.driver.execute_script('return document.body.parentNode.scrollHeight')
-            self.driver.set_window_size(required_width, required_height + 74)
-            self.driver.find_element_by_tag_name('body').screenshot(str(image_file))
-            self.driver.set_window_size(original_size['width'], original_size['height'])
-
-        with Image.open(image_file) as image:
-            # Strip Alpha channel, because JPG can't contain it
-            image = image.convert("RGB")
-
-            if (
-                    random.random() < self.image_manipulation_probability
-                    and self.image_manipulators_by_mode[mode]
-            ):
-                manipulator = self.image_manipulators[
-                    random.choice(self.image_manipulators_by_mode[mode])
-                ]
+            image = table_renderer.render_table(
+                generated_table_data,
+                transformer_value_combination,
+            )
+        elif image is None:
+            image = self._capture_image(generated_table_html)
+
+        # Every table has its own random generator, concurrent exports would draw in an unpredictable order
+        table_seed: int = derive_seed(self.seed, table_num)
+        table_random = random.Random(table_seed)
+
+        if (
+                table_random.random() < self.image_manipulation_probability
+                and self.image_manipulators_by_mode[mode]
+        ):
+            manipulator_name: str = table_random.choice(self.image_manipulators_by_mode[mode])
+            manipulator = self.image_manipulators[manipulator_name]
+
+            if manipulator_name in image_manipulator.RANDOM_IMAGE_MANIPULATORS:
+                image = manipulator(image, rng=np.random.default_rng(table_seed))
+            else:
                 image = manipulator(image)
 
+        for file_format in image_formats:
+            image_data: BytesIO = BytesIO()
+
             if file_format == "jpg":
-                image.save(image_file, quality=self.jpg_quality)
+                image.save(image_data, format="JPEG", quality=self.jpg_quality)
             else:
-                image.save(image_file)
+                image.save(image_data, format="PNG")
 
-    def _export_jpg(self, generated_table_html: str, table_num: int, mode: int) -> None:
-        """Export a table as a jpg image.
+            self.output_writer.write(table_num, file_format, image_data.getvalue())
+
+    def _capture_image(self, generated_table_html: str) -> "Image.Image":
+        """Render a table in a browser and capture it as an in-memory image.
+
+        The screenshot is transferred from the browser as PNG bytes and decoded without touching the disk.
 
         Args:
             generated_table_html: The generated tables html representation.
-            table_num: The number of generated table this one is.
-            mode: The table generation mode used to generate the table.
-                  This is needed to apply the correct image manipulators.
+
+        Returns:
+            The rendered table as an RGB image.
 
         """
+        from PIL import Image  # noqa: WPS433, WPS442
+
+        with self._checkout_webdriver() as driver:
+            self._load_html(driver, generated_table_html)
+            screenshot: bytes = self._take_screenshot(driver)
 
-        self._export_image(generated_table_html, table_num, "jpg", mode)
+        # Strip Alpha channel, because JPG can't contain it
+        return Image.open(BytesIO(screenshot)).convert("RGB")
 
-    def _export_png(self, generated_table_html: str, table_num: int, mode: int) -> None:
-        """Export a table as a png image.
+    def _capture_image_and_pdf(
+            self, generated_table_html: str, capture_image: bool
+    ) -> Tuple[Optional["Image.Image"], bytes]:
+        """Render a table in a browser once, print it to PDF and optionally capture it as an image.
 
         Args:
             generated_table_html: The generated tables html representation.
-            table_num: The number of generated table this one is.
-            mode: The table generation mode used to generate the table.
-                  This is needed to apply the correct image manipulators.
+            capture_image: Whether to capture the rendered table as an image, too.
+
+        Returns:
+            The rendered table as an RGB image, or None if it was not captured, and the PDF's content.
 
         """
+        from PIL import Image  # noqa: WPS433, WPS442
+
+        with self._checkout_webdriver() as driver:
+            self._load_html(driver, generated_table_html)
+            # Print before the window gets resized for the screenshot
+            pdf_data: bytes = _print_page(driver)
+            screenshot: Optional[bytes] = self._take_screenshot(driver) if capture_image else None
+
+        if screenshot is None:
+            return None, pdf_data
 
-        self._export_image(generated_table_html, table_num, "png", mode)
+        # Strip Alpha channel, because JPG can't contain it
+        return Image.open(BytesIO(screenshot)).convert("RGB"), pdf_data
+
+    def _checkout_webdriver(self) -> ContextManager["WebDriver"]:
+        """Check out a WebDriver of the pool, starting the browsers of the pool first if none were started yet.
+
+        Returns:
+            A context manager yielding a WebDriver no other caller is using, see :meth:`WebDriverPool.checkout`.
+
+        Raises:
+            RuntimeError: If the browsers failed to start, now or for an earlier table.
+
+        """
+        with self.webdriver_pool_lock:
+            if self.webdriver_pool_error is not None:
+                raise RuntimeError("The browsers failed to start") from self.webdriver_pool_error
+
+            if self.webdriver_pool is None:
+                from selenium.webdriver.firefox.options import Options  # noqa: WPS433, WPS442
+
+                firefox_options: Options = Options()
+                # no firefox instance is opened
+                firefox_options.add_argument("--headless")
+
+                try:
+                    self.webdriver_pool = WebDriverPool(
+                        self.number_of_webdrivers,
+                        lambda: self._init_webdriver(firefox_options),
+                    )
+                except Exception as error:
+                    self.webdriver_pool_error = error
+                    raise RuntimeError("The browsers failed to start") from error
+
+        return self.webdriver_pool.checkout()
+
+    def _load_html(self, driver: "WebDriver", generated_table_html: str) -> None:
+        """Load a table's html into a browser.
+
+        Args:
+            driver: The WebDriver controlling the browser.
+            generated_table_html: The generated tables html representation.
+
+        """
+        # Hacky workaround because data URIs are bugged
+        driver.get("data:text/html,")
+        root_element = driver.find_element_by_tag_name("html")
+        generated_table_html = generated_table_html.replace("\n", "\\n")
+        generated_table_html = generated_table_html.replace("'", "\\'")
+        driver.execute_script(
+            f"arguments[0].innerHTML = '{generated_table_html}';", root_element
+        )
+
+    def _take_screenshot(self, driver: "WebDriver") -> bytes:
+        """Take a screenshot of the whole page loaded in a browser.
+
+        Args:
+            driver: The WebDriver controlling the browser.
+
+        Returns:
+            The screenshot as PNG bytes.
+
+        """
+        # https://stackoverflow.com/questions/41721734/take-screenshot-of-full-page-with-selenium-python-with-chromedriver/52572919#52572919
+        original_size = driver.get_window_size()
+        required_width = driver.execute_script('return document.body.parentNode.scrollWidth')
+        required_height = driver.execute_script('return document.body.parentNode.scrollHeight')
+        driver.set_window_size(required_width, required_height + 74)
+        screenshot: bytes = driver.find_element_by_tag_name('body').screenshot_as_png
+        driver.set_window_size(original_size['width'], original_size['height'])
+
+        return screenshot
 
     def _export_html(
             self, generated_table_html: str, table_num: int
@@ -368,83 +873,125 @@ class TableExporter:  # noqa: D101
                   This is needed to apply the correct image manipulators.
 
         """
-        table_name: str = f"tables_{table_num}"
-        html_file: Path = Path(
-            self.subdirs_per_output_format["html"],
-            f"{table_name}.html",
-        )
+        self.output_writer.write(table_num, "html", generated_table_html.encode("utf-8"))
 
-        html_file.write_text(generated_table_html, encoding="utf-8")
+    def close(self) -> None:
+        """Wait for all pending exports to finish, store their files and quit the browsers started for the export.
 
-    def _create_needed_directories(self) -> None:
-        """Create the dataset's directory structure."""
+        Raises:
+            Exception: The first error raised by a concurrent export.
 
-        for subdir in self.subdirs_per_output_format.values():
-            subdir.mkdir(exist_ok=True, parents=True)
+        """
+        try:
+            self.finish_part()
+        finally:
+            if self.webdriver_pool:
+                self.webdriver_pool.quit()
+
+    def discard(self) -> None:
+        """Wait for all pending exports to finish and quit the browsers, without storing the current part's files.
+
+        The tar shard and Parquet file being written are deleted, e.g. because another exporter took over the part
+        after a lost lease. Files already stored, e.g. closed tar shards, are kept.
+
+        """
+        self.thread_pool.shutdown(wait=True)
+
+        try:
+            self.pending_pdf_batches.clear()
+            self.output_writer.discard()
+
+            if self.table_data_writer:
+                self.table_data_writer.discard()
+        finally:
+            if self.webdriver_pool:
+                self.webdriver_pool.quit()
+
+    def finish_part(self) -> None:
+        """Wait for the pending exports of the current part of the dataset to finish and store their files.
+
+        Raises:
+            Exception: The first error raised by a concurrent export.
 
-    def _init_webdriver(self, firefox_options: Options) -> WebDriver:
+        """
+        self.thread_pool.shutdown(wait=True)
+
+        try:
+            # Make sure errors in concurrent calls are communicated back to the main thread
+            if self.export_errors:
+                raise self.export_errors[0]
+
+            # The last batch is incomplete if the number of tables is not a multiple of the batch size
+            for batch_num in sorted(self.pending_pdf_batches):
+                self._export_pdf_batch(self.pending_pdf_batches.pop(batch_num))
+        finally:
+            self.output_writer.close()
+
+            if self.table_data_writer:
+                self.table_data_writer.close()
+
+    def _init_webdriver(self, firefox_options: "Options") -> "WebDriver":
         """Create and configure a webdriver to use for the image export."""
+        from selenium import webdriver  # noqa: WPS433
+
         return webdriver.Firefox(
             executable_path=str(self.gecko_driver_path),
             options=firefox_options,
         )
 
-    def _export_concurrent(self):  # -> Dict[str, Callable[[str, int, int], Future[None]]]:
-        """Return a mapping of export formats to concurrent exporter functions."""
-        return {
-            "pdf": lambda html, table_num, mode: self.thread_pool.submit(
-                self.progress_printer.run_as_progressor,
-                self._export_pdf,
-                html,
-                table_num
-            ),
-            "png": lambda html, table_num, mode: self.thread_pool.submit(
-                self.progress_printer.run_as_progressor,
-                self._export_png,
-                html,
-                table_num,
-                mode,
-            ),
-            "jpg": lambda html, table_num, mode: self.thread_pool.submit(
-                self.progress_printer.run_as_progressor,
-                self._export_jpg,
-                html,
-                table_num,
-                mode,
-            ),
-            "html": lambda html, table_num, mode: self.thread_pool.submit(
-                self.progress_printer.run_as_progressor,
-                self._export_html,
-                html,
-                table_num
-            ),
-        }
 
-    def _export_sequential(self) -> Dict[str, Callable[[str, int, int], None]]:
-        """Return a mapping of export formats to sequential export functions."""
-        return {
-            "pdf": lambda html, table_num, mode: self.progress_printer.run_as_progressor(
-                self._export_pdf,
-                html,
-                table_num,
-                mode,
-            ),
-            "png": lambda html, table_num, mode: self.progress_printer.run_as_progressor(
-                self._export_png,
-                html,
-                table_num,
-                mode,
-            ),
-            "jpg": lambda html, table_num, mode: self.progress_printer.run_as_progressor(
-                self._export_jpg,
-                html,
-                table_num,
-                mode,
-            ),
-            "html": lambda html, table_num, mode: self.progress_printer.run_as_progressor(
-                self._export_html,
-                html,
-                table_num,
-                mode,
-            ),
-        }
+def browser_output_formats(output_formats: List[str], image_backend: str, pdf_backend: str) -> List[str]:
+    """Select the output formats, which are rendered in the headless browser.
+
+    Args:
+        output_formats: The output formats to export tables with.
+        image_backend: The backend to render images with, one of :data:`IMAGE_BACKENDS`.
+        pdf_backend: The backend to export PDFs with, one of :data:`PDF_BACKENDS`.
+
+    Returns:
+        The output formats needing a browser, none if no browser needs to be started.
+
+    """
+    return [
+        output_format
+        for output_format in output_formats
+        if (output_format in IMAGE_FORMATS and image_backend == "browser")
+        or (output_format == "pdf" and pdf_backend == "browser")
+    ]
+
+
+def _transpose(table_data: Table) -> Table:
+    """Transpose a table, like the CSV export does for vertically oriented tables.
+
+    Args:
+        table_data: The table to transpose.
+
+    Returns:
+        The transposed table.
+
+    """
+    # Missing cells of shorter rows are exported empty, as in the CSV
+    return [list(column) for column in zip_longest(*table_data, fillvalue="")]
+
+
+def _print_page(driver: "WebDriver") -> bytes:
+    """Print the page loaded in a browser to PDF with the WebDriver print command.
+
+    Args:
+        driver: The WebDriver controlling the browser.
+
+    Returns:
+        The PDF's content.
+
+    """
+    # Selenium 3 does not know the command yet, although geckodriver supports it
+    if PRINT_PAGE_COMMAND not in driver.command_executor._commands:  # noqa: WPS437
+        driver.command_executor._commands[PRINT_PAGE_COMMAND] = (  # noqa: WPS437
+            "POST",
+            "/session/$sessionId/print",
+        )
+
+    # Backgrounds are printed to keep background colors, like wkhtmltopdf does
+    response: Dict[str, Any] = driver.execute(PRINT_PAGE_COMMAND, {"background": True})
+
+    return base64.b64decode(response["value"])
@@ -1,29 +1,19 @@
 """Holds the TableGenerator class, which offers functionality related to generating tables."""
 import json
 import random
-from itertools import chain
+from itertools import chain, count
 from pathlib import Path
-from typing import Callable, Dict, List, Set, Tuple, Union
-
-import nltk
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Set, Tuple, Union
 
 import arttabgen.types_.config_main_keys
 from arttabgen import config_handler, helper, row_builder, text_manipulator
 from arttabgen.helper import InfiniteIterator, Keyword, Row, Table
 
-try:
-    nltk.data.find("words")
-except LookupError:
-    nltk.download("words", quiet=True)
-
 PREFIXED_SYMBOLS = "prefixed_symbols"
 BASE_SYMBOLS = "base_symbols"
 
 
-def _overlap_in_units(original_units, new_units):
-    return any([unit in original_units for unit in new_units])
-
-
 class TableGenerator:  # noqa: D101
     def __init__(
             self,
@@ -52,8 +42,15 @@ class TableGenerator:  # noqa: D101
             row_manipulation_odds: The probability of manipulating a table row.
 
         """
-        self.keywords: List[Keyword] = []
-        self.units: Dict[str, Dict[str, List[str]]] = {}
+        # Setting the keywords or units also builds their indexes, so rows are generated without scanning them
+        self._keywords: List[Keyword]
+        self.keyword_synonyms: FrozenSet[str]
+        self.keywords = []
+        self._units: Dict[str, Dict[str, List[str]]]
+        self.unit_symbols: Mapping[str, Tuple[str, ...]]
+        self.unit_symbol_sets: Mapping[str, FrozenSet[str]]
+        self.keywords_by_unit_symbol: Mapping[str, FrozenSet[str]]
+        self.units = {}
         self.gt_word_list: Set[str] = set()
 
         self.generation_modes_odds: Dict[int, float] = generation_modes_odds
@@ -78,6 +75,44 @@ class TableGenerator:  # noqa: D101
 
         self.row_manipulation_odds: float = row_manipulation_odds
 
+    @property
+    def keywords(self) -> List[Keyword]:
+        """The keywords, each one a list of its synonyms, the first of which names it."""
+        return self._keywords
+
+    @keywords.setter
+    def keywords(self, keywords: List[Keyword]) -> None:
+        self._keywords = keywords
+        # The lowercase synonyms of all keywords, to recognize generated synonyms, which already exist
+        self.keyword_synonyms = frozenset(synonym.lower() for synonym in chain.from_iterable(keywords))
+
+    @property
+    def units(self) -> Dict[str, Dict[str, List[str]]]:
+        """The units of every keyword, see :meth:`load_units`."""
+        return self._units
+
+    @units.setter
+    def units(self, units: Dict[str, Dict[str, List[str]]]) -> None:
+        self._units = units
+        # The prefixed symbols come first, the order random symbols are drawn from
+        self.unit_symbols = MappingProxyType({
+            keyword: tuple(unit.get(PREFIXED_SYMBOLS, [])) + tuple(unit.get(BASE_SYMBOLS, []))
+            for keyword, unit in units.items()
+        })
+        self.unit_symbol_sets = MappingProxyType(
+            {keyword: frozenset(symbols) for keyword, symbols in self.unit_symbols.items()}
+        )
+
+        keywords_by_unit_symbol: Dict[str, Set[str]] = {}
+
+        for keyword, symbols in self.unit_symbols.items():
+            for symbol in symbols:
+                keywords_by_unit_symbol.setdefault(symbol, set()).add(keyword)
+
+        self.keywords_by_unit_symbol = MappingProxyType({
+            symbol: frozenset(symbol_keywords) for symbol, symbol_keywords in keywords_by_unit_symbol.items()
+        })
+
     def generate_tables_with_gt(
             self,
     ) -> InfiniteIterator[Tuple[Table, Table, int]]:
@@ -104,6 +139,40 @@ class TableGenerator:  # noqa: D101
         while True:  # noqa: WPS457
             yield self._generate_table_and_gt()
 
+    def generate_tables_from(
+            self,
+            first_table_index: int,
+    ) -> InfiniteIterator[Tuple[Table, Table, int]]:
+        """Generate the tables starting at an index, each one with :meth:`table_at`.
+
+        Args:
+            first_table_index: The 0-based index of the first table to generate.
+
+        Yields:
+            The next generated table, its ground truth and its generation mode.
+
+        """
+        for table_index in count(first_table_index):
+            yield self.table_at(table_index)
+
+    def table_at(self, table_index: int) -> Tuple[Table, Table, int]:
+        """Generate the table with an index from its own random stream, regardless of any other table.
+
+        Python's random generator is seeded with a seed derived from the generator's seed and the table index,
+        so a table can be regenerated from its index alone. Everything drawn afterwards, e.g. the table's
+        transformers, continues the table's random stream.
+
+        Args:
+            table_index: The 0-based index of the table in the dataset.
+
+        Returns:
+            The table, its ground truth and its generation mode.
+
+        """
+        random.seed(helper.derive_seed(self.seed, table_index))
+
+        return self._generate_table_and_gt()
+
     def load_keywords(self, keywords_file_path: Union[str, Path]) -> None:
         """Load the keywords from a txt file.
 
@@ -329,9 +398,9 @@ class TableGenerator:  # noqa: D101
         keyword: Keyword = random.choice(self.keywords)
         random_synonym: str = random.choice(keyword)
         new_synonym: str = random_synonym
-        new_units: List[str] = self.units[keyword[0]][PREFIXED_SYMBOLS] + self.units[keyword[0]][BASE_SYMBOLS]
+        keywords_with_symbol: FrozenSet[str] = self.keywords_by_unit_symbol.get(symbol, frozenset())
 
-        while self.__keyword_exists(new_synonym) or symbol in new_units:
+        while self.__keyword_exists(new_synonym) or keyword[0] in keywords_with_symbol:
             keyword = random.choice(self.keywords)
 
             mix_arr: List[str] = random.choice(keyword).split(" ")
@@ -340,8 +409,6 @@ class TableGenerator:  # noqa: D101
             new_syn_arr[-1] = mix_arr[-1]
             new_synonym = " ".join(new_syn_arr)
 
-            new_units = self.units[keyword[0]][PREFIXED_SYMBOLS] + self.units[keyword[0]][BASE_SYMBOLS]
-
         return new_synonym
 
     def _choose_random_unit(self, keyword: Keyword, mode: int) -> Tuple[str, bool]:
@@ -366,10 +433,8 @@ class TableGenerator:  # noqa: D101
         else:
             random_keyword = random.choice(self.keywords)[0]
 
-        random_units: List[str] = self.units[random_keyword][PREFIXED_SYMBOLS] + self.units[random_keyword][
-            BASE_SYMBOLS]
-        correct_units: Set[str] = set(
-            self.units[random_keyword][PREFIXED_SYMBOLS] + self.units[random_keyword][BASE_SYMBOLS])
+        random_units: Tuple[str, ...] = self.unit_symbols[random_keyword]
+        correct_units: FrozenSet[str] = self.unit_symbol_sets[random_keyword]
 
         # "": has no symbol (e.g. number of xy: 100 vs length of xy = 100cm)
         random_unit_symbol: str = random.choice(random_units) if random_units else ""
@@ -382,11 +447,11 @@ class TableGenerator:  # noqa: D101
         ):
             is_gt = False
 
-            while _overlap_in_units(correct_units, random_units):
+            while not correct_units.isdisjoint(random_units):
                 # while random_unit_symbol in correct_units:
                 random_keyword = random.choice(self.keywords)[0]
 
-                random_units = self.units[random_keyword][PREFIXED_SYMBOLS] + self.units[random_keyword][BASE_SYMBOLS]
+                random_units = self.unit_symbols[random_keyword]
 
                 # "": has no symbol (e.g. number of xy: 100 vs length of xy = 100cm)
                 random_unit_symbol = random.choice(random_units) if random_units else ""
@@ -394,5 +459,4 @@ class TableGenerator:  # noqa: D101
         return random_unit_symbol, is_gt
 
     def __keyword_exists(self, key: str) -> bool:
-        keys = [x.lower() for x in list(set(chain.from_iterable(self.keywords)))]
-        return key.lower() in keys
+        return key.lower() in self.keyword_synonyms
@@ -0,0 +1,750 @@
+"""Holds functionality to render tables directly to images, without a browser.
+
+The renderer interprets the CSS declarations emitted by the *style transformers* and the *structure transformers*
+and lays the table out similar to how a browser would render the HTML built by
+:func:`arttabgen.html_handling.table_to_html`. Declarations with values a browser would reject are ignored.
+
+Functions:
+    render_table()
+"""
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from arttabgen.css_compiler import parse_css_declarations
+from arttabgen.helper import Table
+from arttabgen.types_.transformer_value_combination import TransformerValueCombination
+
+LENGTH_PATTERN = re.compile(r"^(-?\d+(?:\.\d+)?)(px|pt|em|rem|%)?$")
+"""Matches a CSS length, capturing its number and its unit."""
+
+NTH_CHILD_PATTERN = re.compile(r"^(tr|td):nth-child\((even|odd)\)$")
+"""Matches the selectors used by the alternating colour *style transformers*."""
+
+DEFAULT_FONT_FAMILY: str = "Times New Roman"
+DEFAULT_FONT_SIZE: float = 16
+LINE_HEIGHT_FACTOR: float = 1.15
+LINE_BREAKS_AROUND_TABLE: int = 3
+"""The HTML skeleton surrounds the table with this number of line breaks on each side."""
+
+BORDER_WIDTH_KEYWORDS: Dict[str, float] = {"thin": 1, "medium": 3, "thick": 5}
+
+FONT_FILES_PER_FAMILY: Dict[str, Tuple[str, ...]] = {
+    "arial": ("arial", "Arial", "LiberationSans", "DejaVuSans"),
+    "impact": ("impact", "Impact", "LiberationSans", "DejaVuSans"),
+    "comic sans ms": ("comic", "Comic Sans MS", "LiberationSans", "DejaVuSans"),
+    "times new roman": ("times", "Times New Roman", "LiberationSerif", "DejaVuSerif"),
+    "didot": ("Didot", "LiberationSerif", "DejaVuSerif"),
+    "courier": ("cour", "Courier New", "LiberationMono", "DejaVuSansMono"),
+    "american typewriter": ("American Typewriter", "LiberationMono", "DejaVuSansMono"),
+}
+"""Maps font families to the names of font files to try, in order of preference."""
+
+FALLBACK_FONT_FILES: Tuple[str, ...] = ("DejaVuSans", "LiberationSans", "arial")
+
+FONT_FILE_SUFFIXES: Dict[Tuple[bool, bool], Tuple[str, ...]] = {
+    (False, False): ("",),
+    (True, False): ("-Bold", "bd"),
+    (False, True): ("-Italic", "-Oblique", "i"),
+    (True, True): ("-BoldItalic", "-BoldOblique", "bi"),
+}
+"""Maps (bold, italic) to the suffixes font files of that variant use (e.g. DejaVuSans-Bold, arialbd)."""
+
+VALID_KEYWORDS_PER_PROPERTY: Dict[str, Tuple[str, ...]] = {
+    "font-style": ("normal", "italic", "oblique"),
+    "border-collapse": ("separate", "collapse"),
+    "border-style": (
+        "none", "hidden", "dotted", "dashed", "solid", "double", "groove", "ridge", "inset", "outset",
+    ),
+    "text-transform": ("none", "capitalize", "uppercase", "lowercase"),
+    "text-align": ("left", "right", "center", "justify", "start", "end"),
+    "vertical-align": ("baseline", "sub", "super", "text-top", "text-bottom", "middle", "top", "bottom"),
+    "text-decoration-style": ("solid", "double", "dotted", "dashed", "wavy"),
+}
+
+
+@dataclass
+class _TableStyle:
+    """The resolved style of a rendered table, defaulting to a browser's defaults."""
+
+    font_family: str = DEFAULT_FONT_FAMILY
+    font_size: float = DEFAULT_FONT_SIZE
+    bold: bool = False
+    italic: bool = False
+    border_collapse: str = "separate"
+    border_spacing: float = 2
+    # The table is built with the HTML attribute border="1"
+    border_width: float = 1
+    border_style: str = "solid"
+    border_color: str = "gray"
+    text_transform: str = "none"
+    text_align: str = "left"
+    letter_spacing: float = 0
+    vertical_align: str = "middle"
+    text_decoration_lines: Tuple[str, ...] = ()
+    text_decoration_style: str = "solid"
+    padding: float = 1
+    margin_left: float = 0
+    margin_right: float = 0
+    margin_top: float = 0
+    margin_bottom: float = 0
+    width: float = 0
+    height: float = 0
+    color: Optional[str] = None
+    background_color: Optional[str] = None
+    row_colors: Dict[str, str] = field(default_factory=dict)
+    row_background_colors: Dict[str, str] = field(default_factory=dict)
+    column_colors: Dict[str, str] = field(default_factory=dict)
+    column_background_colors: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class _Cell:
+    """A single cell to render."""
+
+    text: str
+    is_header: bool
+    padding: float
+    color: str
+    background_color: Optional[str]
+
+
+def render_table(
+        table: Table,
+        transformers: TransformerValueCombination,
+) -> Image.Image:
+    """Render a table to an image, applying the passed *transformers*.
+
+    Args:
+        table: The table data to render.
+        transformers: The *transformers* to apply.
+
+    Returns:
+        The rendered table as an RGB image.
+
+    """
+    style: _TableStyle = _resolve_style(transformers.style_parameters)
+    cells: List[List[_Cell]] = _build_cells(table, transformers.structure_parameters, style)
+
+    font, synthetic_bold = _load_font(style.font_family, round(style.font_size), style.bold, style.italic)
+    header_font, synthetic_header_bold = _load_font(style.font_family, round(style.font_size), True, style.italic)
+    line_height: float = _line_height(font)
+
+    def cell_font(cell: _Cell) -> Tuple[ImageFont.FreeTypeFont, bool]:
+        return (header_font, synthetic_header_bold) if cell.is_header else (font, synthetic_bold)
+
+    number_of_columns: int = max((len(row) for row in cells), default=0)
+    border_width: float = style.border_width if _has_border(style) else 0
+    collapse: bool = style.border_collapse == "collapse"
+
+    # Cell sizes, including padding and, in the separated border model, the cell's own borders
+    cell_border: float = 0 if collapse else 2 * border_width
+    column_widths: List[float] = [0.0] * number_of_columns
+    row_heights: List[float] = []
+
+    for row in cells:
+        row_height: float = 0
+
+        for column_index, cell in enumerate(row):
+            text_width: float = _text_width(cell.text, cell_font(cell)[0], style.letter_spacing)
+            column_widths[column_index] = max(
+                column_widths[column_index],
+                text_width + 2 * cell.padding + cell_border,
+            )
+            row_height = max(row_height, line_height + 2 * cell.padding + cell_border)
+
+        row_heights.append(row_height)
+
+    if collapse:
+        gap: float = border_width
+        frame: float = 0
+    else:
+        gap = style.border_spacing
+        frame = border_width
+
+    table_width: float = sum(column_widths) + gap * (number_of_columns + 1) + 2 * frame
+    table_height: float = sum(row_heights) + gap * (len(row_heights) + 1) + 2 * frame
+
+    # Like browsers, distribute additional width proportionally and additional height evenly
+    if style.width > table_width and sum(column_widths):
+        scale: float = (style.width - table_width) / sum(column_widths) + 1
+        column_widths = [width * scale for width in column_widths]
+        table_width = style.width
+
+    if style.height > table_height and row_heights:
+        extra_height: float = (style.height - table_height) / len(row_heights)
+        row_heights = [height + extra_height for height in row_heights]
+        table_height = style.height
+
+    body_line_height: float = DEFAULT_FONT_SIZE * LINE_HEIGHT_FACTOR
+    table_left: float = style.margin_left
+    table_top: float = LINE_BREAKS_AROUND_TABLE * body_line_height + style.margin_top
+    image_width: int = max(1, round(table_left + table_width + style.margin_right))
+    image_height: int = max(
+        1,
+        round(table_top + table_height + style.margin_bottom + LINE_BREAKS_AROUND_TABLE * body_line_height),
+    )
+
+    image: Image.Image = Image.new("RGB", (image_width, image_height), "white")
+    draw: ImageDraw.ImageDraw = ImageDraw.Draw(image)
+
+    if not collapse:
+        _draw_border(
+            draw,
+            (table_left, table_top, table_left + table_width, table_top + table_height),
+            border_width,
+            style.border_style,
+            style.border_color,
+        )
+
+    y: float = table_top + frame + gap
+
+    for row, row_height in zip(cells, row_heights):
+        x: float = table_left + frame + gap
+
+        for cell, column_width in zip(row, column_widths):
+            box: Tuple[float, float, float, float] = (x, y, x + column_width, y + row_height)
+
+            if cell.background_color:
+                draw.rectangle(_pixel_box(box), fill=cell.background_color)
+
+            if not collapse:
+                _draw_border(draw, box, border_width, style.border_style, style.border_color)
+
+            inset: float = cell.padding + (0 if collapse else border_width)
+            _draw_cell_text(
+                draw,
+                cell,
+                (box[0] + inset, box[1] + inset, box[2] - inset, box[3] - inset),
+                cell_font(cell),
+                line_height,
+                style,
+            )
+            x += column_width + gap
+
+        y += row_height + gap
+
+    if collapse:
+        _draw_collapsed_borders(
+            draw,
+            (table_left, table_top),
+            column_widths,
+            row_heights,
+            border_width,
+            style,
+        )
+
+    return image
+
+
+def _resolve_style(style_parameters: Iterable[str]) -> _TableStyle:
+    """Resolve the CSS declarations emitted by *style transformers* into a table style.
+
+    Args:
+        style_parameters: The *style transformer* directives to resolve.
+
+    Returns:
+        The resolved table style.
+
+    """
+    style: _TableStyle = _TableStyle()
+
+    for selectors, css_property, value in parse_css_declarations(style_parameters):  # noqa: WPS110
+        nth_child_match = NTH_CHILD_PATTERN.match(selectors)
+
+        if nth_child_match:
+            element, parity = nth_child_match.groups()
+
+            if css_property not in {"color", "background-color"} or not _is_color(value):
+                continue
+
+            if element == "tr":
+                target = style.row_colors if css_property == "color" else style.row_background_colors
+            else:
+                target = style.column_colors if css_property == "color" else style.column_background_colors
+
+            target[parity] = value
+
+            continue
+
+        _apply_declaration(style, css_property, value)
+
+    return style
+
+
+def _apply_declaration(style: _TableStyle, css_property: str, value: str) -> None:  # noqa: C901, WPS231
+    """Apply a single CSS declaration to a table style, ignoring invalid values like a browser would.
+
+    Args:
+        style: The table style to change.
+        css_property: The CSS property to set.
+        value: The CSS value to set the property to.
+
+    """
+    keyword: str = value.lower()
+
+    if css_property in VALID_KEYWORDS_PER_PROPERTY and keyword not in VALID_KEYWORDS_PER_PROPERTY[css_property]:
+        return
+
+    if css_property == "font-family":
+        style.font_family = value.split(",")[0].strip().strip("\"'")
+    elif css_property == "font-size":
+        style.font_size = _parse_length(value, style.font_size, style.font_size) or style.font_size
+    elif css_property == "font-weight":
+        if keyword in {"bold", "bolder"}:
+            style.bold = True
+        elif keyword in {"normal", "lighter"}:
+            style.bold = False
+        else:
+            try:
+                style.bold = float(keyword) >= 600  # noqa: WPS432
+            except ValueError:
+                return
+    elif css_property == "font-style":
+        style.italic = keyword != "normal"
+    elif css_property == "border-collapse":
+        style.border_collapse = keyword
+    elif css_property == "border-spacing":
+        style.border_spacing = _non_negative(_parse_length(value, style.font_size), style.border_spacing)
+    elif css_property == "border-width":
+        style.border_width = _non_negative(
+            BORDER_WIDTH_KEYWORDS.get(keyword, _parse_length(value, style.font_size)),
+            style.border_width,
+        )
+    elif css_property == "border-style":
+        style.border_style = keyword
+    elif css_property == "border-color":
+        if _is_color(value):
+            style.border_color = value
+    elif css_property == "text-transform":
+        style.text_transform = keyword
+    elif css_property == "text-align":
+        style.text_align = keyword
+    elif css_property == "letter-spacing":
+        spacing = 0 if keyword == "normal" else _parse_length(value, style.font_size)
+        style.letter_spacing = style.letter_spacing if spacing is None else spacing
+    elif css_property == "vertical-align":
+        style.vertical_align = keyword
+    elif css_property == "text-decoration-line":
+        lines: Tuple[str, ...] = tuple(keyword.split())
+
+        if lines == ("none",):
+            style.text_decoration_lines = ()
+        elif lines and set(lines) <= {"underline", "overline", "line-through"}:
+            style.text_decoration_lines = lines
+    elif css_property == "text-decoration-style":
+        style.text_decoration_style = keyword
+    elif css_property == "padding":
+        style.padding = _non_negative(_parse_length(value, style.font_size), style.padding)
+    elif css_property in {"margin-left", "margin-right", "margin-top", "margin-bottom", "width", "height"}:
+        length: Optional[float] = _parse_length(value, style.font_size)
+
+        if length is not None:
+            setattr(style, css_property.replace("-", "_"), length)
+    elif css_property in {"color", "background-color"}:
+        if _is_color(value):
+            setattr(style, css_property.replace("-", "_"), value)
+
+
+def _build_cells(
+        table: Table,
+        structure_parameters: Dict,
+        style: _TableStyle,
+) -> List[List[_Cell]]:
+    """Build the grid of cells to render, applying the *structure transformers*.
+
+    Args:
+        table: The table data to render.
+        structure_parameters: The *structure transformers* to apply.
+        style: The resolved table style.
+
+    Returns:
+        The rows of cells to render, including an optional header row.
+
+    """
+    rows: List[List[str]] = [[str(cell) for cell in row] for row in table]
+
+    if structure_parameters.get("table-orientation", "horizontal") == "vertical":
+        number_of_columns: int = max((len(row) for row in rows), default=0)
+        rows = [
+            [row[column_index] if column_index < len(row) else "" for row in rows]
+            for column_index in range(number_of_columns)
+        ]
+
+    cells: List[List[_Cell]] = []
+
+    if structure_parameters.get("has-header", False):
+        # Like the HTML export, the header holds the column indices
+        header_color: str = style.row_colors.get("odd", "black")
+        header_background_color: Optional[str] = style.row_background_colors.get("odd")
+        cells.append([
+            _Cell(str(column_index), True, 1, header_color, header_background_color)
+            for column_index in range(max((len(row) for row in rows), default=0))
+        ])
+
+    for row_index, row in enumerate(rows):
+        row_parity: str = "odd" if row_index % 2 == 0 else "even"
+        row_cells: List[_Cell] = []
+
+        for column_index, text in enumerate(row):
+            column_parity: str = "odd" if column_index % 2 == 0 else "even"
+            row_cells.append(_Cell(
+                _transform_text(" ".join(text.split()), style.text_transform),
+                False,
+                style.padding,
+                style.column_colors.get(column_parity)
+                or style.color
+                or style.row_colors.get(row_parity)
+                or "black",
+                style.column_background_colors.get(column_parity)
+                or style.background_color
+                or style.row_background_colors.get(row_parity),
+            ))
+
+        cells.append(row_cells)
+
+    return cells
+
+
+def _draw_cell_text(
+        draw: ImageDraw.ImageDraw,
+        cell: _Cell,
+        content_box: Tuple[float, float, float, float],
+        font: Tuple[ImageFont.FreeTypeFont, bool],
+        line_height: float,
+        style: _TableStyle,
+) -> None:
+    """Draw the text of a cell, aligned inside its content box.
+
+    Args:
+        draw: The drawing context to use.
+        cell: The cell to draw the text of.
+        content_box: The cell's box without padding and borders.
+        font: The font to draw with and whether bold needs to be synthesized.
+        line_height: The height of a line of text.
+        style: The resolved table style.
+
+    """
+    if not cell.text:
+        return
+
+    cell_font, synthetic_bold = font
+    left, top, right, bottom = content_box
+    text_width: float = _text_width(cell.text, cell_font, style.letter_spacing)
+
+    # Header cells are right aligned by the HTML export
+    align: str = "right" if cell.is_header else style.text_align
+
+    if align in {"right", "end"}:
+        x: float = right - text_width
+    elif align == "center":
+        x = left + (right - left - text_width) / 2
+    else:
+        x = left
+
+    if style.vertical_align == "middle":
+        y: float = top + (bottom - top - line_height) / 2
+    elif style.vertical_align == "bottom":
+        y = bottom - line_height
+    else:
+        y = top
+
+    # Center the glyphs inside the line box
+    y += (line_height - sum(cell_font.getmetrics())) / 2
+    stroke_width: int = 1 if synthetic_bold else 0
+
+    if style.letter_spacing:
+        character_x: float = x
+
+        for character in cell.text:
+            draw.text(
+                (round(character_x), round(y)),
+                character,
+                font=cell_font,
+                fill=cell.color,
+                stroke_width=stroke_width,
+                stroke_fill=cell.color,
+            )
+            character_x += _text_width(character, cell_font, style.letter_spacing)
+    else:
+        draw.text(
+            (round(x), round(y)),
+            cell.text,
+            font=cell_font,
+            fill=cell.color,
+            stroke_width=stroke_width,
+            stroke_fill=cell.color,
+        )
+
+    ascent, descent = cell_font.getmetrics()
+    thickness: float = max(1.0, style.font_size / 16)
+    decoration_offsets: Dict[str, float] = {
+        "underline": ascent + thickness,
+        "overline": 0,
+        "line-through": ascent * 0.65,
+    }
+
+    for line in style.text_decoration_lines:
+        line_y: float = y + decoration_offsets[line]
+        _draw_line(draw, (x, line_y), x + text_width, thickness, style.text_decoration_style, cell.color)
+
+        if style.text_decoration_style == "double":
+            _draw_line(draw, (x, line_y + 2 * thickness), x + text_width, thickness, "solid", cell.color)
+
+
+def _draw_border(
+        draw: ImageDraw.ImageDraw,
+        box: Tuple[float, float, float, float],
+        width: float,
+        border_style: str,
+        color: str,
+) -> None:
+    """Draw a border along the inside of a box.
+
+    Args:
+        draw: The drawing context to use.
+        box: The outer edges of the border.
+        width: The width of the border.
+        border_style: The CSS border style to draw with.
+        color: The color to draw with.
+
+    """
+    if width <= 0 or border_style in {"none", "hidden"}:
+        return
+
+    left, top, right, bottom = box
+    line_style: str = border_style if border_style in {"dotted", "dashed"} else "solid"
+
+    _draw_line(draw, (left, top), right, width, line_style, color)
+    _draw_line(draw, (left, bottom - width), right, width, line_style, color)
+    _draw_line(draw, (left, top), bottom, width, line_style, color, vertical=True)
+    _draw_line(draw, (right - width, top), bottom, width, line_style, color, vertical=True)
+
+
+def _draw_collapsed_borders(
+        draw: ImageDraw.ImageDraw,
+        origin: Tuple[float, float],
+        column_widths: List[float],
+        row_heights: List[float],
+        width: float,
+        style: _TableStyle,
+) -> None:
+    """Draw the shared grid lines of a table in the collapsing border model.
+
+    Args:
+        draw: The drawing context to use.
+        origin: The top left corner of the table.
+        column_widths: The widths of the table's columns.
+        row_heights: The heights of the table's rows.
+        width: The width of the grid lines.
+        style: The resolved table style.
+
+    """
+    if width <= 0 or style.border_style in {"none", "hidden"}:
+        return
+
+    line_style: str = style.border_style if style.border_style in {"dotted", "dashed"} else "solid"
+    left, top = origin
+    right: float = left + sum(column_widths) + width * (len(column_widths) + 1)
+    bottom: float = top + sum(row_heights) + width * (len(row_heights) + 1)
+
+    x: float = left
+
+    for column_width in [*column_widths, 0]:
+        _draw_line(draw, (x, top), bottom, width, line_style, style.border_color, vertical=True)
+        x += column_width + width
+
+    y: float = top
+
+    for row_height in [*row_heights, 0]:
+        _draw_line(draw, (left, y), right, width, line_style, style.border_color)
+        y += row_height + width
+
+
+def _draw_line(
+        draw: ImageDraw.ImageDraw,
+        start: Tuple[float, float],
+        end: float,
+        thickness: float,
+        line_style: str,
+        color: str,
+        vertical: bool = False,
+) -> None:
+    """Draw an axis-aligned line as a series of rectangles.
+
+    Args:
+        draw: The drawing context to use.
+        start: The top left corner of the line.
+        end: The x (or y, if vertical) coordinate the line ends at.
+        thickness: The thickness of the line.
+        line_style: ``"dotted"``, ``"dashed"`` or any other style, which is drawn solid.
+        color: The color to draw with.
+        vertical: Whether to draw a vertical instead of a horizontal line.
+
+    """
+    x, y = start
+    position: float = y if vertical else x
+    dash_length: float = {"dotted": thickness, "dashed": 3 * thickness}.get(line_style, end - position)
+    gap_length: float = thickness if line_style == "dotted" else 2 * thickness
+
+    while position < end:
+        dash_end: float = min(position + dash_length, end)
+
+        if vertical:
+            draw.rectangle(_pixel_box((x, position, x + thickness, dash_end)), fill=color)
+        else:
+            draw.rectangle(_pixel_box((position, y, dash_end, y + thickness)), fill=color)
+
+        position = dash_end + gap_length
+
+
+def _pixel_box(box: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
+    """Round a box with an exclusive bottom right corner to the inclusive pixel box PIL expects."""
+    left, top, right, bottom = (round(coordinate) for coordinate in box)
+
+    return left, top, max(left, right - 1), max(top, bottom - 1)
+
+
+def _has_border(style: _TableStyle) -> bool:
+    return style.border_width > 0 and style.border_style not in {"none", "hidden"}
+
+
+def _transform_text(text: str, text_transform: str) -> str:
+    """Apply a CSS text-transform to a text."""
+    if text_transform == "uppercase":
+        return text.upper()
+    if text_transform == "lowercase":
+        return text.lower()
+    if text_transform == "capitalize":
+        return " ".join(word[:1].upper() + word[1:] for word in text.split(" "))
+
+    return text
+
+
+def _parse_length(value: str, font_size: float, reference: float = 0) -> Optional[float]:  # noqa: WPS110
+    """Convert a CSS length to pixels.
+
+    Args:
+        value: The CSS length to convert, e.g. ``"12px"``.
+        font_size: The font size to resolve ``em`` and ``rem`` units against.
+        reference: The length to resolve percentages against.
+
+    Returns:
+        The length in pixels, or None if value is not a valid CSS length.
+
+    """
+    match = LENGTH_PATTERN.match(value.strip().lower())
+
+    if not match:
+        return None
+
+    number: float = float(match.group(1))
+    unit: Optional[str] = match.group(2)
+
+    # Like in CSS, only 0 may omit its unit
+    if unit is None:
+        return number if number == 0 else None
+
+    factors: Dict[str, float] = {
+        "px": 1,
+        "pt": 4 / 3,
+        "em": font_size,
+        "rem": DEFAULT_FONT_SIZE,
+        "%": reference / 100,
+    }
+
+    return number * factors[unit]
+
+
+def _non_negative(length: Optional[float], default: float) -> float:
+    return default if length is None or length < 0 else length
+
+
+def _is_color(value: str) -> bool:  # noqa: WPS110
+    try:
+        ImageColor.getrgb(value)
+    except ValueError:
+        return False
+
+    return True
+
+
+@lru_cache(maxsize=None)
+def _load_font(family: str, size: int, bold: bool, italic: bool) -> Tuple[ImageFont.FreeTypeFont, bool]:
+    """Load the font best matching a CSS font specification.
+
+    Args:
+        family: The CSS font family.
+        size: The font size in pixels.
+        bold: Whether a bold font is requested.
+        italic: Whether an italic font is requested.
+
+    Returns:
+        The loaded font and whether bold needs to be synthesized, because no bold font file was found.
+
+    """
+    font_file, has_bold_file = _find_font_file(family.lower(), bold, italic)
+
+    if font_file is None:
+        try:
+            return ImageFont.load_default(size), bold
+        # Pillow versions before 10.1 only offer a fixed size bitmap font
+        except TypeError:
+            return ImageFont.load_default(), bold
+
+    return ImageFont.truetype(font_file, max(1, size)), bold and not has_bold_file
+
+
+@lru_cache(maxsize=None)
+def _find_font_file(family: str, bold: bool, italic: bool) -> Tuple[Optional[str], bool]:
+    """Find a font file for a font family and variant, preferring exact variants over the regular one.
+
+    Args:
+        family: The lowercased CSS font family.
+        bold: Whether a bold font is requested.
+        italic: Whether an italic font is requested.
+
+    Returns:
+        The path of the font file, if one was found, and whether the file is a bold variant.
+
+    """
+    variants: List[Tuple[bool, bool]] = list(
+        dict.fromkeys([(bold, italic), (bold, False), (False, italic), (False, False)]),
+    )
+
+    for base_name in FONT_FILES_PER_FAMILY.get(family, ()) + FALLBACK_FONT_FILES:
+        for variant in variants:
+            for suffix in FONT_FILE_SUFFIXES[variant]:
+                try:
+                    return ImageFont.truetype(f"{base_name}{suffix}.ttf").path, variant[0]
+                except OSError:
+                    continue
+
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _line_height(font: ImageFont.FreeTypeFont) -> float:
+    return max(sum(font.getmetrics()), font.size * LINE_HEIGHT_FACTOR)
+
+
+@lru_cache(maxsize=65536)  # noqa: WPS432
+def _text_width(text: str, font: ImageFont.FreeTypeFont, letter_spacing: float) -> float:
+    """Measure the width of a text, caching the result.
+
+    Args:
+        text: The text to measure.
+        font: The font to measure with.
+        letter_spacing: Additional space after every character.
+
+    Returns:
+        The width of the rendered text in pixels.
+
+    """
+    if not letter_spacing:
+        return font.getlength(text)
+
+    return sum(font.getlength(character) for character in text) + letter_spacing * len(text)
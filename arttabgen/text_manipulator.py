@@ -4,29 +4,18 @@ TEXT_MANIPULATORS: A list of all text manipulators.
 """
 import random
 import string
-from functools import partial
-from typing import Callable, List, Optional, Tuple
-
-import editdistance
-import nltk
-from nltk.corpus import wordnet
-from nltk.corpus.reader.wordnet import WordNetError
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import arttabgen.types_.config_main_keys
-from arttabgen import config_handler, helper
-from arttabgen.helper import PAIRS_OF_SIMILAR_LOOKING_LETTERS, QWERTY_KEYS, WORDS
-
-try:
-    nltk.data.find("wordnet")
-except LookupError:
-    nltk.download("wordnet", quiet=True)
-try:
-    nltk.data.find("omw-1.4")
-except LookupError:
-    nltk.download("omw-1.4", quiet=True)
-
-wordnet_synsets: List = list(wordnet.all_synsets("n"))
+from arttabgen import config_handler, corpora, helper
+from arttabgen.helper import PAIRS_OF_SIMILAR_LOOKING_LETTERS, QWERTY_KEYS
+from arttabgen.semantic_neighbour_index import SemanticNeighbourIndex
+from arttabgen.word_index import WordIndex
+
 ALPHABET: List[str] = list(string.ascii_lowercase)
+_word_indices: List[Tuple[Sequence[str], WordIndex]] = []
+_semantic_neighbour_indices: Dict[Tuple[float, float, Optional[Path]], SemanticNeighbourIndex] = {}
 
 
 def remove_random_word(text: str) -> str:
@@ -249,9 +238,7 @@ def replace_random_word_with_similar_one(text: str) -> str:
 
     rand_word: str = input_words[rand_word_index]
 
-    reference_words_sorted_by_similarity: List[str] = sorted(
-        WORDS, key=partial(editdistance.eval, b=rand_word)
-    )
+    reference_words_sorted_by_similarity: List[str] = _word_index().nearest(rand_word, 6)
 
     new_word_pool: List[str] = reference_words_sorted_by_similarity[:5]
 
@@ -259,7 +246,7 @@ def replace_random_word_with_similar_one(text: str) -> str:
 
     if rand_word in new_word_pool:
         new_word_pool.remove(rand_word)
-        new_word_pool += reference_words_sorted_by_similarity[5]
+        new_word_pool += reference_words_sorted_by_similarity[5:]
 
     new_word: str = random.choice(new_word_pool)
 
@@ -291,32 +278,73 @@ def replace_word_with_semantically_similar_one(text: str) -> str:
 
     rand_word: str = input_words[rand_word_index]
 
+    from nltk.corpus.reader.wordnet import WordNetError  # noqa: WPS433
+
     try:
-        synset_orig = wordnet.synset(f"{rand_word}.n.01")
+        synset_orig = corpora.wordnet().synset(f"{rand_word}.n.01")
     # Chosen word is not part of wordnet
     except WordNetError:
         return text
 
-    random.shuffle(wordnet_synsets)
+    # https://stackoverflow.com/questions/21902411/how-to-get-domain-of-words-using-wordnet-in-py
+    synset_candidate = _semantic_neighbour_index().random_neighbour(synset_orig)
 
-    for synset_candidate in wordnet_synsets:
+    if synset_candidate is None:
+        return text
 
-        # https://stackoverflow.com/questions/21902411/how-to-get-domain-of-words-using-wordnet-in-py
+    input_words[rand_word_index] = synset_candidate.lemmas()[0].name()
 
-        if (
-                config_handler.config_handler.config[
-                    arttabgen.types_.config_main_keys.ConfigMainKeys.SEMANTIC_WORD_REPLACEMENT_MIN_SIMILARITY
-                ]
-                < synset_orig.path_similarity(synset_candidate)
-                < config_handler.config_handler.config[
-            arttabgen.types_.config_main_keys.ConfigMainKeys.SEMANTIC_WORD_REPLACEMENT_MAX_SIMILARITY
-        ]
-        ):
-            input_words[rand_word_index] = synset_candidate.lemmas()[0].name()
+    return " ".join(input_words)
 
-            return " ".join(input_words)
 
-    return text
+def _word_index() -> WordIndex:
+    """Get the index of :data:`arttabgen.helper.WORDS`, which is built on first use.
+
+    Returns:
+        The index of the current word list.
+
+    """
+    words: Sequence[str] = helper.WORDS
+
+    # The word list is kept with its index, so a replaced list, e.g. by a test, is indexed anew
+    if _word_indices and _word_indices[0][0] is words:
+        return _word_indices[0][1]
+
+    _word_indices[:] = [(words, WordIndex(words))]
+
+    return _word_indices[0][1]
+
+
+def _semantic_neighbour_index() -> SemanticNeighbourIndex:
+    """Get the index of the noun synsets within the configured band of similarity, which is built on first use.
+
+    Returns:
+        The index for the configured similarity bounds.
+
+    """
+    min_similarity: float = config_handler.config_handler.config[
+        arttabgen.types_.config_main_keys.ConfigMainKeys.SEMANTIC_WORD_REPLACEMENT_MIN_SIMILARITY
+    ]
+    max_similarity: float = config_handler.config_handler.config[
+        arttabgen.types_.config_main_keys.ConfigMainKeys.SEMANTIC_WORD_REPLACEMENT_MAX_SIMILARITY
+    ]
+    index_key: Tuple[float, float, Optional[Path]] = (min_similarity, max_similarity, corpora.cache_dir)
+
+    if index_key not in _semantic_neighbour_indices:
+        cache_file: Optional[Path] = None
+
+        if corpora.cache_dir is not None:
+            cache_file = Path(
+                corpora.cache_dir,
+                "semantic_neighbours",
+                f"wordnet-{corpora.wordnet().get_version()}_{min_similarity}_{max_similarity}.jsonl",
+            )
+
+        _semantic_neighbour_indices[index_key] = SemanticNeighbourIndex(
+            corpora.noun_synset_names(), corpora.wordnet().synset, min_similarity, max_similarity, cache_file
+        )
+
+    return _semantic_neighbour_indices[index_key]
 
 
 TEXT_MANIPULATORS: List[Callable[[str], str]] = [
@@ -0,0 +1,93 @@
+"""Holds the TransformerSampler class, which draws random *transformer* combinations for the ``SELECTIVE`` strategy.
+
+The parameter declarations of the config are parsed once and the directives of discrete parameters are built
+in advance, so drawing a combination only picks values.
+"""
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import dacite
+
+from arttabgen.helper import random_value_from_continuous, random_value_from_discrete
+from arttabgen.transformers import structure_transformer, style_transformer
+from arttabgen.types_.config_main_keys import ConfigMainKeys
+from arttabgen.types_.structure_parameter import StructureParameter
+from arttabgen.types_.style_parameter import StyleParameter
+from arttabgen.types_.transformer_value_combination import TransformerValueCombination
+
+
+class _StyleParameterSampler:  # noqa: D101
+    def __init__(self, parameter: StyleParameter) -> None:
+        """Draws the directive of a *style parameter*.
+
+        Args:
+            parameter: The declaration of the style parameter.
+
+        """
+        self.transformer: Callable[[Any, str], str] = style_transformer.STYLE_TRANSFORMERS[parameter.name]
+        self.unit: str = parameter.unit
+        self.continuous_value: Optional[Dict[str, Union[int, float]]] = None
+        self.directives: List[str] = []
+
+        if isinstance(parameter.value, List):
+            self.directives = [self.transformer(value, self.unit) for value in parameter.value]
+        else:
+            self.continuous_value = parameter.value
+
+    def sample(self) -> str:
+        """Draw a directive, with the same random values as :func:`arttabgen.config_handler.build_style_transformers`.
+
+        Returns:
+            The directive of a random value of the parameter.
+
+        """
+        if self.continuous_value is None:
+            return random_value_from_discrete(self.directives)
+
+        return self.transformer(random_value_from_continuous(self.continuous_value), self.unit)
+
+
+class TransformerSampler:  # noqa: D101
+    def __init__(self, config: Dict) -> None:
+        """Draws random *transformer* combinations for the ``SELECTIVE`` transformer application strategy.
+
+        Args:
+            config: A deserialized config containing transformer configurations.
+
+        See also:
+            | :ref:`Transformers`
+            | :ref:`Transformer application strategies`
+
+        """
+        self.style_parameter_samplers: List[_StyleParameterSampler] = [
+            _StyleParameterSampler(dacite.from_dict(data_class=StyleParameter, data=parameter))
+            for parameter in config[ConfigMainKeys.STYLE_PARAMETERS]
+        ]
+
+        structure_parameters: List[StructureParameter] = [
+            dacite.from_dict(data_class=StructureParameter, data=parameter)
+            for parameter in config[ConfigMainKeys.STRUCTURE_PARAMETERS]
+        ]
+        self.structure_directives: Dict[str, List[Union[str, bool]]] = {
+            parameter.name: [
+                structure_transformer.STRUCTURE_TRANSFORMERS[parameter.name](value) for value in parameter.value
+            ]
+            for parameter in structure_parameters
+        }
+
+    def sample(self) -> TransformerValueCombination:
+        """Draw a combination.
+
+        The random values are drawn from Python's random generator in the same order as
+        :func:`arttabgen.config_handler.build_style_transformers` and
+        :func:`arttabgen.config_handler.build_structure_transformers`, so the combinations are identical.
+
+        Returns:
+            A random transformer combination.
+
+        """
+        style_parameters: List[str] = [sampler.sample() for sampler in self.style_parameter_samplers]
+        structure_parameters: Dict[str, Union[str, bool]] = {
+            name: random_value_from_discrete(directives) for name, directives in self.structure_directives.items()
+        }
+
+        return TransformerValueCombination(style_parameters, structure_parameters)
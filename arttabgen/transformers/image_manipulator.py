@@ -3,16 +3,19 @@
 IMAGE_MANIPULATORS: A list of all functions.
 IMAGE_MANIPULATORS_BY_MODE: A mapping of table generation modes to image manipulators,
                             which can be used in each mode.
+RANDOM_IMAGE_MANIPULATORS: The image manipulators drawing random values.
 """
 
-from typing import Any, Callable, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-import cv2 as cv
 import numpy as np
-from PIL import Image
 
+# OpenCV and Pillow are only imported once an image is manipulated, exports without images don't need them
+if TYPE_CHECKING:
+    from PIL import Image
 
-def process_image_blur(image: Image, value: int) -> Image.Image:
+
+def process_image_blur(image: "Image.Image", value: int) -> "Image.Image":
     """Apply a blur effect on an image.
 
     Args:
@@ -23,6 +26,9 @@ def process_image_blur(image: Image, value: int) -> Image.Image:
         The processed image.
     """
 
+    import cv2 as cv  # noqa: WPS433
+    from PIL import Image  # noqa: WPS433, WPS442
+
     img_raw = np.array(image)
     img_raw = cv.cvtColor(img_raw, cv.COLOR_RGB2BGR)
     # validation of `value` is done by OpenCV
@@ -31,7 +37,7 @@ def process_image_blur(image: Image, value: int) -> Image.Image:
     return Image.fromarray(img_raw)
 
 
-def process_image_contrast(image: Image, value: float) -> Image.Image:
+def process_image_contrast(image: "Image.Image", value: float) -> "Image.Image":
     """Apply a contrast change to an image.
 
     Args:
@@ -43,6 +49,9 @@ def process_image_contrast(image: Image, value: float) -> Image.Image:
         The processed image.
     """
 
+    import cv2 as cv  # noqa: WPS433
+    from PIL import Image  # noqa: WPS433, WPS442
+
     img_raw = np.array(image)
     img_raw = cv.cvtColor(img_raw, cv.COLOR_RGB2BGR)
     img_raw = cv.convertScaleAbs(img_raw, alpha=value, beta=0)
@@ -50,7 +59,7 @@ def process_image_contrast(image: Image, value: float) -> Image.Image:
     return Image.fromarray(img_raw)
 
 
-def process_image_brightness(image: Image, value: int) -> Image.Image:
+def process_image_brightness(image: "Image.Image", value: int) -> "Image.Image":
     """Apply a brightness change to an image.
 
     Args:
@@ -62,6 +71,9 @@ def process_image_brightness(image: Image, value: int) -> Image.Image:
         The processed image.
     """
 
+    import cv2 as cv  # noqa: WPS433
+    from PIL import Image  # noqa: WPS433, WPS442
+
     img_raw = np.array(image)
     img_raw = cv.cvtColor(img_raw, cv.COLOR_RGB2BGR)
     img_raw = cv.convertScaleAbs(img_raw, alpha=1, beta=value)
@@ -69,26 +81,32 @@ def process_image_brightness(image: Image, value: int) -> Image.Image:
     return Image.fromarray(img_raw)
 
 
-def process_image_noise(image: Image, value: float) -> Image.Image:
+def process_image_noise(
+        image: "Image.Image", value: float, rng: Optional[np.random.Generator] = None
+) -> "Image.Image":
     """Apply a noise effect on an image.
 
     Args:
         image: Path of the image to be adjusted
         value: Probability.
+        rng: The random generator to draw the noise from, NumPy's global one if None.
 
     Returns:
         The processed image.
     """
 
+    import cv2 as cv  # noqa: WPS433
+    from PIL import Image  # noqa: WPS433, WPS442
+
     img_raw = np.asarray(image)
     img_raw = cv.cvtColor(img_raw, cv.COLOR_RGB2BGR)
 
-    img_raw = _add_sp_noise(img_raw, value)
+    img_raw = _add_sp_noise(img_raw, value, rng)
 
     return Image.fromarray(img_raw)
 
 
-def process_image_sharpness(image: Image) -> Image.Image:
+def process_image_sharpness(image: "Image.Image") -> "Image.Image":
     """Apply a sharpness change to an image.
 
     Args:
@@ -98,6 +116,9 @@ def process_image_sharpness(image: Image) -> Image.Image:
         The processed image.
     """
 
+    import cv2 as cv  # noqa: WPS433
+    from PIL import Image  # noqa: WPS433, WPS442
+
     img_raw = np.array(image)
     img_raw = cv.cvtColor(img_raw, cv.COLOR_RGB2BGR)
     kernel = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]])
@@ -106,7 +127,9 @@ def process_image_sharpness(image: Image) -> Image.Image:
     return Image.fromarray(img_raw)
 
 
-def _add_sp_noise(img_raw: np.array, prob: float) -> np.array:
+def _add_sp_noise(
+        img_raw: np.array, prob: float, rng: Optional[np.random.Generator] = None
+) -> np.array:
     """Apply salt and pepper noise to an image.
 
     https://gist.github.com/lucaswiman/1e877a164a69f78694f845eab45c381a
@@ -114,6 +137,7 @@ def _add_sp_noise(img_raw: np.array, prob: float) -> np.array:
     Args:
         img_raw: Path of the image to be adjusted.
         prob: Probability of a pixel being altered.
+        rng: The random generator to draw the noise from, NumPy's global one if None.
 
     Returns:
         An Image with salt and pepper noise applied.
@@ -131,14 +155,14 @@ def _add_sp_noise(img_raw: np.array, prob: float) -> np.array:
         else:  # RGBA
             black = np.array([0, 0, 0, 255], dtype="uint8")
             white = np.array([255, 255, 255, 255], dtype="uint8")
-    probs = np.random.random(img_raw.shape[:2])
+    probs = (rng or np.random).random(img_raw.shape[:2])
     img_raw[probs < (prob / 2)] = black
     img_raw[probs > 1 - (prob / 2)] = white
 
     return img_raw
 
 
-IMAGE_MANIPULATORS: Dict[str, Callable[[Any, Any], Image.Image]] = {
+IMAGE_MANIPULATORS: Dict[str, Callable[[Any, Any], "Image.Image"]] = {
     "blur": process_image_blur,
     "contrast": process_image_contrast,
     "brightness": process_image_brightness,
@@ -154,3 +178,6 @@ IMAGE_MANIPULATORS_BY_MODE: Dict[int, List[str]] = {
     4: ["blur", "contrast", "brightness", "sharpness", "noise"],
 }
 """Maps table generation modes to the image manipulators, which can be used in that mode."""
+
+RANDOM_IMAGE_MANIPULATORS: Tuple[str, ...] = ("noise",)
+"""The image manipulators drawing random values, which take the random generator to use as ``rng``."""
@@ -0,0 +1,69 @@
+"""Holds the WebDriverPool class, which shares a fixed number of WebDrivers between concurrent exports."""
+import queue
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, List
+
+# Selenium is only imported once a browser is needed, see TableExporter._checkout_webdriver
+if TYPE_CHECKING:
+    from selenium.webdriver.firefox.webdriver import WebDriver
+
+
+class WebDriverPool:  # noqa: D101
+    def __init__(
+            self,
+            size: int,
+            webdriver_factory: Callable[[], "WebDriver"],
+    ) -> None:
+        """Offers checkout and return of a fixed number of WebDrivers.
+
+        Every WebDriver controls its own browser process, so exports holding different WebDrivers
+        render in parallel.
+
+        Args:
+            size: The number of WebDrivers to create.
+            webdriver_factory: A function creating and configuring a single WebDriver.
+
+        Raises:
+            ValueError: If size is smaller than 1.
+            Exception: The error of a failed webdriver_factory call. The WebDrivers created before are quit.
+
+        """
+        if size < 1:
+            raise ValueError(f"A WebDriver pool needs at least one WebDriver, got {size}")
+
+        self.size: int = size
+        self.webdrivers: List["WebDriver"] = []
+
+        try:
+            for _ in range(size):
+                self.webdrivers.append(webdriver_factory())
+        except BaseException:
+            self.quit()
+            raise
+
+        self._available_webdrivers: "queue.Queue[WebDriver]" = queue.Queue()
+
+        for driver in self.webdrivers:
+            self._available_webdrivers.put(driver)
+
+    @contextmanager
+    def checkout(self) -> Iterator["WebDriver"]:
+        """Check out a WebDriver for exclusive use, blocking until one is available.
+
+        The WebDriver is returned to the pool when the context is left.
+
+        Yields:
+            A WebDriver no other caller is using.
+
+        """
+        driver: "WebDriver" = self._available_webdrivers.get()
+
+        try:
+            yield driver
+        finally:
+            self._available_webdrivers.put(driver)
+
+    def quit(self) -> None:
+        """Quit all WebDrivers and their browser processes."""
+        for driver in self.webdrivers:
+            driver.quit()
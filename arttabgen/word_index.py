@@ -0,0 +1,101 @@
+"""Holds the WordIndex class, which finds the words closest to a word by edit distance.
+
+Types:
+    WordIndex
+"""
+import string
+from typing import List, Sequence, Tuple
+
+import editdistance
+import numpy as np
+
+_NUMBER_OF_LETTER_CODES: int = len(string.ascii_lowercase) + 1
+"""Every lowercase ASCII letter has its own code, all other characters share the last one."""
+
+
+class WordIndex:  # noqa: D101
+    def __init__(self, words: Sequence[str]) -> None:
+        """An index of words, which finds the words closest to a word without computing all edit distances.
+
+        The letter counts of two words bound their edit distance from below, as every edit changes
+        at most two counts by one. The edit distance is only computed for words whose bound
+        is within the distance searched, which for most words are few.
+
+        Args:
+            words: The words to index.
+
+        """
+        self.words: Sequence[str] = words
+        self.lengths: np.ndarray = np.fromiter(map(len, words), dtype=np.int16, count=len(words))
+
+        word_indices: np.ndarray = np.repeat(np.arange(len(words)), self.lengths)
+
+        # One contiguous row per letter, as a search only reads the rows of the searched word's letters
+        self.letter_counts: np.ndarray = np.bincount(
+            _letter_codes("".join(words)) * len(words) + word_indices,
+            minlength=_NUMBER_OF_LETTER_CODES * len(words),
+        ).astype(np.int16).reshape(_NUMBER_OF_LETTER_CODES, len(words))
+
+    def nearest(self, word: str, number_of_words: int) -> List[str]:
+        """Find the words closest to a word.
+
+        Args:
+            word: The word to search around.
+            number_of_words: The number of words to find.
+
+        Returns:
+            The closest words by edit distance, words with equal distance in the order they were indexed,
+            like ``sorted(words, key=partial(editdistance.eval, b=word))[:number_of_words]``.
+
+        """
+        lower_bounds: np.ndarray = self._distance_lower_bounds(word)
+        matches: List[Tuple[int, int]] = []
+        number_of_checked_words: int = 0
+        distance: int = 0
+
+        # Words are checked by increasing bound, until enough of them are at most as distant as any unchecked one
+        while number_of_checked_words < len(self.words):
+            candidates: np.ndarray = np.flatnonzero(lower_bounds == distance)
+            number_of_checked_words += len(candidates)
+            matches.extend(
+                (editdistance.eval(word, self.words[word_index]), word_index) for word_index in candidates.tolist()
+            )
+
+            if sum(match_distance <= distance for match_distance, _ in matches) >= number_of_words:
+                break
+
+            distance += 1
+
+        return [self.words[word_index] for _, word_index in sorted(matches)[:number_of_words]]
+
+    def _distance_lower_bounds(self, word: str) -> np.ndarray:
+        """Bound the edit distances of a word to the indexed words from below.
+
+        Args:
+            word: The word to bound the distances of.
+
+        Returns:
+            Half the sum of the differences of the letter counts and of the lengths for every indexed word.
+
+        """
+        word_letter_counts: np.ndarray = np.bincount(_letter_codes(word), minlength=_NUMBER_OF_LETTER_CODES)
+        # The counts of letters missing from the word add up to the length minus the counts of its letters
+        differences: np.ndarray = self.lengths.copy()
+
+        for letter_code in np.flatnonzero(word_letter_counts).tolist():
+            letter_count: np.ndarray = self.letter_counts[letter_code]
+            differences -= letter_count
+            differences += np.abs(letter_count - int(word_letter_counts[letter_code]))
+
+        differences += np.abs(self.lengths - len(word))
+
+        return differences // 2
+
+
+def _letter_codes(text: str) -> np.ndarray:
+    """Map the characters of a text to their letter codes, see :data:`_NUMBER_OF_LETTER_CODES`."""
+    characters: np.ndarray = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+    letter_codes: np.ndarray = characters - ord("a")
+    letter_codes[(letter_codes < 0) | (letter_codes >= len(string.ascii_lowercase))] = len(string.ascii_lowercase)
+
+    return letter_codes
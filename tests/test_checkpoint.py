@@ -0,0 +1,45 @@
+import random
+from pathlib import Path
+
+import numpy as np
+
+from arttabgen.checkpoint import (
+    capture_checkpoint,
+    load_checkpoint,
+    restore_random_state,
+    save_checkpoint,
+)
+
+
+class TestRandomState:
+    def test_restore(self):
+        random.seed(1)
+        np.random.seed(1)
+        checkpoint = capture_checkpoint(3, 1)
+        expected = (random.random(), np.random.random())
+
+        random.seed(2)
+        np.random.seed(2)
+        restore_random_state(checkpoint)
+
+        assert (random.random(), np.random.random()) == expected
+
+
+class TestSaveCheckpoint:
+    def test_save_and_load(self, tmp_path: Path):
+        checkpoint_file = Path(tmp_path, "checkpoint.json")
+        random.seed(1)
+        checkpoint = capture_checkpoint(3, 1)
+
+        save_checkpoint(checkpoint, checkpoint_file)
+
+        assert load_checkpoint(checkpoint_file) == checkpoint
+        assert list(tmp_path.iterdir()) == [checkpoint_file]
+
+    def test_replaces_previous_checkpoint(self, tmp_path: Path):
+        checkpoint_file = Path(tmp_path, "checkpoint.json")
+
+        save_checkpoint(capture_checkpoint(3, 1), checkpoint_file)
+        save_checkpoint(capture_checkpoint(6, 1), checkpoint_file)
+
+        assert load_checkpoint(checkpoint_file).num_completed_tables == 6
@@ -0,0 +1,55 @@
+import itertools
+
+import pytest
+
+from arttabgen.combination_space import CombinationSpace, LazyPermutation
+
+STYLE_TRANSFORMERS = [["a1", "a2"], ["b1", "b2", "b3"]]
+STRUCTURE_TRANSFORMERS = [[{"x": 1}, {"x": 2}], [{"y": True}, {"y": False}]]
+
+
+class TestCombinationSpace:
+    def test_same_order_as_product(self):
+        space = CombinationSpace(STYLE_TRANSFORMERS, STRUCTURE_TRANSFORMERS)
+
+        assert len(space) == 24
+        assert [
+                   (combination.style_parameters, combination.structure_parameters)
+                   for combination in space
+               ] == [
+                   (list(combination[:2]), {**combination[2], **combination[3]})
+                   for combination in itertools.product(*STYLE_TRANSFORMERS, *STRUCTURE_TRANSFORMERS)
+               ]
+
+    def test_structure_parameters_are_not_shared(self):
+        space = CombinationSpace(STYLE_TRANSFORMERS, STRUCTURE_TRANSFORMERS)
+
+        space[0].structure_parameters["x"] = 3
+
+        assert space[0].structure_parameters == {"x": 1, "y": True}
+        assert STRUCTURE_TRANSFORMERS[0][0] == {"x": 1}
+
+    def test_index_out_of_range(self):
+        space = CombinationSpace(STYLE_TRANSFORMERS, STRUCTURE_TRANSFORMERS)
+
+        with pytest.raises(IndexError):
+            space[24]
+
+
+class TestLazyPermutation:
+    @pytest.mark.parametrize("size", [0, 1, 2, 7, 64, 1000])
+    def test_is_permutation(self, size):
+        permutation = LazyPermutation(size, 3)
+
+        assert sorted(permutation[index] for index in range(size)) == list(range(size))
+
+    def test_depends_on_seed(self):
+        first = [LazyPermutation(1000, 1)[index] for index in range(1000)]
+        second = [LazyPermutation(1000, 2)[index] for index in range(1000)]
+
+        assert first != second
+        assert first != list(range(1000))
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            LazyPermutation(5, 0)[5]
@@ -0,0 +1,59 @@
+import random
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from arttabgen import corpora, helper
+from arttabgen.corpora import WordBlob
+
+
+class TestWordBlob:
+    def test_same_as_written_words(self, tmp_path: Path):
+        words = ["ab", "über", "", "cd-e"]
+        WordBlob.write(Path(tmp_path, "words.txt"), words)
+
+        blob = WordBlob(Path(tmp_path, "words.txt"))
+
+        assert len(blob) == 4
+        assert list(blob) == words
+        assert blob[-1] == "cd-e"
+        assert blob[1:3] == ["über", ""]
+
+    def test_no_words(self, tmp_path: Path):
+        WordBlob.write(Path(tmp_path, "words.txt"), [])
+
+        assert list(WordBlob(Path(tmp_path, "words.txt"))) == []
+
+    def test_index_out_of_range(self, tmp_path: Path):
+        WordBlob.write(Path(tmp_path, "words.txt"), ["ab"])
+
+        with pytest.raises(IndexError):
+            WordBlob(Path(tmp_path, "words.txt"))[1]
+
+    def test_sample_same_as_list(self, tmp_path: Path):
+        words = [f"word{index}" for index in range(100)]
+        WordBlob.write(Path(tmp_path, "words.txt"), words)
+
+        random.seed(3)
+        sample = random.sample(words, 2)
+        random.seed(3)
+
+        assert random.sample(WordBlob(Path(tmp_path, "words.txt")), 2) == sample
+
+
+class TestWords:
+    def test_compiled_into_cache_dir(self, tmp_path: Path, mocker: MockerFixture):
+        mocker.patch("arttabgen.corpora.cache_dir", tmp_path)
+        mocker.patch("arttabgen.corpora._ensure_nltk_resource")
+        corpus_words = mocker.patch("nltk.corpus.words.words", return_value=["b", "A", "a", "c"])
+        corpora.words.cache_clear()
+
+        try:
+            assert helper.WORDS == ["a", "b", "c"]
+            corpora.words.cache_clear()
+            assert isinstance(helper.WORDS, WordBlob)
+            assert list(helper.WORDS) == ["a", "b", "c"]
+            corpus_words.assert_called_once()
+        finally:
+            corpora.words.cache_clear()
@@ -0,0 +1,60 @@
+import json
+import random
+from pathlib import Path
+
+from arttabgen import css_compiler, table_renderer
+from arttabgen.transformer_sampler import TransformerSampler
+
+
+class TestCompileStylesheet:
+    def test_merges_rules_with_equal_selectors(self):
+        stylesheet = css_compiler.compile_stylesheet(
+            [
+                "table, tr, td {font-size: 14px;}",
+                "table {width: 50%;}",
+                "table,tr,td {font-style: italic;}",
+                "table {height: 20%;}",
+            ]
+        )
+
+        assert stylesheet == (
+            "table, tr, td {font-size: 14px; font-style: italic;}\n"
+            "table {width: 50%; height: 20%;}"
+        )
+
+    def test_drops_overridden_declarations(self):
+        stylesheet = css_compiler.compile_stylesheet(
+            ["td {color: red;}", "td {color: blue;}", "td {color: blue;}"]
+        )
+
+        assert stylesheet == "td {color: blue;}"
+
+    def test_keeps_order_of_conflicting_declarations(self):
+        stylesheet = css_compiler.compile_stylesheet(
+            [
+                "td {color: red;}",
+                "tr:nth-child(even) {color: green;}\ntr:nth-child(odd) {color: black;}",
+                "td {color: blue;}",
+            ]
+        )
+
+        assert stylesheet == (
+            "td {color: red;}\n"
+            "tr:nth-child(even) {color: green;}\n"
+            "tr:nth-child(odd) {color: black;}\n"
+            "td {color: blue;}"
+        )
+
+    def test_no_directives(self):
+        assert css_compiler.compile_stylesheet([]) == ""
+
+    def test_resolves_to_same_style(self):
+        sampler = TransformerSampler(json.loads(Path("data", "default_config.json").read_text()))
+        random.seed(3)
+
+        for _ in range(20):
+            style_parameters = sampler.sample().style_parameters
+
+            assert table_renderer._resolve_style(  # noqa: WPS437
+                [css_compiler.compile_stylesheet(style_parameters)]
+            ) == table_renderer._resolve_style(style_parameters)  # noqa: WPS437
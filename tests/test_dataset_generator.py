@@ -1,9 +1,13 @@
+import random
+import threading
 from pathlib import Path
 
+import pytest
 from pytest_mock import MockerFixture, MockFixture
 
+from arttabgen.checkpoint import capture_checkpoint
 from arttabgen.config_handler import ConfigHandler
-from arttabgen.dataset_generator import DatasetGenerator
+from arttabgen.dataset_generator import DatasetGenerator, GenerationAbortedError
 from arttabgen.progress_printer import ProgressPrinter
 from arttabgen.table_exporter import TableExporter
 from arttabgen.table_generator import TableGenerator
@@ -92,6 +96,156 @@ class TestGenerateDataset:
         patcher_write_text.assert_called_once_with("1", encoding="utf-8")
 
 
+
+def _generate_random_tables(mocker: MockerFixture, number_of_tables: int, **kwargs):
+    """Generate random tables with sequential exports, returning the exported tables and saved checkpoints."""
+    mocker.patch("selenium.webdriver.Firefox")
+    mocker.patch("pathlib.Path.mkdir")
+    mocker.patch("pathlib.Path.write_text")
+    mocker.patch("json.loads")
+    mocker.patch("pathlib.Path.read_text")
+    mocker.patch(
+        "arttabgen.table_generator.TableGenerator._generate_table_and_gt",
+        side_effect=lambda: ([[str(random.random())]], [], 1),
+    )
+    export_csv = mocker.patch("arttabgen.table_exporter.TableExporter._export_csv")
+    save_checkpoint = mocker.patch("arttabgen.dataset_generator.save_checkpoint")
+
+    mocker.patch(
+        "arttabgen.config_handler.config_handler",
+        ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+    )
+    mocker.patch(
+        "arttabgen.config_handler.config_handler.config",
+        {
+            "image_width": 1080,
+            "image_height": 1920,
+            "number_of_tables": number_of_tables,
+            "parameters": [],
+            "structure_parameters": [],
+        },
+    )
+
+    exporter: TableExporter = TableExporter(
+        [], Path(""), "", ProgressPrinter(0, 0, 0), 100, Path(""), Path(""), False, 0, {}
+    )
+    mocker.patch.object(ProgressPrinter, "print_progress")
+    generator: DatasetGenerator = DatasetGenerator(
+        TableGenerator(0, 1, 0, 0, 1, True, 0, {}, {}, 0),
+        exporter,
+        False,
+        number_of_tables,
+        TransformerApplicationStrategy.SELECTIVE,
+        **kwargs,
+    )
+
+    generator.generate_dataset()
+
+    exported_tables = {
+        call.args[1]: call.args[0] for call in export_csv.call_args_list if call.args[2] == "tables"
+    }
+    checkpoints = [call.args[0] for call in save_checkpoint.call_args_list]
+
+    return exported_tables, checkpoints
+
+
+class TestCheckpoints:
+    def test_checkpoint_after_interval(self, mocker: MockerFixture):
+        random.seed(1)
+
+        exported_tables, checkpoints = _generate_random_tables(mocker, 5, checkpoint_interval=2)
+
+        assert list(exported_tables) == [1, 2, 3, 4, 5]
+        assert [checkpoint.num_completed_tables for checkpoint in checkpoints] == [2, 4]
+        assert checkpoints[0].seed == 1
+
+    def test_resume_is_identical(self, mocker: MockerFixture):
+        random.seed(1)
+        exported_tables, checkpoints = _generate_random_tables(mocker, 5, checkpoint_interval=2)
+        mocker.stopall()
+
+        random.seed(2)
+        resumed_tables, _ = _generate_random_tables(
+            mocker, 5, checkpoint_interval=2, resume_checkpoint=checkpoints[0]
+        )
+
+        assert list(resumed_tables) == [3, 4, 5]
+        assert resumed_tables == {table_num: exported_tables[table_num] for table_num in (3, 4, 5)}
+
+    def test_checkpoint_waits_for_exports(self, mocker: MockerFixture):
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        save_checkpoint = mocker.patch("arttabgen.dataset_generator.save_checkpoint")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920, "number_of_tables": 1, "parameters": [],
+             "structure_parameters": []},
+        )
+        exporter: TableExporter = TableExporter(
+            [], Path(""), "", ProgressPrinter(0, 0, 0), 100, Path(""), Path(""), True, 0, {}
+        )
+        generator: DatasetGenerator = DatasetGenerator(
+            None, exporter, False, 1, TransformerApplicationStrategy.SELECTIVE, checkpoint_interval=1
+        )
+        generator.pending_checkpoints = [capture_checkpoint(1, 0), capture_checkpoint(2, 0)]
+
+        exporter.num_completed_tables = 0
+        generator._save_completed_checkpoint()
+        save_checkpoint.assert_not_called()
+
+        exporter.num_completed_tables = 2
+        generator._save_completed_checkpoint()
+        save_checkpoint.assert_called_once()
+        assert save_checkpoint.call_args.args[0].num_completed_tables == 2
+        assert generator.pending_checkpoints == []
+
+
+class TestTableRange:
+    def test_numbering_continues_after_start(self, mocker: MockerFixture):
+        exported_tables, _ = _generate_random_tables(mocker, 5, table_range=(2, 4))
+
+        assert list(exported_tables) == [3, 4]
+
+    def test_replayed_tables_match_full_generation(self, mocker: MockerFixture):
+        random.seed(1)
+        exported_tables, _ = _generate_random_tables(mocker, 5)
+        mocker.stopall()
+
+        random.seed(1)
+        range_tables, _ = _generate_random_tables(mocker, 5, table_range=(2, 5), replay_skipped_tables=True)
+
+        assert range_tables == {table_num: exported_tables[table_num] for table_num in (3, 4, 5)}
+
+    def test_per_table_seeds_match_full_generation(self, mocker: MockerFixture):
+        exported_tables, _ = _generate_random_tables(mocker, 5, per_table_seeds=True)
+        mocker.stopall()
+
+        random.seed(2)
+        range_tables, _ = _generate_random_tables(mocker, 5, table_range=(2, 5), per_table_seeds=True)
+
+        assert range_tables == {table_num: exported_tables[table_num] for table_num in (3, 4, 5)}
+
+
+class TestAbort:
+    def test_no_table_exported_after_abort(self, mocker: MockerFixture):
+        abort_event = threading.Event()
+        export_table = mocker.patch(
+            "arttabgen.table_exporter.TableExporter.export_table",
+            side_effect=lambda *_: abort_event.set(),
+        )
+
+        with pytest.raises(GenerationAbortedError):
+            _generate_random_tables(mocker, 5, abort_event=abort_event)
+
+        export_table.assert_called_once()
+
+
 class TestGetTransformerCombinations:
     def test_simple_one_transformer(self, mocker: MockFixture):
         def dummy_style_transformer(parameter_value, parameter_unit):
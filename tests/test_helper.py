@@ -3,7 +3,7 @@ from typing import List
 from pytest_mock.plugin import MockerFixture
 
 from arttabgen import helper
-from arttabgen.helper import randrange_float
+from arttabgen.helper import derive_seed, randrange_float, split_table_range
 
 
 class TestRandrangeFloat:
@@ -25,3 +25,20 @@ class TestGetRandomAdjacentElement:
 
         assert patcher.call_count == 2
         assert returned == "i"
+
+
+class TestDeriveSeed:
+    def test_stable(self):
+        assert derive_seed(1, 0) == derive_seed(1, 0)
+        assert derive_seed(1, 0) < 2 ** 64
+
+    def test_independent(self):
+        assert len({derive_seed(1, 0), derive_seed(1, 1), derive_seed(2, 0)}) == 3
+
+
+class TestSplitTableRange:
+    def test_remainder(self):
+        assert split_table_range(10, 3) == [(0, 4), (4, 7), (7, 10)]
+
+    def test_more_parts_than_tables(self):
+        assert split_table_range(1, 2) == [(0, 1), (1, 1)]
@@ -1,5 +1,7 @@
 from typing import Any, Dict
 
+import pandas as pd
+import pytest
 from pytest_mock import MockerFixture
 
 from arttabgen import html_handling
@@ -8,6 +10,61 @@ from arttabgen.types_.transformer_value_combination import (
 )
 
 
+ESCAPED_TABLE = [
+    ["  Coil <resistance> & more ", "5\n", "\tmm"],
+    ["Air gap\r\nthickness", "", "   "],
+    ["Torque,  [Nm]", '"1"', "<b>"],
+]
+
+ESCAPED_TABLE_HEADER_HTML = """  <thead>
+    <tr style="text-align: right;">
+      <th>0</th>
+      <th>1</th>
+      <th>2</th>
+    </tr>
+  </thead>
+"""
+
+ESCAPED_TABLE_BODY_HTML = {
+    "horizontal": r"""  <tbody>
+    <tr>
+      <td>Coil &lt;resistance&gt; &amp; more</td>
+      <td>5\n</td>
+      <td>\tmm</td>
+    </tr>
+    <tr>
+      <td>Air gap\r\nthickness</td>
+      <td></td>
+      <td></td>
+    </tr>
+    <tr>
+      <td>Torque,  [Nm]</td>
+      <td>"1"</td>
+      <td>&lt;b&gt;</td>
+    </tr>
+  </tbody>
+""",
+    "vertical": r"""  <tbody>
+    <tr>
+      <td>Coil &lt;resistance&gt; &amp; more</td>
+      <td>Air gap\r\nthickness</td>
+      <td>Torque,  [Nm]</td>
+    </tr>
+    <tr>
+      <td>5\n</td>
+      <td></td>
+      <td>"1"</td>
+    </tr>
+    <tr>
+      <td>\tmm</td>
+      <td></td>
+      <td>&lt;b&gt;</td>
+    </tr>
+  </tbody>
+""",
+}
+
+
 class TestHtmlHandling:
     def test_no_transformers(self, mocker: MockerFixture):
         def return_kwargs(**kwargs):
@@ -129,9 +186,68 @@ class TestHtmlHandling:
 
         returned: Dict[str, Any] = html_handling.table_to_html(
             table,
-            TransformerValueCombination(["foo", "bar"], []),
+            TransformerValueCombination(
+                ["table, tr, td {font-size: 14px;}", "td {color: red;}", "table, tr, td {font-style: italic;}"],
+                [],
+            ),
         )
 
-        wanted_style = "foo\nbar"
+        wanted_style = "table, tr, td {font-size: 14px; font-style: italic;}\ntd {color: red;}"
 
         assert returned["styles"] == wanted_style
+
+    @pytest.mark.parametrize("has_header", [True, False])
+    @pytest.mark.parametrize("table_orientation", ["horizontal", "vertical"])
+    def test_same_as_pandas(self, mocker: MockerFixture, has_header: bool, table_orientation: str):
+        def return_kwargs(**kwargs):
+            return kwargs
+
+        mocked_str = mocker.Mock(spec=str)
+        mocker.patch("arttabgen.html_handling.HTML_SKELETON", mocked_str)
+        mocked_str.format = return_kwargs
+
+        returned: Dict[str, Any] = html_handling.table_to_html(
+            ESCAPED_TABLE,
+            TransformerValueCombination(
+                [], {"has-header": has_header, "table-orientation": table_orientation}
+            ),
+        )
+
+        # The markup DataFrame.to_html(index=False) writes with the pinned pandas
+        assert returned["table"] == (
+            '<table border="1" class="dataframe">\n'
+            + (ESCAPED_TABLE_HEADER_HTML if has_header else "")
+            + ESCAPED_TABLE_BODY_HTML[table_orientation]
+            + "</table>"
+        )
+
+    @pytest.mark.skipif(
+        not pd.__version__.startswith("1."),
+        reason="the builder reproduces the pinned pandas 1, pandas 3 writes consecutive spaces as &nbsp;",
+    )
+    @pytest.mark.parametrize("has_header", [True, False])
+    @pytest.mark.parametrize("table_orientation", ["horizontal", "vertical"])
+    def test_same_as_installed_pandas(self, has_header: bool, table_orientation: str):
+        df_table = pd.DataFrame(ESCAPED_TABLE)
+
+        if table_orientation == "vertical":
+            df_table = df_table.transpose()
+
+        returned: str = html_handling._build_html_table(
+            list(zip(*ESCAPED_TABLE)) if table_orientation == "vertical" else ESCAPED_TABLE,
+            len(ESCAPED_TABLE[0]),
+            has_header,
+        )
+
+        assert returned == df_table.to_html(header=has_header, index=False)
+
+    def test_linked_stylesheet(self):
+        table = [["electric resistance to current", "437"]]
+        transformers = TransformerValueCombination([], [])
+
+        embedded = html_handling.table_to_html(table, transformers)
+        linked = html_handling.table_to_html(table, transformers, "styles/0.css")
+
+        assert '<link rel="stylesheet" href="styles/0.css">' in linked
+        assert "<style>" not in linked
+        assert linked.split("</head>")[1] == embedded.split("</head>")[1]
@@ -0,0 +1,204 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from arttabgen.lease_queue import LeaseQueue
+
+
+def _list(lease_dir: Path, state: str):
+    return sorted(os.listdir(Path(lease_dir, state)))
+
+
+class TestInitialize:
+    def test_splits_tables_into_ranges(self, tmp_path: Path):
+        lease_dir = Path(tmp_path, "leases")
+
+        LeaseQueue(lease_dir, 60).initialize(10, 4)
+
+        assert _list(lease_dir, "pending") == [
+            "tables_000000000000-000000000004",
+            "tables_000000000004-000000000008",
+            "tables_000000000008-000000000010",
+        ]
+        assert _list(lease_dir, "leased") == []
+        assert _list(lease_dir, "done") == []
+
+    def test_keeps_existing_ranges(self, tmp_path: Path):
+        lease_dir = Path(tmp_path, "leases")
+        LeaseQueue(lease_dir, 60).initialize(10, 4)
+        LeaseQueue(lease_dir, 60).claim()
+
+        LeaseQueue(lease_dir, 60).initialize(10, 2)
+
+        assert len(_list(lease_dir, "pending")) == 2
+        assert len(_list(lease_dir, "leased")) == 1
+        assert os.listdir(tmp_path) == ["leases"]
+
+    def test_invalid_range_size(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            LeaseQueue(Path(tmp_path, "leases"), 60).initialize(10, 0)
+
+
+class TestClaim:
+    def test_claims_ranges_in_order(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(5, 3)
+
+        assert lease_queue.claim() == (0, 3)
+        assert lease_queue.claim() == (3, 5)
+        assert _list(lease_queue.lease_dir, "pending") == []
+        assert len(_list(lease_queue.lease_dir, "leased")) == 2
+
+    def test_returns_none_when_done(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+
+        lease_queue.complete(lease_queue.claim())
+
+        assert lease_queue.claim() is None
+        assert _list(lease_queue.lease_dir, "done") == ["tables_000000000000-000000000002"]
+
+    def test_waits_for_leased_ranges(self, tmp_path: Path, mocker):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60, poll_interval=1)
+        lease_queue.initialize(2, 2)
+        table_range = lease_queue.claim()
+        sleep = mocker.patch(
+            "arttabgen.lease_queue.time.sleep",
+            side_effect=lambda _: lease_queue.complete(table_range),
+        )
+
+        assert lease_queue.claim() is None
+        sleep.assert_called_once_with(1)
+
+    def test_reclaims_expired_lease(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+        lease_queue.claim()
+        leased_file = Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002")
+        expired = time.time() - 120
+        os.utime(leased_file, (expired, expired))
+
+        assert lease_queue.claim() == (0, 2)
+        assert leased_file.stat().st_mtime > expired
+
+
+class TestRenew:
+    def test_renew_defers_expiry(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+        table_range = lease_queue.claim()
+        leased_file = Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002")
+        expired = time.time() - 120
+        os.utime(leased_file, (expired, expired))
+
+        assert lease_queue.renew(table_range)
+
+        lease_queue._release_expired_leases()
+        assert leased_file.exists()
+
+    def test_renew_of_lost_lease(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+
+        assert not lease_queue.renew((0, 2))
+        assert _list(lease_queue.lease_dir, "leased") == []
+
+    def test_renew_while_releasing_puts_lease_back(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+        table_range = lease_queue.claim()
+        releasing_file = Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002.releasing-other")
+        os.rename(Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002"), releasing_file)
+        expired = time.time() - 120
+        os.utime(releasing_file, (expired, expired))
+
+        assert lease_queue.renew(table_range)
+
+        lease_queue._release_expired_leases()
+        assert _list(lease_queue.lease_dir, "leased") == ["tables_000000000000-000000000002"]
+
+    def test_keep_alive(self, tmp_path: Path, mocker):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 0.03)
+        lease_queue.initialize(2, 2)
+        table_range = lease_queue.claim()
+        renew = mocker.patch.object(lease_queue, "renew")
+
+        with lease_queue.keep_alive(table_range):
+            time.sleep(0.1)
+
+        renew.assert_called_with(table_range)
+
+    def test_keep_alive_signals_lost_lease(self, tmp_path: Path, mocker):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 0.03)
+        lease_queue.initialize(2, 2)
+        table_range = lease_queue.claim()
+        renew = mocker.patch.object(lease_queue, "renew", return_value=False)
+
+        with lease_queue.keep_alive(table_range) as lease_lost:
+            assert lease_lost.wait(1)
+
+        renew.assert_called_once_with(table_range)
+
+
+class TestComplete:
+    def test_completes_leased_range(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+        table_range = lease_queue.claim()
+
+        assert lease_queue.complete(table_range)
+        assert _list(lease_queue.lease_dir, "done") == ["tables_000000000000-000000000002"]
+
+    def test_released_range_not_completed(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+        table_range = lease_queue.claim()
+        os.rename(
+            Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002"),
+            Path(lease_queue.lease_dir, "pending", "tables_000000000000-000000000002"),
+        )
+
+        assert not lease_queue.complete(table_range)
+        assert _list(lease_queue.lease_dir, "pending") == ["tables_000000000000-000000000002"]
+        assert _list(lease_queue.lease_dir, "done") == []
+
+
+class TestReleaseExpiredLeases:
+    def test_lease_renewed_while_releasing_kept(self, tmp_path: Path, mocker):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+        lease_queue.claim()
+        leased_file = Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002")
+        expired = time.time() - 120
+        os.utime(leased_file, (expired, expired))
+        rename = os.rename
+
+        def renew_before_rename(source, destination):
+            # The holder renews right after the lease was found expired
+            if Path(source) == leased_file:
+                os.utime(leased_file)
+
+            rename(source, destination)
+
+        mocker.patch("arttabgen.lease_queue.os.rename", side_effect=renew_before_rename)
+
+        lease_queue._release_expired_leases()
+
+        assert _list(lease_queue.lease_dir, "leased") == ["tables_000000000000-000000000002"]
+        assert _list(lease_queue.lease_dir, "pending") == []
+
+    def test_range_left_aside_released(self, tmp_path: Path):
+        lease_queue = LeaseQueue(Path(tmp_path, "leases"), 60)
+        lease_queue.initialize(2, 2)
+        lease_queue.claim()
+        releasing_file = Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002.releasing-dead")
+        os.rename(Path(lease_queue.lease_dir, "leased", "tables_000000000000-000000000002"), releasing_file)
+        expired = time.time() - 120
+        os.utime(releasing_file, (expired, expired))
+
+        lease_queue._release_expired_leases()
+
+        assert _list(lease_queue.lease_dir, "leased") == []
+        assert _list(lease_queue.lease_dir, "pending") == ["tables_000000000000-000000000002"]
@@ -0,0 +1,61 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from arttabgen import main
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _generate_images(tmp_path: Path, mocker: MockerFixture, *extra_args: str):
+    tmp_path.mkdir()
+    config = json.loads(Path(DATA_DIR, "motor_config.json").read_text(encoding="utf-8"))
+    config["number_of_tables"] = 6
+    config["image_manipulation_probability"] = 1.0
+    config_path = Path(tmp_path, "config.json")
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    mocker.patch.object(
+        sys,
+        "argv",
+        [
+            "arttabgen",
+            "--config_path", str(config_path),
+            "--keyword_path", str(Path(DATA_DIR, "keywords_motor.txt")),
+            "--unit_path", str(Path(DATA_DIR, "units_motor.json")),
+            "--output_formats", "png",
+            "--image_backend", "pillow",
+            "--output_dir", str(tmp_path),
+            "--dataset_name", "dataset",
+            "--seed", "5",
+            *extra_args,
+        ],
+    )
+
+    main.main()
+
+    return {
+        image.name: image.read_bytes()
+        for image in Path(tmp_path, "dataset", "tables_png").iterdir()
+    }
+
+
+class TestPerTableSeeds:
+    def test_images_same_for_workers(self, tmp_path: Path, mocker: MockerFixture):
+        single_process_images = _generate_images(Path(tmp_path, "single"), mocker, "--per_table_seeds")
+        worker_images = _generate_images(Path(tmp_path, "workers"), mocker, "--per_table_seeds", "--workers", "2")
+
+        assert len(single_process_images) == 6
+        assert worker_images == single_process_images
+
+
+class TestArgumentValidation:
+    def test_batched_browser_pdfs_rejected(self, mocker: MockerFixture):
+        mocker.patch.object(
+            sys, "argv", ["arttabgen", "--pdf_backend", "browser", "--pdf_batch_size", "2"]
+        )
+
+        with pytest.raises(SystemExit):
+            main.main()
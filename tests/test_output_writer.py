@@ -0,0 +1,117 @@
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from arttabgen.output_writer import DirectoryWriter, TarShardWriter
+
+
+class TestDirectoryWriter:
+    def test_write(self, tmp_path: Path):
+        writer = DirectoryWriter(tmp_path)
+
+        writer.write(1, "jpg", b"jpg")
+        writer.write(1, "gt_csv", b"gt")
+
+        assert Path(tmp_path, "tables_jpg", "tables_1.jpg").read_bytes() == b"jpg"
+        assert Path(tmp_path, "gt_csv", "tables_1.csv").read_bytes() == b"gt"
+
+    def test_write_file(self, tmp_path: Path):
+        writer = DirectoryWriter(tmp_path)
+
+        writer.write_file("pdf", "tables_1-2.pdf", b"pdf")
+
+        assert Path(tmp_path, "tables_pdfs", "tables_1-2.pdf").read_bytes() == b"pdf"
+
+
+class TestTarShardWriter:
+    def test_artefacts_of_table_are_consecutive(self, tmp_path: Path):
+        writer = TarShardWriter(tmp_path, ["csv", "gt_csv", "png"], 10)
+
+        writer.write(2, "png", b"2")
+        writer.write(1, "gt_csv", b"1")
+        writer.write(2, "csv", b"2")
+        writer.write(1, "png", b"1")
+        writer.write(2, "gt_csv", b"2")
+        writer.write(1, "csv", b"1")
+        writer.close()
+
+        with tarfile.open(Path(tmp_path, "shards", "shard-00000-000000.tar")) as shard:
+            assert shard.getnames() == [
+                "tables_2.csv",
+                "tables_2.gt.csv",
+                "tables_2.png",
+                "tables_1.csv",
+                "tables_1.gt.csv",
+                "tables_1.png",
+            ]
+            assert shard.extractfile("tables_1.png").read() == b"1"
+
+    def test_rolls_over_by_table_count(self, tmp_path: Path):
+        writer = TarShardWriter(tmp_path, ["csv"], 2)
+
+        for table_num in range(1, 6):
+            writer.write(table_num, "csv", b"")
+        writer.close()
+
+        shards = sorted(Path(tmp_path, "shards").iterdir())
+        assert [shard.name for shard in shards] == [
+            "shard-00000-000000.tar",
+            "shard-00000-000001.tar",
+            "shard-00000-000002.tar",
+        ]
+        with tarfile.open(shards[-1]) as shard:
+            assert shard.getnames() == ["tables_5.csv"]
+
+    def test_rolls_over_by_size(self, tmp_path: Path):
+        writer = TarShardWriter(tmp_path, ["png"], 100, max_shard_bytes=2000)
+
+        for table_num in range(1, 4):
+            writer.write(table_num, "png", bytes(1000))
+        writer.close()
+
+        assert len(list(Path(tmp_path, "shards").iterdir())) == 2
+
+    def test_close_writes_incomplete_tables(self, tmp_path: Path):
+        writer = TarShardWriter(tmp_path, ["csv", "gt_csv"], 10)
+
+        writer.write(1, "csv", b"")
+        writer.close()
+
+        with tarfile.open(Path(tmp_path, "shards", "shard-00000-000000.tar")) as shard:
+            assert shard.getnames() == ["tables_1.csv"]
+
+    def test_part_index(self, tmp_path: Path):
+        writer = TarShardWriter(tmp_path, ["csv"], 1, part_index=2)
+
+        writer.write(1, "csv", b"")
+        writer.close()
+
+        assert Path(tmp_path, "shards", "shard-00002-000000.tar").exists()
+
+    def test_open_shard_hidden_until_closed(self, tmp_path: Path):
+        writer = TarShardWriter(tmp_path, ["csv"], 2)
+
+        writer.write(1, "csv", b"")
+
+        shards = os.listdir(Path(tmp_path, "shards"))
+        assert len(shards) == 1
+        assert shards[0].startswith(".shard-00000-000000.tar.")
+
+        writer.close()
+
+        assert os.listdir(Path(tmp_path, "shards")) == ["shard-00000-000000.tar"]
+
+    def test_discard_deletes_open_shard(self, tmp_path: Path):
+        writer = TarShardWriter(tmp_path, ["csv"], 2)
+
+        for table_num in range(1, 4):
+            writer.write(table_num, "csv", b"")
+        writer.discard()
+
+        assert os.listdir(Path(tmp_path, "shards")) == ["shard-00000-000000.tar"]
+
+    def test_invalid_tables_per_shard(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            TarShardWriter(tmp_path, ["csv"], 0)
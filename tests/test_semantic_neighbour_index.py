@@ -0,0 +1,132 @@
+import random
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from arttabgen.semantic_neighbour_index import SemanticNeighbourIndex
+
+
+class FakeSynset:
+    def __init__(self, name: str):
+        self._name = name
+        self._hypernyms = []
+        self._hyponyms = []
+
+    def name(self):
+        return self._name
+
+    def hypernyms(self):
+        return list(self._hypernyms)
+
+    def instance_hypernyms(self):
+        return []
+
+    def hyponyms(self):
+        return list(self._hyponyms)
+
+    def instance_hyponyms(self):
+        return []
+
+    def path_similarity(self, other):
+        # The shortest path over a common hypernym, like nltk's Synset.shortest_path_distance
+        distances = [
+            distance + other.hypernym_distances()[hypernym]
+            for hypernym, distance in self.hypernym_distances().items()
+            if hypernym in other.hypernym_distances()
+        ]
+
+        return 1 / (min(distances) + 1)
+
+    def hypernym_distances(self):
+        distances = {}
+        pending = [(self, 0)]
+
+        while pending:
+            synset, distance = pending.pop(0)
+
+            if synset not in distances:
+                distances[synset] = distance
+                pending.extend((hypernym, distance + 1) for hypernym in synset.hypernyms())
+
+        return distances
+
+
+def _index(synsets, min_similarity, max_similarity, cache_file=None):
+    synsets_by_name = {synset.name(): synset for synset in synsets}
+
+    return SemanticNeighbourIndex(
+        list(synsets_by_name), synsets_by_name.__getitem__, min_similarity, max_similarity, cache_file
+    )
+
+
+def _build_hierarchy(number_of_synsets: int, seed: int):
+    rng = random.Random(seed)
+    synsets = [FakeSynset(f"synset_{index}.n.01") for index in range(number_of_synsets)]
+
+    for index, synset in enumerate(synsets[1:], 1):
+        # Some synsets have several hypernyms, like in WordNet
+        for hypernym in rng.sample(synsets[:index], min(index, rng.choice([1, 1, 1, 2]))):
+            synset._hypernyms.append(hypernym)
+            hypernym._hyponyms.append(synset)
+
+    return synsets
+
+
+class TestRandomNeighbour:
+    @pytest.mark.parametrize("seed", range(3))
+    def test_neighbours_within_band(self, seed: int):
+        synsets = _build_hierarchy(200, seed)
+        index = _index(synsets, 0.15, 0.3)
+
+        for synset in synsets[::20]:
+            assert [synsets[position] for position in index._neighbours(synset)] == [
+                candidate for candidate in synsets if 0.15 < synset.path_similarity(candidate) < 0.3
+            ]
+
+    def test_no_neighbours(self):
+        synsets = _build_hierarchy(3, 0)
+        index = _index(synsets, 0.0, 0.1)
+
+        assert index.random_neighbour(synsets[2]) is None
+
+    def test_neighbours_cached_in_file(self, tmp_path: Path, mocker: MockerFixture):
+        synsets = _build_hierarchy(50, 0)
+        cache_file = Path(tmp_path, "neighbours.jsonl")
+        neighbour = _index(synsets, 0.1, 0.5, cache_file).random_neighbour(synsets[10])
+        path_distances = mocker.patch("arttabgen.semantic_neighbour_index._path_distances")
+        index = _index(synsets, 0.1, 0.5, cache_file)
+
+        assert len(cache_file.read_text(encoding="utf-8").splitlines()) == 1
+        assert neighbour in [synsets[position] for position in index._neighbours(synsets[10])]
+        path_distances.assert_not_called()
+
+    def test_neighbours_appended_by_other_index_read(self, tmp_path: Path, mocker: MockerFixture):
+        synsets = _build_hierarchy(50, 0)
+        cache_file = Path(tmp_path, "neighbours.jsonl")
+        index = _index(synsets, 0.1, 0.5, cache_file)
+        neighbours = _index(synsets, 0.1, 0.5, cache_file)._neighbours(synsets[10])
+        path_distances = mocker.patch("arttabgen.semantic_neighbour_index._path_distances")
+
+        assert index._neighbours(synsets[10]) == neighbours
+        path_distances.assert_not_called()
+
+    def test_cut_off_line_skipped(self, tmp_path: Path):
+        synsets = _build_hierarchy(50, 0)
+        cache_file = Path(tmp_path, "neighbours.jsonl")
+        neighbours = _index(synsets, 0.1, 0.5)._neighbours(synsets[10])
+        cache_file.write_text('["synset_10.n.01", [1, 2', encoding="utf-8")
+        _index(synsets, 0.1, 0.5, cache_file)._neighbours(synsets[20])
+
+        assert _index(synsets, 0.1, 0.5, cache_file)._neighbours(synsets[10]) == neighbours
+
+    def test_garbled_lines_skipped(self, tmp_path: Path):
+        synsets = _build_hierarchy(50, 0)
+        cache_file = Path(tmp_path, "neighbours.jsonl")
+        neighbours = _index(synsets, 0.1, 0.5)._neighbours(synsets[10])
+        cache_file.write_text(
+            '["synset_10.n.01", [3, 1]]\n["synset_10.n.01", [1, 50]]\n["synset_10.n.01", ["1"]]\n[1, [1]]\n',
+            encoding="utf-8",
+        )
+
+        assert _index(synsets, 0.1, 0.5, cache_file)._neighbours(synsets[10]) == neighbours
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from arttabgen.table_data_writer import ParquetTableDataWriter
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestParquetTableDataWriter:
+    def test_row_groups(self, tmp_path: Path):
+        writer = ParquetTableDataWriter(tmp_path, 2)
+
+        for table_num in range(1, 6):
+            writer.add(table_num, 1, [["a", str(table_num)]], [["gt", str(table_num)]])
+        writer.close()
+
+        parquet_file = pq.ParquetFile(Path(tmp_path, "part-00000.parquet"))
+        assert parquet_file.metadata.num_row_groups == 3
+
+        table = parquet_file.read().to_pylist()
+        assert [row["table_id"] for row in table] == [1, 2, 3, 4, 5]
+        assert table[0] == {
+            "table_id": 1,
+            "mode": 1,
+            "num_columns": 2,
+            "cells": [["a", "1"]],
+            "gt_cells": [["gt", "1"]],
+        }
+
+    def test_nothing_written_before_row_group_is_full(self, tmp_path: Path):
+        writer = ParquetTableDataWriter(tmp_path, 2)
+
+        writer.add(1, 1, [["a"]], [["gt"]])
+
+        assert not Path(tmp_path, "part-00000.parquet").exists()
+
+    def test_part_index(self, tmp_path: Path):
+        writer = ParquetTableDataWriter(tmp_path, 1, part_index=3)
+
+        writer.add(1, 1, [["a"]], [["gt"]])
+        writer.close()
+
+        assert Path(tmp_path, "part-00003.parquet").exists()
+
+    def test_discard_deletes_file(self, tmp_path: Path):
+        writer = ParquetTableDataWriter(tmp_path, 1)
+
+        writer.add(1, 1, [["a"]], [["gt"]])
+        writer.discard()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_tables_per_row_group(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            ParquetTableDataWriter(tmp_path, 0)
@@ -1,12 +1,17 @@
+import base64
+import os
+import threading
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import ANY
 
+import pytest
 from PIL import Image
 from pytest_mock import MockerFixture
 
 from arttabgen.config_handler import ConfigHandler
 from arttabgen.progress_printer import ProgressPrinter
-from arttabgen.table_exporter import TableExporter
+from arttabgen.table_exporter import TableExporter, browser_output_formats
 from arttabgen.types_.transformer_application_strategy import (
     TransformerApplicationStrategy,
 )
@@ -54,8 +59,7 @@ class TestExportTable:
         mocker.patch("pathlib.Path.mkdir")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_csv")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_pdf")
-        mocker.patch("arttabgen.table_exporter.TableExporter._export_jpg")
-        mocker.patch("arttabgen.table_exporter.TableExporter._export_png")
+        mocker.patch("arttabgen.table_exporter.TableExporter._export_images")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_html")
 
         mocker.patch("json.loads")
@@ -81,7 +85,7 @@ class TestExportTable:
             {},
         )
 
-        exporter.export_table(None, None, TransformerValueCombination([], []), 1)
+        exporter.export_table(None, [], TransformerValueCombination([], []), 1)
         assert patcher.call_count == 2
 
     def test_no_valid_formats_specified(self, mocker: MockerFixture):
@@ -90,8 +94,7 @@ class TestExportTable:
         mocker.patch("pathlib.Path.mkdir")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_csv")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_pdf")
-        mocker.patch("arttabgen.table_exporter.TableExporter._export_jpg")
-        mocker.patch("arttabgen.table_exporter.TableExporter._export_png")
+        mocker.patch("arttabgen.table_exporter.TableExporter._export_images")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_html")
 
         mocker.patch("json.loads")
@@ -117,7 +120,7 @@ class TestExportTable:
             {},
         )
 
-        exporter.export_table(None, None, TransformerValueCombination([], []), 1)
+        exporter.export_table(None, [], TransformerValueCombination([], []), 1)
         assert patcher.call_count == 2
 
     def test_3_formats_specified(self, mocker: MockerFixture):
@@ -126,8 +129,7 @@ class TestExportTable:
         mocker.patch("pathlib.Path.mkdir")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_csv")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_pdf")
-        mocker.patch("arttabgen.table_exporter.TableExporter._export_jpg")
-        mocker.patch("arttabgen.table_exporter.TableExporter._export_png")
+        mocker.patch("arttabgen.table_exporter.TableExporter._export_images")
         mocker.patch("arttabgen.table_exporter.TableExporter._export_html")
 
         mocker.patch("json.loads")
@@ -153,13 +155,96 @@ class TestExportTable:
             {},
         )
 
-        exporter.export_table(None, None, TransformerValueCombination([], []), 1)
+        exporter.export_table(None, [], TransformerValueCombination([], []), 1)
         assert patcher.call_count == 5
 
+    def test_image_formats_share_one_export(self, mocker: MockerFixture):
+        patcher = mocker.patch("concurrent.futures.ThreadPoolExecutor.submit")
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["jpg", "png"],
+            Path(""),
+            "",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+        )
+
+        exporter.export_table(None, [], TransformerValueCombination([], []), 1)
+
+        assert patcher.call_count == 3
+        patcher.assert_called_with(
+            ANY,
+            exporter._export_images,
+            ANY,
+            [],
+            ANY,
+            1,
+            ["jpg", "png"],
+            1,
+            steps=2,
+        )
+
+    def test_parquet_table_data(self, mocker: MockerFixture):
+        patcher = mocker.patch("concurrent.futures.ThreadPoolExecutor.submit")
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+        writer = mocker.patch("arttabgen.table_exporter.ParquetTableDataWriter")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["html"],
+            Path(""),
+            "",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            table_data_format="parquet",
+        )
+
+        exporter.export_table(
+            [["a", "b"]],
+            [["1", "2"]],
+            TransformerValueCombination([], {"table-orientation": "vertical"}),
+            1,
+        )
+
+        patcher.assert_called_once_with(ANY, exporter._export_html, ANY, 1, steps=1)
+        writer.return_value.add.assert_called_once_with(1, 1, [["1"], ["2"]], [["a", "b"]])
 
 class TestExportCsv:
     def test_simple_non_gt(self, mocker: MockerFixture):
-        patcher = mocker.patch("pandas.DataFrame.to_csv")
+        patcher = mocker.patch("pandas.DataFrame.to_csv", return_value="")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
         mocker.patch("selenium.webdriver.Firefox")
         mocker.patch("pathlib.Path.mkdir")
 
@@ -189,14 +274,15 @@ class TestExportCsv:
         exporter._export_csv([], 1, "tables", False)
 
         patcher.assert_called_once_with(
-            Path("foo/bar/my_dataset/tables_csv/tables_1.csv"),
             sep=";",
             index=False,
             header=False
         )
+        write_bytes.assert_called_once_with(Path("foo/bar/my_dataset/tables_csv/tables_1.csv"), b"")
 
     def test_simple_gt(self, mocker: MockerFixture):
-        patcher = mocker.patch("pandas.DataFrame.to_csv")
+        patcher = mocker.patch("pandas.DataFrame.to_csv", return_value="")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
         mocker.patch("selenium.webdriver.Firefox")
         mocker.patch("pathlib.Path.mkdir")
 
@@ -226,21 +312,19 @@ class TestExportCsv:
         exporter._export_csv([], 1, "gt_csv", False)
 
         patcher.assert_called_once_with(
-            Path("foo/bar/my_dataset/gt_csv/tables_1.csv"),
             sep=";",
             index=False,
             header=False
         )
+        write_bytes.assert_called_once_with(Path("foo/bar/my_dataset/gt_csv/tables_1.csv"), b"")
 
 
 class TestExportPdf:
     def test_simple(self, mocker: MockerFixture):
         dir_name: Path = Path("foo/bar/")
         dataset_name: str = "my_dataset"
-        output_path: Path = Path(dir_name, dataset_name, "pdf/tables_1.pdf")
-        mocker.patch("pathlib.Path.absolute", return_value=output_path)
-
-        patcher = mocker.patch("pdfkit.from_string")
+        patcher = mocker.patch("pdfkit.from_string", return_value=b"%PDF")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
         mocker.patch("selenium.webdriver.Firefox")
         mocker.patch("pathlib.Path.mkdir")
 
@@ -274,19 +358,148 @@ class TestExportPdf:
 
         patcher.assert_called_once_with(
             "",
-            str(output_path),
+            False,
+            configuration=ANY,
+            options=ANY,
+        )
+        write_bytes.assert_called_once_with(Path(dir_name, dataset_name, "tables_pdfs/tables_1.pdf"), b"%PDF")
+
+    def test_configuration_created_once(self, mocker: MockerFixture):
+        mocker.patch("pdfkit.from_string", return_value=b"")
+        mocker.patch("pathlib.Path.write_bytes")
+        configuration = mocker.patch("pdfkit.configuration")
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+
+        exporter: TableExporter = TableExporter(
+            [],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+        )
+
+        exporter._export_pdf("", 1)
+        exporter._export_pdf("", 2)
+
+        configuration.assert_called_once()
+
+
+class TestExportPdfBatch:
+    def test_batch_exported_when_complete(self, mocker: MockerFixture):
+        dir_name: Path = Path("foo/bar/")
+        dataset_name: str = "my_dataset"
+        from_string = mocker.patch("pdfkit.from_string")
+        from_file = mocker.patch("pdfkit.from_file", return_value=b"%PDF")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
+        mocker.patch("pdfkit.configuration")
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+
+        exporter: TableExporter = TableExporter(
+            [],
+            dir_name,
+            dataset_name,
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            pdf_batch_size=2,
+        )
+
+        exporter._export_pdf("<table>2</table>", 2)
+        from_file.assert_not_called()
+
+        exporter._export_pdf("<table>1</table>", 1)
+
+        from_string.assert_not_called()
+        from_file.assert_called_once_with(
+            [ANY, ANY],
+            False,
             configuration=ANY,
             options=ANY,
         )
+        write_bytes.assert_called_once_with(Path(dir_name, dataset_name, "tables_pdfs/tables_1-2.pdf"), b"%PDF")
+        html_files = from_file.call_args.args[0]
+        assert [Path(html_file).name for html_file in html_files] == ["tables_1.html", "tables_2.html"]
+        assert exporter.pending_pdf_batches == {}
+
+    def test_incomplete_batch_exported_on_close(self, mocker: MockerFixture):
+        mocker.patch("pdfkit.from_file")
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+
+        exporter: TableExporter = TableExporter(
+            [],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            pdf_batch_size=3,
+        )
+        patcher = mocker.patch.object(exporter, "_export_pdf_batch")
+
+        exporter._export_pdf("<table>4</table>", 4)
+        exporter.close()
+
+        patcher.assert_called_once_with({4: "<table>4</table>"})
 
 
 class TestExportPng:
     def test_simple(self, mocker: MockerFixture):
         mocker.patch("pathlib.Path.mkdir")
-        mocker.patch("selenium.webdriver.Firefox")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+        firefox.return_value.find_element_by_tag_name.return_value.screenshot_as_png = b""
         mocker.patch("selenium.webdriver.firefox.webdriver.WebDriver.get")
         mocker.patch("PIL.Image.open", return_value=Image.new("RGB", (0, 0)))
-        patcher = mocker.patch("arttabgen.table_exporter.Image.Image.save")
+        patcher = mocker.patch("PIL.Image.Image.save")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
 
         mocker.patch("json.loads")
         mocker.patch("pathlib.Path.read_text")
@@ -311,20 +524,21 @@ class TestExportPng:
             {},
         )
 
-        exporter._export_png("", 1, 1)
+        exporter._export_images("", [], TransformerValueCombination([], {}), 1, ["png"], 1)
 
-        patcher.assert_called_once_with(
-            Path("foo/bar/my_dataset/tables_png/tables_1.png"),
-        )
+        patcher.assert_called_once_with(ANY, format="PNG")
+        write_bytes.assert_called_once_with(Path("foo/bar/my_dataset/tables_png/tables_1.png"), b"")
 
 
 class TestExportJpg:
     def test_simple(self, mocker: MockerFixture):
         mocker.patch("pathlib.Path.mkdir")
-        mocker.patch("selenium.webdriver.Firefox")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+        firefox.return_value.find_element_by_tag_name.return_value.screenshot_as_png = b""
         mocker.patch("selenium.webdriver.firefox.webdriver.WebDriver.get")
         mocker.patch("PIL.Image.open", return_value=Image.new("RGB", (0, 0)))
-        patcher = mocker.patch("arttabgen.table_exporter.Image.Image.save")
+        patcher = mocker.patch("PIL.Image.Image.save")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
 
         mocker.patch("json.loads")
         mocker.patch("pathlib.Path.read_text")
@@ -349,18 +563,17 @@ class TestExportJpg:
             {},
         )
 
-        exporter._export_jpg("", 1, 1)
+        exporter._export_images("", [], TransformerValueCombination([], {}), 1, ["jpg"], 1)
 
-        patcher.assert_called_once_with(
-            Path("foo/bar/my_dataset/tables_jpg/tables_1.jpg"), quality=100
-        )
+        patcher.assert_called_once_with(ANY, format="JPEG", quality=100)
+        write_bytes.assert_called_once_with(Path("foo/bar/my_dataset/tables_jpg/tables_1.jpg"), b"")
 
 
 class TestExportHtml:
     def test_simple(self, mocker: MockerFixture):
         mocker.patch("pathlib.Path.mkdir")
         mocker.patch("selenium.webdriver.Firefox")
-        patcher = mocker.patch("pathlib.Path.write_text")
+        patcher = mocker.patch.object(Path, "write_bytes", autospec=True)
 
         mocker.patch("json.loads")
         mocker.patch("pathlib.Path.read_text")
@@ -385,9 +598,734 @@ class TestExportHtml:
             {},
         )
 
-        exporter._export_html("", 1)
+        exporter._export_html("<table></table>", 1)
 
         patcher.assert_called_once_with(
-            "",
-            encoding="utf-8",
+            Path("foo/bar/my_dataset/tables_html/tables_1.html"),
+            b"<table></table>",
+        )
+
+    def test_shared_stylesheet_written_once(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        mocker.patch("selenium.webdriver.Firefox")
+        patcher = mocker.patch.object(Path, "write_bytes", autospec=True)
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["html"],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            False,
+            0.0,
+            {},
+            html_stylesheet_mode="shared",
+        )
+        mocker.patch.object(exporter, "_export_csv")
+
+        for _ in range(2):
+            exporter.export_table(
+                [["a"]],
+                [["1"]],
+                TransformerValueCombination(["td {color: red;}"], {}),
+                1,
+            )
+
+        written_files = {call.args[0]: call.args[1] for call in patcher.call_args_list}
+        stylesheets = [path for path in written_files if path.suffix == ".css"]
+
+        assert len(patcher.call_args_list) == 3
+        assert len(stylesheets) == 1
+        assert stylesheets[0].parent == Path("foo/bar/my_dataset/tables_html/styles")
+        assert written_files[stylesheets[0]] == b"td {color: red;}"
+        assert f'<link rel="stylesheet" href="styles/{stylesheets[0].name}">' in written_files[
+            Path("foo/bar/my_dataset/tables_html/tables_2.html")
+        ].decode("utf-8")
+
+
+class TestExportImages:
+    def test_one_render_for_jpg_and_png(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+        firefox.return_value.find_element_by_tag_name.return_value.screenshot_as_png = b""
+        mocker.patch("PIL.Image.open", return_value=Image.new("RGB", (0, 0)))
+        patcher = mocker.patch("PIL.Image.Image.save")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+        )
+
+        exporter._export_images("", [], TransformerValueCombination([], {}), 1, ["jpg", "png"], 1)
+
+        firefox.return_value.get.assert_called_once()
+        assert patcher.call_args_list == [
+            mocker.call(ANY, format="JPEG", quality=100),
+            mocker.call(ANY, format="PNG"),
+        ]
+        assert write_bytes.call_args_list == [
+            mocker.call(Path("foo/bar/my_dataset/tables_jpg/tables_1.jpg"), b""),
+            mocker.call(Path("foo/bar/my_dataset/tables_png/tables_1.png"), b""),
+        ]
+
+    def test_pillow_backend_without_browser(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+        patcher = mocker.patch("PIL.Image.Image.save")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            image_backend="pillow",
+        )
+
+        exporter._export_images(
+            "", [["foo", "1", "mm"]], TransformerValueCombination([], {}), 1, ["png"], 1
+        )
+
+        firefox.assert_not_called()
+        patcher.assert_called_once_with(ANY, format="PNG")
+        write_bytes.assert_called_once_with(Path("foo/bar/my_dataset/tables_png/tables_1.png"), b"")
+
+    def test_manipulation_independent_of_export_order(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        mocker.patch("pathlib.Path.write_bytes")
+        mocker.patch("arttabgen.table_renderer.render_table")
+        mocker.patch("PIL.Image.Image.save")
+        mocker.patch.dict(
+            "arttabgen.transformers.image_manipulator.IMAGE_MANIPULATORS_BY_MODE",
+            {4: ["blur", "noise"]},
         )
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+
+        def export_in_order(table_nums):
+            manipulated_tables = []
+
+            def blur(image):
+                manipulated_tables.append(("blur", table_num))
+                return image
+
+            def noise(image, rng):
+                manipulated_tables.append(("noise", table_num, rng.random()))
+                return image
+
+            exporter: TableExporter = TableExporter(
+                [],
+                Path("foo/bar/"),
+                "my_dataset",
+                ProgressPrinter(0, 0, 0),
+                100,
+                Path(""),
+                Path(""),
+                True,
+                0.5,
+                {"blur": blur, "noise": noise},
+                image_backend="pillow",
+                seed=3,
+            )
+
+            for table_num in table_nums:
+                exporter._export_images("", [], TransformerValueCombination([], {}), table_num, ["png"], 4)
+
+            return sorted(manipulated_tables, key=lambda manipulation: manipulation[1])
+
+        manipulated_tables = export_in_order(range(1, 21))
+
+        assert manipulated_tables == export_in_order(reversed(range(1, 21)))
+        assert {manipulation[0] for manipulation in manipulated_tables} == {"blur", "noise"}
+
+
+class TestCaptureImage:
+    def test_screenshot_stays_in_memory(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+        screenshot = BytesIO()
+        Image.new("RGBA", (3, 2), (255, 0, 0, 255)).save(screenshot, format="png")
+        firefox.return_value.find_element_by_tag_name.return_value.screenshot_as_png = screenshot.getvalue()
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+        )
+
+        image = exporter._capture_image("")
+
+        firefox.return_value.find_element_by_tag_name.return_value.screenshot.assert_not_called()
+        assert image.mode == "RGB"
+        assert image.size == (3, 2)
+        assert image.getpixel((0, 0)) == (255, 0, 0)
+
+
+class TestCaptureImageAndPdf:
+    def test_print_and_screenshot_share_render(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+        firefox.return_value.command_executor._commands = {}
+        firefox.return_value.execute.return_value = {"value": base64.b64encode(b"%PDF").decode()}
+        screenshot = BytesIO()
+        Image.new("RGB", (3, 2)).save(screenshot, format="png")
+        firefox.return_value.find_element_by_tag_name.return_value.screenshot_as_png = screenshot.getvalue()
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            pdf_backend="browser",
+        )
+
+        image, pdf_data = exporter._capture_image_and_pdf("", capture_image=True)
+
+        firefox.return_value.get.assert_called_once()
+        firefox.return_value.execute.assert_called_once_with("printPage", {"background": True})
+        assert firefox.return_value.command_executor._commands["printPage"] == (
+            "POST",
+            "/session/$sessionId/print",
+        )
+        assert pdf_data == b"%PDF"
+        assert image.size == (3, 2)
+
+    def test_browser_pdf_exported_with_images(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        mocker.patch("selenium.webdriver.Firefox")
+        from_string = mocker.patch("pdfkit.from_string")
+        write_bytes = mocker.patch.object(Path, "write_bytes", autospec=True)
+        save = mocker.patch("PIL.Image.Image.save")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["pdf", "png"],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            False,
+            0.0,
+            {},
+            pdf_backend="browser",
+        )
+        capture = mocker.patch.object(
+            exporter,
+            "_capture_image_and_pdf",
+            return_value=(Image.new("RGB", (3, 2)), b"%PDF"),
+        )
+        capture_image = mocker.patch.object(exporter, "_capture_image")
+
+        exporter._export_table_by_output_formats(
+            "", [], TransformerValueCombination([], {}), 1, 1, []
+        )
+
+        capture.assert_called_once_with("", capture_image=True)
+        capture_image.assert_not_called()
+        from_string.assert_not_called()
+        save.assert_called_once_with(ANY, format="PNG")
+        assert write_bytes.call_args_list == [
+            mocker.call(Path("foo/bar/my_dataset/tables_pdfs/tables_1.pdf"), b"%PDF"),
+            mocker.call(Path("foo/bar/my_dataset/tables_png/tables_1.png"), b""),
+        ]
+
+
+class TestCheckoutWebdriver:
+    def test_browsers_started_on_first_use(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["png"],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            number_of_webdrivers=2,
+        )
+
+        firefox.assert_not_called()
+
+        with exporter._checkout_webdriver():
+            pass
+
+        with exporter._checkout_webdriver():
+            pass
+
+        assert firefox.call_count == 2
+
+    def test_failed_start_not_retried(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox", side_effect=OSError)
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["png"],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+        )
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError) as error:
+                exporter._checkout_webdriver()
+
+            assert isinstance(error.value.__cause__, OSError)
+
+        firefox.assert_called_once()
+
+    def test_no_browser_for_html_and_csv(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch.object(Path, "write_bytes", autospec=True)
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["html"],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            False,
+            0.0,
+            {},
+        )
+
+        exporter.export_table([["foo"]], [["foo"]], TransformerValueCombination([], {}), 1)
+        exporter.close()
+
+        firefox.assert_not_called()
+        assert exporter.webdriver_pool is None
+
+
+class TestStartPart:
+    def test_browsers_kept_for_next_part(self, mocker: MockerFixture):
+        mocker.patch("pathlib.Path.mkdir")
+        firefox = mocker.patch("selenium.webdriver.Firefox")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            ["png"],
+            Path("foo/bar/"),
+            "my_dataset",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            output_mode="tar",
+        )
+        exporter.skip_tables(5)
+
+        with exporter._checkout_webdriver():
+            pass
+
+        exporter.start_part(3, {})
+
+        with exporter._checkout_webdriver():
+            pass
+
+        firefox.assert_called_once()
+        firefox.return_value.quit.assert_not_called()
+        assert exporter.output_writer.part_index == 3
+        assert exporter.num_exported_tables == 0
+
+        exporter.close()
+
+        firefox.return_value.quit.assert_called_once()
+
+
+class TestBrowserOutputFormats:
+    def test_simple(self):
+        assert browser_output_formats(["html", "png", "pdf", "jpg"], "browser", "wkhtmltopdf") == ["png", "jpg"]
+        assert browser_output_formats(["html", "png", "pdf"], "pillow", "browser") == ["pdf"]
+        assert browser_output_formats(["html", "png", "pdf"], "pillow", "wkhtmltopdf") == []
+
+
+class TestPendingExports:
+    def test_export_blocks_while_too_many_tables_pending(self, mocker: MockerFixture):
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+        exports_may_finish = threading.Event()
+        mocker.patch(
+            "arttabgen.table_exporter.TableExporter._export_csv",
+            side_effect=lambda *args: exports_may_finish.wait(1),
+        )
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path(""),
+            "",
+            ProgressPrinter(2, 2, 2),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            max_pending_exports=1,
+        )
+        mocker.patch.object(exporter.progress_printer, "print_progress")
+
+        exporter.export_table([], [], TransformerValueCombination([], {}), 1)
+        second_export = threading.Thread(
+            target=exporter.export_table,
+            args=([], [], TransformerValueCombination([], {}), 1),
+        )
+        second_export.start()
+
+        second_export.join(0.1)
+        assert second_export.is_alive()
+        assert exporter.num_exported_tables == 1
+
+        exports_may_finish.set()
+        second_export.join(1)
+        exporter.close()
+
+        assert exporter.num_exported_tables == 2
+
+    def test_failed_export_releases_slot(self, mocker: MockerFixture):
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+        mocker.patch("arttabgen.table_exporter.TableExporter._export_csv")
+        table_to_html = mocker.patch(
+            "arttabgen.html_handling.table_to_html",
+            side_effect=[ValueError, ValueError, ""],
+        )
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path(""),
+            "",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            max_pending_exports=1,
+        )
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                exporter.export_table([], [], TransformerValueCombination([], {}), 1)
+
+        # Blocks forever if the failed exports kept their slots
+        exporter.export_table([], [], TransformerValueCombination([], {}), 1)
+        exporter.close()
+
+        assert table_to_html.call_count == 3
+
+    def test_exports_submitted_before_failure_tracked(self, mocker: MockerFixture):
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+        mocker.patch("arttabgen.table_exporter.TableExporter._export_csv", side_effect=OSError)
+        mocker.patch(
+            "arttabgen.table_exporter.TableExporter._export_table_by_output_formats",
+            side_effect=ValueError,
+        )
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path(""),
+            "",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            max_pending_exports=1,
+        )
+
+        with pytest.raises(ValueError):
+            exporter.export_table([], [], TransformerValueCombination([], {}), 1)
+
+        # The CSV exports were submitted before the failure, their errors are still reported
+        with pytest.raises(OSError):
+            exporter.close()
+
+        assert exporter.num_completed_tables == 0
+
+    def test_close_raises_export_error(self, mocker: MockerFixture):
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+        mocker.patch(
+            "arttabgen.table_exporter.TableExporter._export_csv",
+            side_effect=RuntimeError("export failed"),
+        )
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path(""),
+            "",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+            max_pending_exports=1,
+        )
+
+        # Blocks forever if the failed exports would not release their table
+        exporter.export_table([], [], TransformerValueCombination([], {}), 1)
+        exporter.export_table([], [], TransformerValueCombination([], {}), 1)
+
+        with pytest.raises(RuntimeError, match="export failed"):
+            exporter.close()
+
+
+class TestCompleteTable:
+    def test_out_of_order(self, mocker: MockerFixture):
+        mocker.patch("selenium.webdriver.Firefox")
+        mocker.patch("pathlib.Path.mkdir")
+
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [],
+            Path(""),
+            "",
+            ProgressPrinter(0, 0, 0),
+            100,
+            Path(""),
+            Path(""),
+            True,
+            0.0,
+            {},
+        )
+
+        exporter._complete_table(2)
+        exporter._complete_table(3)
+        assert exporter.num_completed_tables == 0
+
+        exporter._complete_table(1)
+        assert exporter.num_completed_tables == 3
+        assert exporter.completed_tables == set()
+
+
+class TestDiscard:
+    def test_part_not_stored(self, tmp_path: Path, mocker: MockerFixture):
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), TransformerApplicationStrategy.SELECTIVE),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"image_width": 1080, "image_height": 1920},
+        )
+        exporter: TableExporter = TableExporter(
+            [], tmp_path, "my_dataset", ProgressPrinter(0, 0, 0), 100, Path(""), Path(""), True, 0.0, {},
+            output_mode="tar",
+        )
+
+        exporter.export_table([["gt"]], [["table"]], TransformerValueCombination([], {}), 1)
+        exporter.discard()
+
+        assert os.listdir(Path(tmp_path, "my_dataset", "shards")) == []
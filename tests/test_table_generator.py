@@ -2,6 +2,7 @@ import os.path
 from pathlib import Path
 from typing import Set
 
+import pytest
 from pytest_mock import MockerFixture
 
 from arttabgen.config_handler import ConfigHandler
@@ -28,6 +29,27 @@ class TestGenerateTables:
         generator._generate_table_and_gt()
 
 
+class TestTableAt:
+    def test_regenerates_table(self, mocker: MockerFixture):
+        mocker.patch("json.loads")
+        mocker.patch("pathlib.Path.read_text")
+        mocker.patch(
+            "arttabgen.config_handler.config_handler",
+            ConfigHandler(Path(""), None),
+        )
+        mocker.patch(
+            "arttabgen.config_handler.config_handler.config",
+            {"gt_odds_per_mode": {1: 0.5}},
+        )
+        generator = set_up_table_generator()
+        tables = generator.generate_tables_from(0)
+        sequential_tables = [next(tables) for _ in range(3)]
+
+        assert generator.table_at(2) == sequential_tables[2]
+        assert generator.table_at(0) == sequential_tables[0]
+        assert generator.table_at(0) != generator.table_at(1)
+
+
 class TestLoadKeywords:
     def test_simple(self):
         generator = set_up_table_generator()
@@ -35,6 +57,12 @@ class TestLoadKeywords:
 
         assert generator.keywords != ""
 
+    def test_synonym_index(self):
+        generator = set_up_table_generator()
+        generator.keywords = [["Air Gap Thickness", "air gap"], ["Coil Resistance"]]
+
+        assert generator.keyword_synonyms == {"air gap thickness", "air gap", "coil resistance"}
+
 
 class TestLoadUnits:
     def test_simple(self):
@@ -43,6 +71,27 @@ class TestLoadUnits:
 
         assert generator.units != ""
 
+    def test_unit_indexes(self):
+        generator = set_up_table_generator()
+        generator.units = {
+            "Air Gap Thickness": {"base_symbols": ["mm"], "prefixed_symbols": ["cm", "mm"]},
+            "Coil Resistance": {"base_symbols": ["o"], "prefixed_symbols": ["ko"]},
+            "Number Of Poles": {"base_symbols": [], "prefixed_symbols": []},
+        }
+
+        assert generator.unit_symbols["Air Gap Thickness"] == ("cm", "mm", "mm")
+        assert generator.unit_symbol_sets["Coil Resistance"] == {"ko", "o"}
+        assert generator.unit_symbols["Number Of Poles"] == ()
+        assert generator.keywords_by_unit_symbol == {
+            "cm": {"Air Gap Thickness"},
+            "mm": {"Air Gap Thickness"},
+            "o": {"Coil Resistance"},
+            "ko": {"Coil Resistance"},
+        }
+
+        with pytest.raises(TypeError):
+            generator.unit_symbols["Air Gap Thickness"] = ()
+
 
 class TestBuildGtWordList:
     def test_simple(self):
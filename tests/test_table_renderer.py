@@ -0,0 +1,134 @@
+from arttabgen import table_renderer
+from arttabgen.transformers.style_transformer import STYLE_TRANSFORMERS
+from arttabgen.types_.transformer_value_combination import (
+    TransformerValueCombination,
+)
+
+TABLE = [
+    ["Air Gap Thickness", "12", "mm"],
+    ["Coil Resistance", "4", "o"],
+]
+
+
+class TestRenderTable:
+    def test_no_transformers(self):
+        image = table_renderer.render_table(TABLE, TransformerValueCombination([], {}))
+
+        assert image.mode == "RGB"
+        assert image.width > 0
+        assert image.height > 0
+
+    def test_header_adds_row(self):
+        without_header = table_renderer.render_table(
+            TABLE, TransformerValueCombination([], {"has-header": False})
+        )
+        with_header = table_renderer.render_table(
+            TABLE, TransformerValueCombination([], {"has-header": True})
+        )
+
+        assert with_header.width == without_header.width
+        assert with_header.height > without_header.height
+
+    def test_vertical_orientation(self):
+        horizontal = table_renderer.render_table(
+            TABLE, TransformerValueCombination([], {"table-orientation": "horizontal"})
+        )
+        vertical = table_renderer.render_table(
+            TABLE, TransformerValueCombination([], {"table-orientation": "vertical"})
+        )
+
+        assert vertical.height > horizontal.height
+
+    def test_margins(self):
+        image = table_renderer.render_table(TABLE, TransformerValueCombination([], {}))
+        image_with_margin = table_renderer.render_table(
+            TABLE,
+            TransformerValueCombination(
+                [STYLE_TRANSFORMERS["margin-left"](40, "px")], {}
+            ),
+        )
+
+        assert image_with_margin.width == image.width + 40
+        assert image_with_margin.getpixel((20, image.height // 2)) == (255, 255, 255)
+
+    def test_minimum_width(self):
+        image = table_renderer.render_table(
+            TABLE,
+            TransformerValueCombination([STYLE_TRANSFORMERS["width"](900, "px")], {}),
+        )
+
+        assert image.width == 900
+
+    def test_background_color(self):
+        image = table_renderer.render_table(
+            [["", ""]],
+            TransformerValueCombination(
+                [
+                    STYLE_TRANSFORMERS["background-color"]("black", ""),
+                    STYLE_TRANSFORMERS["padding"](20, "px"),
+                ],
+                {},
+            ),
+        )
+
+        assert (0, 0, 0) in {color for _, color in image.getcolors(image.width * image.height)}
+
+
+class TestResolveStyle:
+    def test_declarations(self):
+        style = table_renderer._resolve_style(
+            [
+                STYLE_TRANSFORMERS["font-family"]("Courier", ""),
+                STYLE_TRANSFORMERS["font-size"](20, "px"),
+                STYLE_TRANSFORMERS["font-weight"](700, ""),
+                STYLE_TRANSFORMERS["border-collapse"]("collapse", ""),
+                STYLE_TRANSFORMERS["padding"](10, "px"),
+                STYLE_TRANSFORMERS["letter-spacing"](3, "px"),
+            ]
+        )
+
+        assert style.font_family == "Courier"
+        assert style.font_size == 20
+        assert style.bold
+        assert style.border_collapse == "collapse"
+        assert style.padding == 10
+        assert style.letter_spacing == 3
+
+    def test_alternating_colors(self):
+        style = table_renderer._resolve_style(
+            [
+                STYLE_TRANSFORMERS["color-alternating-row"](["black", "teal"], ""),
+                STYLE_TRANSFORMERS["background-color-alternating-column"](["snow", "azure"], ""),
+            ]
+        )
+
+        assert style.row_colors == {"even": "black", "odd": "teal"}
+        assert style.column_background_colors == {"even": "snow", "odd": "azure"}
+
+    def test_invalid_values_are_ignored(self):
+        style = table_renderer._resolve_style(
+            [
+                STYLE_TRANSFORMERS["text-decoration-line"]("underline", "px"),
+                STYLE_TRANSFORMERS["border-width"](2, ""),
+                STYLE_TRANSFORMERS["color"]("notacolor", ""),
+            ]
+        )
+
+        assert style.text_decoration_lines == ()
+        assert style.border_width == 1
+        assert style.color is None
+
+
+class TestParseLength:
+    def test_units(self):
+        assert table_renderer._parse_length("12px", 16) == 12
+        assert table_renderer._parse_length("3pt", 16) == 4
+        assert table_renderer._parse_length("2em", 10) == 20
+        assert table_renderer._parse_length("50%", 16, 200) == 100
+
+    def test_unitless(self):
+        assert table_renderer._parse_length("0", 16) == 0
+        assert table_renderer._parse_length("5", 16) is None
+
+    def test_invalid(self):
+        assert table_renderer._parse_length("thin", 16) is None
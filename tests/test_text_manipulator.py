@@ -156,7 +156,7 @@ class TestReplaceRandomWordWithSimilarOne:
         mocker.patch("random.randrange", return_value=0)
         mocker.patch("random.choice", return_value="bar")
         mocker.patch(
-            "arttabgen.text_manipulator.WORDS", ["car", "ar", "bar", "ca", "cab", "cat"]
+            "arttabgen.corpora.words", return_value=["car", "ar", "bar", "ca", "cab", "cat"]
         )
 
         returned: str = text_manipulator.replace_random_word_with_similar_one(
@@ -169,7 +169,7 @@ class TestReplaceRandomWordWithSimilarOne:
         mocker.patch("random.randrange", side_effect=[1, 0])
         mocker.patch("random.choice", return_value="bar")
         mocker.patch(
-            "arttabgen.text_manipulator.WORDS", ["car", "ar", "bar", "ca", "cab", "cat"]
+            "arttabgen.corpora.words", return_value=["car", "ar", "bar", "ca", "cab", "cat"]
         )
 
         returned: str = text_manipulator.replace_random_word_with_similar_one(
@@ -177,3 +177,14 @@ class TestReplaceRandomWordWithSimilarOne:
         )
 
         assert returned == "bar 1234 mouse"
+
+    def test_original_word_replaced_by_sixth_closest(self, mocker: MockerFixture):
+        mocker.patch("random.randrange", return_value=0)
+        choice = mocker.patch("random.choice", return_value="bar")
+        mocker.patch(
+            "arttabgen.corpora.words", return_value=["car", "ar", "bar", "ca", "cab", "cat", "tree"]
+        )
+
+        text_manipulator.replace_random_word_with_similar_one("car tree mouse")
+
+        choice.assert_called_once_with(["ar", "bar", "ca", "cab", "cat"])
@@ -0,0 +1,33 @@
+import json
+import random
+from pathlib import Path
+
+from arttabgen import config_handler
+from arttabgen.transformer_sampler import TransformerSampler
+from arttabgen.types_.transformer_application_strategy import (
+    TransformerApplicationStrategy,
+)
+
+CONFIG = json.loads(Path("data", "default_config.json").read_text())
+
+
+class TestSample:
+    def test_same_as_building_transformers(self):
+        sampler = TransformerSampler(CONFIG)
+
+        random.seed(5)
+        combinations = [sampler.sample() for _ in range(20)]
+        random.seed(5)
+        built_combinations = [
+            (
+                config_handler.build_style_transformers(CONFIG, TransformerApplicationStrategy.SELECTIVE),
+                config_handler.build_structure_transformers(CONFIG, TransformerApplicationStrategy.SELECTIVE),
+            )
+            for _ in range(20)
+        ]
+
+        assert [
+                   (combination.style_parameters, combination.structure_parameters)
+                   for combination in combinations
+               ] == built_combinations
+
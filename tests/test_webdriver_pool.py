@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from arttabgen.webdriver_pool import WebDriverPool
+
+
+class TestWebDriverPool:
+    def test_creates_size_webdrivers(self, mocker: MockerFixture):
+        factory = mocker.Mock(side_effect=lambda: mocker.Mock())
+
+        pool = WebDriverPool(3, factory)
+
+        assert factory.call_count == 3
+        assert len(pool.webdrivers) == 3
+
+    def test_failed_creation_quits_created_webdrivers(self, mocker: MockerFixture):
+        created = [mocker.Mock(), mocker.Mock()]
+        factory = mocker.Mock(side_effect=[*created, RuntimeError])
+
+        with pytest.raises(RuntimeError):
+            WebDriverPool(4, factory)
+
+        for driver in created:
+            driver.quit.assert_called_once()
+
+    def test_invalid_size(self, mocker: MockerFixture):
+        with pytest.raises(ValueError):
+            WebDriverPool(0, mocker.Mock())
+
+    def test_checkout_is_exclusive(self, mocker: MockerFixture):
+        pool = WebDriverPool(2, lambda: mocker.Mock())
+
+        with pool.checkout() as first:
+            with pool.checkout() as second:
+                assert first is not second
+
+    def test_checkout_returns_webdriver(self, mocker: MockerFixture):
+        pool = WebDriverPool(1, lambda: mocker.Mock())
+
+        with pool.checkout() as first:
+            pass
+
+        with pool.checkout() as second:
+            assert first is second
+
+    def test_checkout_blocks_until_returned(self, mocker: MockerFixture):
+        pool = WebDriverPool(1, lambda: mocker.Mock())
+        checked_out = threading.Event()
+
+        def checkout_in_thread():
+            with pool.checkout():
+                checked_out.set()
+
+        with pool.checkout():
+            thread = threading.Thread(target=checkout_in_thread)
+            thread.start()
+            assert not checked_out.wait(0.1)
+
+        thread.join(1)
+        assert checked_out.is_set()
+
+    def test_quit(self, mocker: MockerFixture):
+        pool = WebDriverPool(2, lambda: mocker.Mock())
+
+        pool.quit()
+
+        for driver in pool.webdrivers:
+            driver.quit.assert_called_once()
@@ -0,0 +1,23 @@
+from functools import partial
+
+import editdistance
+import pytest
+
+from arttabgen.word_index import WordIndex
+
+WORDS = ["house", "mouse", "moose", "horse", "hose", "use", "mouses", "blouse", "Über", "uber", "a-b", "tree"]
+
+
+class TestNearest:
+    @pytest.mark.parametrize("word", ["mouse", "ouse", "hoarse", "über", "ab", "", "treehouse"])
+    @pytest.mark.parametrize("number_of_words", [1, 5, 20])
+    def test_same_as_sorting_by_distance(self, word: str, number_of_words: int):
+        assert WordIndex(WORDS).nearest(word, number_of_words) == sorted(
+            WORDS, key=partial(editdistance.eval, b=word)
+        )[:number_of_words]
+
+    def test_ties_in_order_of_words(self):
+        assert WordIndex(["cat", "bar", "car", "ca"]).nearest("car", 3) == ["car", "cat", "bar"]
+
+    def test_no_words(self):
+        assert WordIndex([]).nearest("car", 3) == []